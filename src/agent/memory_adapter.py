@@ -185,6 +185,8 @@ class DualMemoryAdapter:
                 })
                 # Update the chat_history property
                 self._messages.append(HumanMessage(content=message))
+                # Show the final state even if the rate limit skipped this redraw
+                self.dual_memory.flush_ui()
         except Exception as e:
             print(f"Error adding user message: {str(e)}")
         
@@ -199,6 +201,8 @@ class DualMemoryAdapter:
                 })
                 # Update the chat_history property
                 self._messages.append(AIMessage(content=message))
+                # Show the final state even if the rate limit skipped this redraw
+                self.dual_memory.flush_ui()
         except Exception as e:
             print(f"Error adding AI message: {str(e)}")
     
@@ -41,6 +41,7 @@ from src.agent.memory import LaravelAgentMemory
 from src.agent.knowledge_base import LaravelKnowledgeBase
 from src.utils.config import config
 from src.knowledge_base.filament.plugins_and_extensions import (
+    render_plugin_recommendation,
     search_filament_plugins,
     should_search_plugins
 )
@@ -512,27 +513,15 @@ def handle_filament_feature_request(agent_state, query):
         )
         
         # Format the response with plugin recommendations
-        response = [
-            f"## Recommended Plugins for: {plugin_results['feature_description']}\n",
-            "Before implementing a custom solution, consider these existing plugins:\n"
-        ]
+        response = [f"## Recommended Plugins for: {plugin_results['feature_description']}\n"]
+        if plugin_results["recommendations"]:
+            response.append("Before implementing a custom solution, consider these existing plugins:\n")
+        else:
+            response.append("No existing plugins match these requirements.\n")
         
         # Add plugin recommendations
         for i, plugin in enumerate(plugin_results["recommendations"], 1):
-            response.append(f"### {i}. {plugin['name']} (Score: {plugin['score']}/100)")
-            response.append(f"- **Author:** {plugin['author']}")
-            response.append(f"- **GitHub:** {plugin['github_url']} ({plugin['stars']} stars)")
-            response.append(f"- **Packagist:** {plugin['packagist_url']} ({plugin['downloads']} downloads)")
-            response.append(f"- **Compatibility:** Laravel {plugin['compatibility']['laravel']}, " 
-                           f"PHP {plugin['compatibility']['php']}, Filament {plugin['compatibility']['filament']}")
-            response.append(f"- **Last Updated:** {plugin['last_updated']}")
-            
-            response.append("- **Key Features:**")
-            for feature in plugin['features']:
-                response.append(f"  - {feature}")
-            
-            response.append("- **Implementation Example:**")
-            response.append(f"```php\n{plugin['code_example']}\n```\n")
+            response.append(render_plugin_recommendation(i, plugin))
         
         # Add custom implementation option
         custom = plugin_results["custom_implementation"]
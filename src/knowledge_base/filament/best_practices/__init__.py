@@ -0,0 +1,7 @@
+"""
+Sections of the FilamentPHP testing and best practices knowledge base
+
+Each submodule holds one section and is imported on demand by
+knowledge_base.filament.testing_and_best_practices, which remains the
+module to import.
+"""
@@ -0,0 +1,76 @@
+"""
+FilamentPHP Authentication Testing Knowledge
+
+One section of the testing and best practices knowledge base, imported on
+first access to testing_and_best_practices.AUTHENTICATION_TESTING.
+"""
+
+# Authentication Testing
+AUTHENTICATION_TESTING = {
+    "login": {
+        "description": "Testing the login process",
+        "examples": [
+            """
+            use App\\Models\\User;
+            use function Pest\\Laravel\\post;
+            
+            it('can login to admin panel', function () {
+                $user = User::factory()->create();
+                
+                $response = post(route('filament.auth.login'), [
+                    'email' => $user->email,
+                    'password' => 'password',
+                ]);
+                
+                $response->assertRedirect(route('filament.pages.dashboard'));
+                $this->assertAuthenticated();
+            });
+            
+            it('validates incorrect credentials', function () {
+                User::factory()->create(['email' => 'correct@example.com']);
+                
+                $response = post(route('filament.auth.login'), [
+                    'email' => 'correct@example.com',
+                    'password' => 'wrong-password',
+                ]);
+                
+                $response->assertSessionHasErrors(['email']);
+                $this->assertGuest();
+            });
+            """
+        ]
+    },
+    "authorization": {
+        "description": "Testing authorization and permissions",
+        "examples": [
+            """
+            use App\\Filament\\Resources\\UserResource;
+            use App\\Models\\User;
+            use Spatie\\Permission\\Models\\Role;
+            use Spatie\\Permission\\Models\\Permission;
+            
+            it('enforces resource permissions', function () {
+                // Set up permissions
+                $role = Role::create(['name' => 'editor']);
+                $permission = Permission::create(['name' => 'view users']);
+                $role->givePermissionTo($permission);
+                
+                // User without permission
+                $regularUser = User::factory()->create();
+                
+                // User with permission
+                $editorUser = User::factory()->create();
+                $editorUser->assignRole('editor');
+                
+                // Test user without permission
+                $this->actingAs($regularUser);
+                $this->get(UserResource::getUrl('index'))->assertForbidden();
+                
+                // Test user with permission
+                $this->actingAs($editorUser);
+                $this->get(UserResource::getUrl('index'))->assertSuccessful();
+            });
+            """
+        ]
+    }
+}
@@ -0,0 +1,103 @@
+"""
+FilamentPHP Custom Component Testing Knowledge
+
+One section of the testing and best practices knowledge base, imported on
+first access to testing_and_best_practices.TESTING_CUSTOM_COMPONENTS.
+"""
+
+# Testing Custom Components
+TESTING_CUSTOM_COMPONENTS = {
+    "widgets": {
+        "description": "Testing Filament dashboard widgets",
+        "examples": [
+            """
+            use App\\Filament\\Widgets\\StatsOverview;
+            use App\\Models\\Order;
+            use App\\Models\\User;
+            
+            it('shows correct statistics', function () {
+                $this->actingAs(User::factory()->create(['is_admin' => true]));
+                
+                // Create test data
+                User::factory()->count(10)->create();
+                Order::factory()->count(5)->create(['status' => 'completed']);
+                Order::factory()->count(3)->create(['status' => 'processing']);
+                
+                Livewire::test(StatsOverview::class)
+                    ->assertSee('10 Users')
+                    ->assertSee('5 Completed Orders')
+                    ->assertSee('3 Processing Orders');
+            });
+            """
+        ]
+    },
+    "forms": {
+        "description": "Testing custom Filament forms",
+        "examples": [
+            """
+            use App\\Filament\\Pages\\Settings;
+            use App\\Models\\User;
+            
+            it('can save settings', function () {
+                $this->actingAs(User::factory()->create(['is_admin' => true]));
+                
+                Livewire::test(Settings::class)
+                    ->fillForm([
+                        'site_name' => 'My Test Site',
+                        'site_description' => 'This is a test site',
+                        'maintenance_mode' => true,
+                    ])
+                    ->call('save')
+                    ->assertHasNoFormErrors();
+                
+                // Check settings were saved
+                $this->assertEquals('My Test Site', setting('site_name'));
+                $this->assertEquals('This is a test site', setting('site_description'));
+                $this->assertTrue((bool) setting('maintenance_mode'));
+            });
+            """
+        ]
+    },
+    "actions": {
+        "description": "Testing custom actions and modals",
+        "examples": [
+            """
+            use App\\Filament\\Resources\\OrderResource\\Pages\\ListOrders;
+            use App\\Models\\Order;
+            use App\\Models\\User;
+            
+            it('can process order action', function () {
+                $this->actingAs(User::factory()->create(['is_admin' => true]));
+                
+                $order = Order::factory()->create(['status' => 'pending']);
+                
+                Livewire::test(ListOrders::class)
+                    ->callTableAction('process', $order)
+                    ->assertHasNoActionErrors();
+                
+                $this->assertDatabaseHas('orders', [
+                    'id' => $order->id,
+                    'status' => 'processing',
+                ]);
+            });
+            
+            it('can open and submit modal action', function () {
+                $this->actingAs(User::factory()->create(['is_admin' => true]));
+                
+                $order = Order::factory()->create(['status' => 'pending']);
+                
+                Livewire::test(ListOrders::class)
+                    ->callTableAction('add_note', $order, data: [
+                        'note' => 'Test note for this order',
+                    ])
+                    ->assertHasNoActionErrors();
+                
+                $this->assertDatabaseHas('order_notes', [
+                    'order_id' => $order->id,
+                    'content' => 'Test note for this order',
+                ]);
+            });
+            """
+        ]
+    }
+}
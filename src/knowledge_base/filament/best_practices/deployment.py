@@ -0,0 +1,110 @@
+"""
+FilamentPHP Deployment Best Practices
+
+One section of the testing and best practices knowledge base, imported on
+first access to testing_and_best_practices.DEPLOYMENT_BEST_PRACTICES.
+"""
+
+# Deployment Best Practices
+DEPLOYMENT_BEST_PRACTICES = {
+    "preparation": {
+        "description": "Preparing FilamentPHP applications for deployment",
+        "best_practices": [
+            "Run php artisan filament:upgrade to ensure compatibility",
+            "Run php artisan optimize to cache configuration and routes",
+            "Ensure proper file permissions on storage and cache directories",
+            "Verify proper environment configuration (.env file)",
+            "Run database migrations in production with --force flag",
+            "Consider using a deployment tool like Laravel Deployer or Envoyer",
+            "Implement a CI/CD pipeline for automated testing before deployment",
+            "Create a detailed deployment checklist specific to your application"
+        ]
+    },
+    "production_settings": {
+        "description": "Configuring FilamentPHP for production environment",
+        "best_practices": [
+            "Set APP_DEBUG=false to prevent exposing sensitive information",
+            "Implement proper error logging (consider services like Sentry or Flare)",
+            "Configure HTTPS for all traffic",
+            "Implement proper user authentication and password policies",
+            "Set up proper queue workers for background processing",
+            "Configure database connection pooling",
+            "Implement rate limiting for form submissions",
+            "Set up proper backup strategies"
+        ],
+        "examples": [
+            """
+            // Production config in AppServiceProvider
+            public function boot()
+            {
+                if ($this->app->environment('production')) {
+                    URL::forceScheme('https');
+                    
+                    // Configure Filament for production
+                    Filament::registerRenderHook(
+                        'head.end',
+                        fn (): string => '<meta name="robots" content="noindex,nofollow">'
+                    );
+                    
+                    // Add rate limiting to panel
+                    Filament::middleware([
+                        'throttle:filament',
+                    ]);
+                }
+            }
+            
+            // .env settings
+            APP_ENV=production
+            APP_DEBUG=false
+            APP_URL=https://admin.yoursite.com
+            
+            # Queue configuration
+            QUEUE_CONNECTION=redis
+            
+            # Mail configuration
+            MAIL_MAILER=ses
+            """
+        ]
+    },
+    "optimization": {
+        "description": "Optimizing FilamentPHP for production environment",
+        "best_practices": [
+            "Precompile assets with npm run build",
+            "Configure asset versioning for better caching",
+            "Set up a CDN for static assets",
+            "Implement proper Redis caching in production",
+            "Optimize database indexes based on production query patterns",
+            "Configure opcache for PHP performance",
+            "Consider implementing read replicas for database scaling",
+            "Use a load balancer if deploying multiple instances"
+        ],
+        "examples": [
+            """
+            // Cache configuration in config/cache.php
+            'redis' => [
+                'client' => env('REDIS_CLIENT', 'phpredis'),
+                'options' => [
+                    'cluster' => env('REDIS_CLUSTER', 'redis'),
+                    'prefix' => env('REDIS_PREFIX', 'filament_'),
+                ],
+                'default' => [
+                    'url' => env('REDIS_URL'),
+                    'host' => env('REDIS_HOST', '127.0.0.1'),
+                    'password' => env('REDIS_PASSWORD'),
+                    'port' => env('REDIS_PORT', '6379'),
+                    'database' => env('REDIS_CACHE_DB', '1'),
+                ],
+            ],
+            
+            // Opcache settings in php.ini
+            opcache.enable=1
+            opcache.memory_consumption=256
+            opcache.interned_strings_buffer=16
+            opcache.max_accelerated_files=10000
+            opcache.validate_timestamps=0
+            opcache.save_comments=1
+            opcache.fast_shutdown=1
+            """
+        ]
+    },
+}
@@ -0,0 +1,145 @@
+"""
+FilamentPHP Performance Best Practices
+
+One section of the testing and best practices knowledge base, imported on
+first access to testing_and_best_practices.PERFORMANCE_BEST_PRACTICES.
+"""
+
+# Performance Best Practices
+PERFORMANCE_BEST_PRACTICES = {
+    "queries_optimization": {
+        "description": "Optimizing database queries in FilamentPHP",
+        "best_practices": [
+            "Use eager loading to avoid N+1 queries",
+            "Add strategic database indexes for frequently queried columns",
+            "Use withCount() for relationship counts instead of separate queries",
+            "Implement caching strategies for expensive or repeated queries",
+            "Use searchable() with callback for optimized search queries",
+            "Implement appropriate select() clauses to limit the columns being fetched"
+        ],
+        "examples": [
+            """
+            // Eager loading in a resource
+            public static function getRelations(): array
+            {
+                return [
+                    RelationManagers\\OrdersRelationManager::class,
+                    RelationManagers\\CommentsRelationManager::class,
+                ];
+            }
+            
+            // Optimized table query
+            protected function getTableQuery(): Builder
+            {
+                return parent::getTableQuery()
+                    ->withCount(['orders', 'comments'])
+                    ->with(['country', 'role']);
+            }
+            
+            // Optimized searchable columns
+            public static function getGloballySearchableAttributes(): array
+            {
+                return ['name', 'email', 'country.name'];
+            }
+            
+            // Custom search query
+            public $searchQuery = '';
+            
+            protected function getTableQuery(): Builder
+            {
+                return User::query()
+                    ->when($this->searchQuery, function ($query, $search) {
+                        $query->where('name', 'like', "%{$search}%")
+                              ->orWhere('email', 'like', "%{$search}%");
+                    });
+            }
+            """
+        ]
+    },
+    "caching_strategies": {
+        "description": "Implementing caching in FilamentPHP applications",
+        "best_practices": [
+            "Cache expensive widget data with appropriate TTL",
+            "Use Laravel's cache system for dashboard statistics",
+            "Implement model caching for frequently accessed data",
+            "Clear relevant caches in Filament lifecycle hooks",
+            "Consider implementing a read/write-through cache pattern",
+            "Use cache tags to group related cached items"
+        ],
+        "examples": [
+            """
+            // Caching widget data
+            protected function getData(): array
+            {
+                return Cache::remember('stats-widget-data', now()->addMinutes(15), function () {
+                    return [
+                        'users_count' => User::count(),
+                        'orders_count' => Order::count(),
+                        'revenue' => Order::where('status', 'completed')->sum('total'),
+                    ];
+                });
+            }
+            
+            // Clear cache in a resource lifecycle hook
+            protected static function afterSave(Model $record, array $data): void
+            {
+                Cache::forget('stats-widget-data');
+                Cache::tags(['user-data'])->flush();
+            }
+            
+            // Cache tags in service class
+            public function getUserData(User $user)
+            {
+                return Cache::tags(['user-data', "user-{$user->id}"])->remember(
+                    "user-{$user->id}-dashboard", 
+                    now()->addHour(), 
+                    fn () => $this->computeUserData($user)
+                );
+            }
+            """
+        ]
+    },
+    "ui_optimization": {
+        "description": "Optimizing UI performance in FilamentPHP",
+        "best_practices": [
+            "Use lazy loading for tables with many records",
+            "Add pagination to all tables and relation managers",
+            "Implement debouncing for search inputs",
+            "Use deferLoading option for secondary widgets",
+            "Minimize the use of heavy components in list views",
+            "Optimize image delivery for avatar and image fields"
+        ],
+        "examples": [
+            """
+            // Lazy loading a table
+            protected function getTableRecordsPerPageSelectOptions(): array
+            {
+                return [10, 25, 50, 100];
+            }
+            
+            // Defer loading for a widget
+            protected static function getOptions(): array
+            {
+                return [
+                    'deferLoading' => true,
+                    'loadingIndicator' => true,
+                ];
+            }
+            
+            // Optimized image field
+            ->imageColumn('avatar')
+                ->disk('public')
+                ->conversion('thumbnail')
+                ->defaultImageUrl(url('/images/default-avatar.png'))
+                ->square()
+                ->extraImgAttributes(['loading' => 'lazy']),
+                
+            // Debounced search
+            protected function getTableSearchDebounce(): ?string
+            {
+                return '500ms';
+            }
+            """
+        ]
+    }
+}
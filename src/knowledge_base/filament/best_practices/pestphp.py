@@ -0,0 +1,46 @@
+"""
+FilamentPHP PestPHP Integration Knowledge
+
+One section of the testing and best practices knowledge base, imported on
+first access to testing_and_best_practices.PESTPHP_INTEGRATION.
+"""
+
+# PestPHP Integration
+PESTPHP_INTEGRATION = {
+    "overview": """
+    PestPHP provides an elegant, expressive syntax for testing PHP applications,
+    making it particularly well-suited for testing FilamentPHP. Integrating PestPHP
+    with FilamentPHP involves setting up the necessary packages and creating
+    specialized test cases for panel components, resources, and other features.
+    """,
+    
+    "installation": """
+    # Install Pest PHP and required plugins
+    composer require pestphp/pest --dev
+    composer require pestphp/pest-plugin-laravel --dev
+    composer require pestphp/pest-plugin-livewire --dev
+    
+    # Initialize Pest
+    php artisan pest:install
+    """,
+    
+    "configuration": """
+    // Pest.php
+    use Illuminate\\Foundation\\Testing\\LazilyRefreshDatabase;
+    use Tests\\TestCase;
+    
+    uses(TestCase::class, LazilyRefreshDatabase::class)
+        ->in('Feature');
+    
+    // Create a Filament test case helper
+    use Filament\\Facades\\Filament;
+    use Filament\\Pages\\Page;
+    use Illuminate\\Testing\\TestResponse;
+    use Livewire\\Livewire;
+    
+    function filamentTest($componentClass, $parameters = [])
+    {
+        return test()->livewireTest($componentClass, $parameters);
+    }
+    """
+}
@@ -0,0 +1,262 @@
+"""
+FilamentPHP Resource Testing Knowledge
+
+One section of the testing and best practices knowledge base, imported on
+first access to testing_and_best_practices.TESTING_RESOURCES.
+"""
+
+import textwrap
+
+# Use statements shared by the examples that test a UserResource page
+_USER_RESOURCE_IMPORT = "use App\\Filament\\Resources\\UserResource;\n"
+_USER_MODEL_IMPORT = "use App\\Models\\User;\n"
+
+
+def _user_page_example(page, tests, import_resource=True):
+    """Prefix the tests of a UserResource page with their shared use statements"""
+    header = _USER_RESOURCE_IMPORT if import_resource else ""
+    header += f"use App\\Filament\\Resources\\UserResource\\Pages\\{page};\n"
+    return header + _USER_MODEL_IMPORT + "\n" + textwrap.dedent(tests).strip("\n")
+
+
+# Testing Resources
+TESTING_RESOURCES = {
+    "list_pages": {
+        "description": "Testing resource list (index) pages",
+        "examples": [
+            _user_page_example("ListUsers", """
+            it('can render list page', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $response = $this->get(UserResource::getUrl('index'));
+                
+                $response->assertSuccessful();
+            });
+            
+            it('can list users', function () {
+                $users = User::factory()->count(10)->create();
+                
+                $this->actingAs(User::factory()->create());
+                
+                Livewire::test(ListUsers::class)
+                    ->assertCanSeeTableRecords($users);
+            });
+            
+            it('can sort users', function () {
+                $users = User::factory()->count(10)->create();
+                
+                $this->actingAs(User::factory()->create());
+                
+                Livewire::test(ListUsers::class)
+                    ->assertCanSeeTableRecords($users)
+                    ->sortTable('name')
+                    ->assertCanSeeTableRecords($users->sortBy('name')->pluck('id')->toArray(), inOrder: true);
+            });
+            """)
+        ]
+    },
+    "create_pages": {
+        "description": "Testing resource creation pages and functionality",
+        "examples": [
+            _user_page_example("CreateUser", """
+            it('can render create page', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $response = $this->get(UserResource::getUrl('create'));
+                
+                $response->assertSuccessful();
+            });
+            
+            it('can create user', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $userData = [
+                    'name' => 'Test User',
+                    'email' => 'test@example.com',
+                    'password' => 'password',
+                    'password_confirmation' => 'password',
+                ];
+                
+                Livewire::test(CreateUser::class)
+                    ->fillForm($userData)
+                    ->call('create')
+                    ->assertHasNoFormErrors();
+                
+                $this->assertDatabaseHas('users', [
+                    'name' => $userData['name'],
+                    'email' => $userData['email'],
+                ]);
+            });
+            
+            it('validates input', function () {
+                $this->actingAs(User::factory()->create());
+                
+                Livewire::test(CreateUser::class)
+                    ->fillForm([
+                        'name' => '',
+                        'email' => 'not-an-email',
+                    ])
+                    ->call('create')
+                    ->assertHasFormErrors(['name', 'email']);
+            });
+            """)
+        ]
+    },
+    "edit_pages": {
+        "description": "Testing resource editing pages and functionality",
+        "examples": [
+            _user_page_example("EditUser", """
+            it('can render edit page', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $user = User::factory()->create();
+                
+                $response = $this->get(UserResource::getUrl('edit', ['record' => $user]));
+                
+                $response->assertSuccessful();
+            });
+            
+            it('can retrieve form data', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $user = User::factory()->create();
+                
+                Livewire::test(EditUser::class, ['record' => $user->getKey()])
+                    ->assertFormSet([
+                        'name' => $user->name,
+                        'email' => $user->email,
+                    ]);
+            });
+            
+            it('can update user', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $user = User::factory()->create();
+                $newData = [
+                    'name' => 'Updated Name',
+                    'email' => 'updated@example.com',
+                ];
+                
+                Livewire::test(EditUser::class, ['record' => $user->getKey()])
+                    ->fillForm($newData)
+                    ->call('save')
+                    ->assertHasNoFormErrors();
+                
+                $this->assertDatabaseHas('users', [
+                    'id' => $user->id,
+                    'name' => $newData['name'],
+                    'email' => $newData['email'],
+                ]);
+            });
+            """)
+        ]
+    },
+    "view_pages": {
+        "description": "Testing resource view pages",
+        "examples": [
+            _user_page_example("ViewUser", """
+            it('can render view page', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $user = User::factory()->create();
+                
+                $response = $this->get(UserResource::getUrl('view', ['record' => $user]));
+                
+                $response->assertSuccessful();
+            });
+            
+            it('displays correct user information', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $user = User::factory()->create();
+                
+                Livewire::test(ViewUser::class, ['record' => $user->getKey()])
+                    ->assertSee($user->name)
+                    ->assertSee($user->email);
+            });
+            """)
+        ]
+    },
+    "delete_actions": {
+        "description": "Testing resource deletion actions",
+        "examples": [
+            _user_page_example("ListUsers", """
+            it('can delete user', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $userToDelete = User::factory()->create();
+                
+                Livewire::test(ListUsers::class)
+                    ->callTableAction('delete', $userToDelete)
+                    ->assertNotified();
+                
+                $this->assertDatabaseMissing('users', [
+                    'id' => $userToDelete->id,
+                ]);
+            });
+            
+            it('can bulk delete users', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $usersToDelete = User::factory()->count(3)->create();
+                
+                Livewire::test(ListUsers::class)
+                    ->callTableBulkAction('delete', $usersToDelete)
+                    ->assertNotified();
+                
+                foreach ($usersToDelete as $user) {
+                    $this->assertDatabaseMissing('users', [
+                        'id' => $user->id,
+                    ]);
+                }
+            });
+            """, import_resource=False)
+        ]
+    },
+    "table_features": {
+        "description": "Testing table filtering, searching, and pagination",
+        "examples": [
+            _user_page_example("ListUsers", """
+            it('can search users', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $userA = User::factory()->create(['name' => 'John Doe']);
+                $userB = User::factory()->create(['name' => 'Jane Smith']);
+                
+                Livewire::test(ListUsers::class)
+                    ->assertCanSeeTableRecords([$userA, $userB])
+                    ->searchTable('John')
+                    ->assertCanSeeTableRecords([$userA])
+                    ->assertCanNotSeeTableRecords([$userB]);
+            });
+            
+            it('can filter users', function () {
+                $this->actingAs(User::factory()->create());
+                
+                $admin = User::factory()->create(['is_admin' => true]);
+                $user = User::factory()->create(['is_admin' => false]);
+                
+                Livewire::test(ListUsers::class)
+                    ->assertCanSeeTableRecords([$admin, $user])
+                    ->filterTable('is_admin', true)
+                    ->assertCanSeeTableRecords([$admin])
+                    ->assertCanNotSeeTableRecords([$user]);
+            });
+            
+            it('can paginate users', function () {
+                $this->actingAs(User::factory()->create());
+                
+                // Creating 25 users (assuming 10 per page)
+                $users = User::factory()->count(25)->create();
+                
+                Livewire::test(ListUsers::class)
+                    ->assertCanSeeTableRecords($users->take(10))
+                    ->assertCanNotSeeTableRecords($users->skip(10)->take(10))
+                    ->goToTablePage(2)
+                    ->assertCanSeeTableRecords($users->skip(10)->take(10))
+                    ->assertCanNotSeeTableRecords($users->take(10));
+            });
+            """, import_resource=False)
+        ]
+    }
+}
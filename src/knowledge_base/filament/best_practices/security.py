@@ -0,0 +1,166 @@
+"""
+FilamentPHP Security Best Practices
+
+One section of the testing and best practices knowledge base, imported on
+first access to testing_and_best_practices.SECURITY_BEST_PRACTICES.
+"""
+
+# Security Best Practices
+SECURITY_BEST_PRACTICES = {
+    "authentication": {
+        "description": "Authentication security in FilamentPHP",
+        "best_practices": [
+            "Implement strong password policies",
+            "Add two-factor authentication for admin users",
+            "Enforce session timeouts for inactive users",
+            "Use SSL encryption for all authentication traffic",
+            "Implement IP-based restrictions for admin panel access",
+            "Use throttling to prevent brute force attacks",
+            "Configure proper CORS policy",
+            "Audit login attempts and suspicious activities"
+        ],
+        "examples": [
+            """
+            // In config/filament.php
+            'auth' => [
+                'guard' => env('FILAMENT_AUTH_GUARD', 'web'),
+                'pages' => [
+                    'login' => \\App\\Filament\\Pages\\Auth\\CustomLogin::class,
+                ],
+                'providers' => [
+                    'users' => [
+                        'driver' => 'eloquent',
+                        'model' => User::class,
+                    ],
+                ],
+                'middleware' => [
+                    'base' => [
+                        HandledErrorMiddleware::class,
+                        DisableBladeIconComponents::class,
+                        DispatchServingFilamentEvent::class,
+                    ],
+                    'auth' => [
+                        Authenticate::class,
+                        'throttle:filament',
+                        '2fa', // Custom 2FA middleware
+                    ],
+                ],
+            ],
+            
+            // Session timeout in config/session.php
+            'lifetime' => env('SESSION_LIFETIME', 120),
+            'expire_on_close' => true,
+            """
+        ]
+    },
+    "authorization": {
+        "description": "Authorization and permissions in FilamentPHP",
+        "best_practices": [
+            "Use role-based access control (RBAC)",
+            "Implement granular permissions for each resource and action",
+            "Use Filament Shield or similar plugin for permission management",
+            "Apply the principle of least privilege for all users",
+            "Regular audit permissions assigned to each role",
+            "Implement proper guards for API access",
+            "Use policies for complex authorization logic",
+            "Document permission requirements for custom features"
+        ],
+        "examples": [
+            """
+            // Implement role-based access control with Shield
+            FilamentShield::configurePermissionIdentifierUsing(
+                fn ($resource) => $resource::getPermissionIdentifier()
+            );
+            
+            // Custom Filament authorization logic
+            protected function getHeaderActions(): array
+            {
+                return [
+                    Actions\\EditAction::make()
+                        ->visible(fn (): bool => auth()->user()->can('update', $this->getRecord())),
+                    Actions\\DeleteAction::make()
+                        ->visible(fn (): bool => auth()->user()->can('delete', $this->getRecord())),
+                ];
+            }
+            
+            // Resource policy
+            public static function canViewAny(): bool
+            {
+                return auth()->user()->hasPermissionTo('view users');
+            }
+            
+            public static function canCreate(): bool
+            {
+                return auth()->user()->hasPermissionTo('create users');
+            }
+            """
+        ]
+    },
+    "data_validation": {
+        "description": "Data validation and sanitization in FilamentPHP",
+        "best_practices": [
+            "Implement thorough form validation",
+            "Sanitize all user inputs, especially rich text content",
+            "Use Laravel's validation rules consistently",
+            "Implement custom validation rules for complex requirements",
+            "Validate file uploads for type, size, and content",
+            "Use policy-based validation for context-aware rules",
+            "Validate data both on client and server sides",
+            "Implement proper error handling for validation failures"
+        ],
+        "examples": [
+            """
+            // Form validation
+            public static function form(Form $form): Form
+            {
+                return $form
+                    ->schema([
+                        TextInput::make('name')
+                            ->required()
+                            ->maxLength(255),
+                        TextInput::make('email')
+                            ->email()
+                            ->required()
+                            ->unique(ignoreRecord: true),
+                        TextInput::make('password')
+                            ->password()
+                            ->dehydrateStateUsing(fn ($state) => Hash::make($state))
+                            ->dehydrated(fn ($state) => filled($state))
+                            ->required(fn (string $context): bool => $context === 'create'),
+                        FileUpload::make('avatar')
+                            ->disk('public')
+                            ->directory('avatars')
+                            ->image()
+                            ->maxSize(1024)
+                            ->imageCropAspectRatio('1:1')
+                            ->imageResizeMode('cover'),
+                        RichEditor::make('bio')
+                            ->maxLength(1000)
+                            ->sanitizeHtml(),
+                    ]);
+            }
+            
+            // Custom validation rule
+            public function rules()
+            {
+                return [
+                    'data.username' => [
+                        'required',
+                        'string',
+                        'max:255',
+                        new UsernameRule(),
+                    ],
+                ];
+            }
+            
+            // Custom sanitizer
+            protected function mutateFormDataBeforeCreate(array $data): array
+            {
+                $data['bio'] = Purify::clean($data['bio']);
+                
+                return $data;
+            }
+            """
+        ]
+    }
+}
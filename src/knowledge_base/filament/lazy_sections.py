@@ -0,0 +1,69 @@
+"""
+Lazy Knowledge Base Sections
+
+Shared plumbing for FilamentPHP knowledge base modules whose large sections
+are built on first access rather than at import time.
+"""
+
+from collections.abc import Mapping
+
+
+class LazySections:
+    """
+    Build a module's lazily loaded globals on demand.
+    
+    Each value is produced by the module's build callable the first time it is
+    requested and stored in the module namespace, so later reads are ordinary
+    global lookups that never reach the module's __getattr__ again.
+    """
+    
+    __slots__ = ("_namespace", "_module_name", "_build", "_names")
+    
+    def __init__(self, namespace, build, names):
+        """
+        Args:
+            namespace (dict): The owning module's globals()
+            build (Callable[[str], Any]): Returns the value of a lazy global by name
+            names (Iterable[str]): Every global name that build can produce
+        """
+        self._namespace = namespace
+        self._module_name = namespace["__name__"]
+        self._build = build
+        self._names = frozenset(names)
+    
+    def get(self, name):
+        """Return a module global by name, building it first if it is a lazy one"""
+        value = self._namespace.get(name)
+        if value is None:
+            value = self._namespace[name] = self._build(name)
+        return value
+    
+    def module_getattr(self, name):
+        """Module-level __getattr__ hook (PEP 562) for the owning module"""
+        if name not in self._names:
+            raise AttributeError(f"module {self._module_name!r} has no attribute {name!r}")
+        return self.get(name)
+
+
+class LazyKnowledge(Mapping):
+    """Read-only knowledge base mapping whose sections are resolved on lookup"""
+    
+    __slots__ = ("_sections", "_globals")
+    
+    def __init__(self, sections, globals_by_key):
+        """
+        Args:
+            sections (LazySections): Resolver of the owning module's globals
+            globals_by_key (dict): Knowledge base key to the global that holds it
+        """
+        self._sections = sections
+        self._globals = globals_by_key
+    
+    def __getitem__(self, key):
+        return self._sections.get(self._globals[key])
+    
+    def __iter__(self):
+        return iter(self._globals)
+    
+    def __len__(self):
+        return len(self._globals)
@@ -5,7 +5,18 @@ This module contains comprehensive knowledge about FilamentPHP plugins and exten
 including popular plugins, their features, integration approaches, and techniques for building custom plugins.
 """
 
-from typing import Dict, List, Any
+import heapq
+import math
+import re
+import sys
+from collections import Counter
+from collections.abc import Mapping
+from functools import lru_cache
+from operator import itemgetter, mul
+from dataclasses import dataclass
+from datetime import date
+from types import MappingProxyType
+from typing import List, Sequence, Tuple
 
 # Overview of FilamentPHP plugin system
 PLUGINS_OVERVIEW = """
@@ -808,6 +819,14 @@ PLUGIN_INTEGRATION = {
     }
 }
 
+# filament/widgets and filament/notifications are both published from the
+# filament monorepo, so they share one copy of its repository metadata
+_FILAMENT_MONOREPO = {
+    "github": "https://github.com/filamentphp/filament",
+    "stars": 4500,
+    "last_updated": "2023-12-20"
+}
+
 # Plugin Discovery and Recommendation System
 PLUGIN_DISCOVERY = {
     "search_methodology": {
@@ -866,7 +885,7 @@ PLUGIN_DISCOVERY = {
                 "weight": 0.15
             }
         ],
-        "scoring_algorithm": "Weighted average of normalized scores for each factor (0-100 scale)"
+        "scoring_algorithm": "TOPSIS closeness coefficient over weighted, normalized scores for each factor (0-100 scale)"
     },
     "recommendation_format": {
         "description": "Structure for plugin recommendations",
@@ -990,12 +1009,10 @@ PLUGIN_DISCOVERY = {
             {
                 "name": "filament/widgets",
                 "description": "Dashboard widgets for FilamentPHP",
-                "github": "https://github.com/filamentphp/filament",
+                **_FILAMENT_MONOREPO,
                 "packagist": "https://packagist.org/packages/filament/widgets",
-                "stars": 4500,
                 "downloads": 900000,
                 "filament_version": "3.x",
-                "last_updated": "2023-12-20",
                 "features": [
                     "Stats overview",
                     "Charts",
@@ -1058,12 +1075,10 @@ PLUGIN_DISCOVERY = {
             {
                 "name": "filament/notifications",
                 "description": "Notifications system for FilamentPHP",
-                "github": "https://github.com/filamentphp/filament",
+                **_FILAMENT_MONOREPO,
                 "packagist": "https://packagist.org/packages/filament/notifications",
-                "stars": 4500,
                 "downloads": 850000,
                 "filament_version": "3.x",
-                "last_updated": "2023-12-20",
                 "features": [
                     "Toast notifications",
                     "Persistent notifications",
@@ -1125,6 +1140,283 @@ PLUGIN_DISCOVERY = {
     }
 }
 
+# Catalog URLs share a handful of prefixes; each URL is kept as a
+# (shared prefix, suffix) pair and rebuilt when a recommendation is rendered
+GITHUB_BASE = "https://github.com/"
+PACKAGIST_BASE = "https://packagist.org/packages/"
+
+# Metric weights for (stars, downloads, recency). Stars and downloads both
+# feed the "Popularity" factor of the evaluation criteria, so they split its
+# weight; recency stands in for "Maintenance".
+_POPULARITY_WEIGHT = PLUGIN_DISCOVERY["evaluation_criteria"]["primary_factors"][0]["weight"]
+_MAINTENANCE_WEIGHT = PLUGIN_DISCOVERY["evaluation_criteria"]["primary_factors"][1]["weight"]
+_METRIC_WEIGHTS = (_POPULARITY_WEIGHT / 2, _POPULARITY_WEIGHT / 2, _MAINTENANCE_WEIGHT)
+# Whether a higher raw value is better; cost-type metrics are inverted
+_METRIC_HIGHER_IS_BETTER = (True, True, True)
+# Recency decays by half for every this many days a plugin lags behind the
+# most recently updated one in the catalog
+_RECENCY_HALF_LIFE_DAYS = 14
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset({
+    "a", "an", "and", "for", "from", "i", "in", "need", "of", "on", "or",
+    "the", "to", "with"
+})
+_MAX_RECOMMENDATIONS = 3
+# Major version numbers in a constraint such as "3.x", "^3.0" or "2.x|3.x";
+# digits right after a dot are minor or patch components and are skipped
+_MAJOR_VERSION_RE = re.compile(r"(?<![\d.])\d+")
+
+
+def _split_url(url, base):
+    """Split url into (base, suffix), or ("", url) if it does not start with base"""
+    if url.startswith(base):
+        return base, url[len(base):]
+    return "", url
+
+
+def _normalize_column(column, higher_is_better=True):
+    """Min-max normalize a metric column to the 0-1 range"""
+    low, high = min(column), max(column)
+    span = (high - low) or 1
+    if higher_is_better:
+        return tuple((value - low) / span for value in column)
+    return tuple((high - value) / span for value in column)
+
+
+def _topsis_closeness(rows, weights):
+    """
+    Rank alternatives with TOPSIS over already normalized metric rows.
+    
+    Each row is weighted, then compared with the ideal (best value per metric)
+    and anti-ideal (worst value per metric) alternatives. Cost-type metrics
+    are expected to be inverted by normalization, so higher is always better.
+    
+    Args:
+        rows (Sequence[Sequence[float]]): One row of normalized metrics per alternative
+        weights (Sequence[float]): Weight of each metric column
+        
+    Returns:
+        Tuple[float, ...]: Closeness coefficient in [0, 1] for each row
+    """
+    weighted = [tuple(map(mul, row, weights)) for row in rows]
+    columns = tuple(zip(*weighted))
+    ideal = tuple(max(column) for column in columns)
+    anti_ideal = tuple(min(column) for column in columns)
+    closeness = []
+    for row in weighted:
+        to_ideal = math.dist(row, ideal)
+        to_anti_ideal = math.dist(row, anti_ideal)
+        total = to_ideal + to_anti_ideal
+        closeness.append(to_anti_ideal / total if total else 1.0)
+    return tuple(closeness)
+
+
+def _major_versions(constraint):
+    """Return the set of major versions a version constraint mentions"""
+    return frozenset(map(int, _MAJOR_VERSION_RE.findall(constraint)))
+
+
+def _tokenize(text):
+    """Lowercase text and split it into a set of searchable keywords"""
+    # Trailing plural "s" is dropped so "export" and "exports" share a keyword
+    return {
+        token[:-1] if len(token) > 3 and token.endswith("s") else token
+        for token in _TOKEN_RE.findall(text.lower())
+        if token not in _STOP_WORDS
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class PluginRepository:
+    """Repository metadata, shared by every catalog plugin published from it"""
+    
+    # (shared prefix, suffix) pair, see GITHUB_BASE
+    github: Tuple[str, str]
+    stars: int
+    last_updated: str
+    
+    @property
+    def github_url(self):
+        return "".join(self.github)
+
+
+@dataclass(frozen=True, slots=True)
+class PluginRecord:
+    """A single entry of the popular plugin catalog"""
+    
+    name: str
+    description: str
+    category: str
+    repo: PluginRepository
+    # (shared prefix, suffix) pair, see PACKAGIST_BASE
+    packagist: Tuple[str, str]
+    downloads: int
+    filament_version: str
+    features: Tuple[str, ...]
+    
+    @classmethod
+    def from_dict(cls, category, plugin, repositories):
+        """
+        Build a record from a popular_plugin_categories entry.
+        
+        Args:
+            category (str): Catalog category the plugin is listed under
+            plugin (dict): The catalog entry
+            repositories (dict): GitHub URL to PluginRepository cache, shared
+                across calls so plugins from one repository reference one record
+        """
+        repo = repositories.get(plugin["github"])
+        if repo is None:
+            repo = repositories[plugin["github"]] = PluginRepository(
+                github=_split_url(plugin["github"], GITHUB_BASE),
+                stars=plugin["stars"],
+                last_updated=sys.intern(plugin["last_updated"])
+            )
+        # Short values repeat across nearly every entry, so they are interned
+        # to share one object per distinct value
+        return cls(
+            name=plugin["name"],
+            description=plugin["description"],
+            category=sys.intern(category),
+            repo=repo,
+            packagist=_split_url(plugin["packagist"], PACKAGIST_BASE),
+            downloads=plugin["downloads"],
+            filament_version=sys.intern(plugin["filament_version"]),
+            features=tuple(sys.intern(feature) for feature in plugin["features"])
+        )
+    
+    @property
+    def packagist_url(self):
+        return "".join(self.packagist)
+    
+    @property
+    def package_name(self):
+        """Composer package name, taken from the Packagist URL since the
+        catalog display name can differ from the published package"""
+        return self.packagist[1] if self.packagist[0] else self.name
+    
+    def to_recommendation(self, score):
+        """Build a read-only recommendation entry in the search_filament_plugins format"""
+        return MappingProxyType({
+            "name": self.name,
+            "score": round(score),
+            "author": self.package_name.split("/")[0],
+            "github_url": self.repo.github_url,
+            "stars": self.repo.stars,
+            "packagist_url": self.packagist_url,
+            "downloads": self.downloads,
+            "compatibility": MappingProxyType({
+                "laravel": "see package documentation",
+                "php": "see package documentation",
+                "filament": self.filament_version
+            }),
+            "last_updated": self.repo.last_updated,
+            "features": self.features,
+            "code_example": f"composer require {self.package_name}"
+        })
+
+
+class _PluginCatalog:
+    """
+    Column-oriented view of PLUGIN_DISCOVERY["popular_plugin_categories"].
+    
+    Every column is indexed by catalog position, so a scoring pass reads one
+    metric column at a time instead of probing each plugin record per metric.
+    """
+    
+    __slots__ = (
+        "records", "stars", "downloads", "features", "filament_versions", "filament_majors",
+        "last_updated_days", "recency", "normalized_metrics", "metric_rows", "closeness", "recommendations",
+        "feature_index"
+    )
+    
+    def __init__(self, popular_plugin_categories):
+        repositories = {}
+        self.records = tuple(
+            PluginRecord.from_dict(category, plugin, repositories)
+            for category, plugins in popular_plugin_categories.items()
+            for plugin in plugins
+        )
+        self.stars = tuple(record.repo.stars for record in self.records)
+        self.downloads = tuple(record.downloads for record in self.records)
+        self.features = tuple(record.features for record in self.records)
+        self.filament_versions = tuple(record.filament_version for record in self.records)
+        self.filament_majors = tuple(_major_versions(version) for version in self.filament_versions)
+        # Dates are parsed once into day ordinals so recency is plain arithmetic
+        self.last_updated_days = tuple(
+            date.fromisoformat(record.repo.last_updated).toordinal() for record in self.records
+        )
+        # Measured against the newest catalog entry rather than today, which
+        # keeps scores static; min-max normalization makes the choice of
+        # reference day irrelevant to the ranking
+        newest = max(self.last_updated_days, default=0)
+        self.recency = tuple(
+            2 ** (-(newest - day) / _RECENCY_HALF_LIFE_DAYS) for day in self.last_updated_days
+        )
+        
+        # The catalog is static, so normalization is paid once here rather
+        # than on every query
+        self.normalized_metrics = tuple(
+            _normalize_column(column, higher_is_better)
+            for column, higher_is_better in zip(
+                (self.stars, self.downloads, self.recency), _METRIC_HIGHER_IS_BETTER
+            )
+        )
+        # One row of normalized metrics per plugin
+        self.metric_rows = tuple(zip(*self.normalized_metrics))
+        self.closeness = _topsis_closeness(self.metric_rows, _METRIC_WEIGHTS)
+        # Scores are static too, so each recommendation entry is built once
+        self.recommendations = tuple(
+            record.to_recommendation(100 * closeness)
+            for record, closeness in zip(self.records, self.closeness)
+        )
+        
+        # Inverted index from feature keyword to the catalog positions whose
+        # feature list mentions it, so a search only touches matching plugins
+        index = {}
+        for position, features in enumerate(self.features):
+            for token in _tokenize(" ".join(features)):
+                index.setdefault(token, []).append(position)
+        self.feature_index = {token: tuple(positions) for token, positions in index.items()}
+    
+    def score(self, indices):
+        """
+        Score catalog plugins by their TOPSIS closeness coefficient.
+        
+        Args:
+            indices (Iterable[int]): Catalog positions of the plugins to score
+            
+        Returns:
+            List[float]: Scores on a 0-100 scale, in the same order as indices
+        """
+        closeness = self.closeness
+        return [100 * closeness[index] for index in indices]
+
+
+@lru_cache(maxsize=1)
+def _plugin_catalog():
+    """Build the plugin catalog view on first search and reuse it afterwards"""
+    return _PluginCatalog(PLUGIN_DISCOVERY["popular_plugin_categories"])
+
+# Custom implementation fallback offered alongside every plugin search. Kept
+# read-only; each call hands out its own plain copy.
+_CUSTOM_IMPLEMENTATION = MappingProxyType({
+    "description": "Custom implementation approach if no plugins meet requirements",
+    "code_example": "// Custom implementation code would go here",
+    "complexity": "medium",
+    "estimated_effort": "2-4 hours"
+})
+
+def _to_plain(value):
+    """Copy read-only catalog values into plain dicts and lists, so the
+    search payload is mutable and JSON serializable like any tool output"""
+    if isinstance(value, Mapping):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item) for item in value]
+    return value
+
 def search_filament_plugins(feature_requirements, compatibility_requirements=None):
     """
     Search and rank Filament plugins based on feature requirements and compatibility.
@@ -1134,79 +1426,88 @@ def search_filament_plugins(feature_requirements, compatibility_requirements=Non
         compatibility_requirements (dict, optional): Dict with 'laravel', 'php', and 'filament' version requirements
         
     Returns:
-        dict: Ranked plugin recommendations with scores and implementation examples
+        dict: Ranked plugin recommendations with scores and implementation examples,
+            as a fresh plain dict/list payload owned by the caller
     """
-    # This function would typically make API calls to Packagist/GitHub
-    # For now, we'll simulate the search by returning predefined data
-    
-    # Implementation would include:
-    # 1. Parse feature requirements to extract keywords
-    # 2. Query plugin repositories and sources
-    # 3. Score and rank plugins based on evaluation criteria
-    # 4. Generate implementation examples
-    # 5. Return formatted recommendations
+    # Matches come from the bundled popular plugin catalog; live Packagist and
+    # GitHub queries are not wired in yet. When nothing in the catalog matches,
+    # recommendations is empty and only the custom implementation remains.
+    catalog = _plugin_catalog()
+    keywords = sorted(_tokenize(feature_requirements).intersection(catalog.feature_index))
+    # Number of requested keywords each plugin's features mention
+    matches = Counter(
+        position for keyword in keywords for position in catalog.feature_index[keyword]
+    )
+    candidates = matches.keys()
+    filament_version = (compatibility_requirements or {}).get("filament")
+    # Versions are compared by major release, so "3", "3.x" and "^3.0" all
+    # select plugins listed for Filament 3.x; a constraint without a version
+    # number does not filter
+    required_majors = _major_versions(filament_version) if filament_version else frozenset()
+    if required_majors:
+        candidates = {
+            position for position in candidates
+            if catalog.filament_majors[position] & required_majors
+        }
     
+    candidates = sorted(candidates)
+    scores = catalog.score(candidates)
+    # Plugins matching more of the requested features rank first; the
+    # popularity/recency score only breaks ties between equally good matches.
+    # Partial selection of the top few instead of sorting every candidate
+    ranked = heapq.nlargest(
+        _MAX_RECOMMENDATIONS,
+        ((matches[position], score, position) for score, position in zip(scores, candidates)),
+        key=itemgetter(0, 1)
+    )
+    recommendations = []
+    for matched, score, position in ranked:
+        recommendation = _to_plain(catalog.recommendations[position])
+        # The reported score follows the ranking: each matched keyword is an
+        # equal share of the scale and the closeness score fills the last one
+        recommendation["score"] = round((100 * matched + score) / (len(keywords) + 1))
+        recommendations.append(recommendation)
     return {
         "feature_description": feature_requirements,
-        "recommendations": [
-            # This would be dynamically generated based on the query
-            {
-                "name": "Example Plugin 1",
-                "score": 95,
-                "author": "Example Author",
-                "github_url": "https://github.com/example/plugin1",
-                "stars": 450,
-                "packagist_url": "https://packagist.org/packages/example/plugin1",
-                "downloads": 250000,
-                "compatibility": {
-                    "laravel": "9.x, 10.x",
-                    "php": "8.1, 8.2",
-                    "filament": "3.x"
-                },
-                "last_updated": "2023-12-15",
-                "features": [
-                    "Feature 1 description",
-                    "Feature 2 description",
-                    "Feature 3 description"
-                ],
-                "code_example": """
-                composer require example/plugin1
-                
-                // In your ServiceProvider
-                public function boot()
-                {
-                    Filament::registerPlugin(
-                        ExamplePlugin::make()
-                    );
-                }
-                
-                // In your resource
-                use Example\\Plugin1\\Components\\ExampleComponent;
-                
-                public static function form(Form $form): Form
-                {
-                    return $form->schema([
-                        ExampleComponent::make('field_name')
-                            ->label('Field Label')
-                            ->required(),
-                    ]);
-                }
-                """
-            }
-        ],
-        "custom_implementation": {
-            "description": "Custom implementation approach if no plugins meet requirements",
-            "code_example": "// Custom implementation code would go here",
-            "complexity": "medium",
-            "estimated_effort": "2-4 hours"
-        },
+        "recommendations": recommendations,
+        "custom_implementation": dict(_CUSTOM_IMPLEMENTATION),
         "search_metadata": {
-            "sources_queried": ["Packagist", "GitHub", "FilamentPHP Awesome List"],
-            "keywords_used": ["example", "keyword"],
-            "filters_applied": {"min_stars": 100, "min_downloads": 10000}
+            "sources_queried": ["Popular plugin catalog"],
+            "keywords_used": keywords,
+            "filters_applied": {"filament_version": filament_version} if required_majors else {}
         }
     }
-}
+
+def render_plugin_recommendation(rank, plugin):
+    """
+    Render one plugin recommendation as a markdown block.
+    
+    Follows the layout of PLUGIN_DISCOVERY["recommendation_format"]["example"],
+    written as f-strings so the template is compiled with the module rather
+    than parsed on every call.
+    
+    Args:
+        rank (int): 1-based position of the plugin in the recommendations
+        plugin (dict): A recommendation entry as returned by search_filament_plugins
+        
+    Returns:
+        str: Markdown block for the plugin
+    """
+    compatibility = plugin["compatibility"]
+    lines = [
+        f"### {rank}. {plugin['name']} (Score: {plugin['score']}/100)",
+        f"- **Author:** {plugin['author']}",
+        f"- **GitHub:** {plugin['github_url']} ({plugin['stars']} stars)",
+        f"- **Packagist:** {plugin['packagist_url']} ({plugin['downloads']} downloads)",
+        f"- **Compatibility:** Laravel {compatibility['laravel']}, "
+        f"PHP {compatibility['php']}, Filament {compatibility['filament']}",
+        f"- **Last Updated:** {plugin['last_updated']}",
+        "- **Key Features:**"
+    ]
+    lines.extend(f"  - {feature}" for feature in plugin["features"])
+    lines.append("- **Implementation Example:**")
+    lines.append(f"```php\n{plugin['code_example']}\n```\n")
+    return "\n".join(lines)
 
 # Agent workflow integration for plugin discovery
 PLUGIN_DISCOVERY_WORKFLOW = """
@@ -1228,8 +1529,29 @@ When receiving a feature request that might be fulfilled by a Filament plugin:
 This ensures the agent leverages the existing ecosystem before implementing custom solutions.
 """
 
+# Keywords that suggest plugin applicability
+PLUGIN_RELEVANT_KEYWORDS = (
+    "upload", "media", "file", "image", "editor", "wysiwyg", "rich text",
+    "chart", "graph", "dashboard", "widget", "stat", "metric", 
+    "permission", "role", "auth", "login", "2fa", "two factor",
+    "import", "export", "excel", "csv", "spreadsheet",
+    "translate", "language", "localization", "multilingual",
+    "theme", "dark mode", "color", "layout", "notification",
+    "audit", "log", "history", "activity", "tracking",
+    "calendar", "schedule", "date picker", "time picker",
+    "map", "location", "address", "geocode",
+    "payment", "gateway", "stripe", "paypal",
+    "tag", "category", "filter", "search"
+)
+
+# All keywords compiled into one case-insensitive alternation so the scan
+# runs inside the regex engine and stops at the first hit
+_PLUGIN_KEYWORD_RE = re.compile(
+    "|".join(map(re.escape, PLUGIN_RELEVANT_KEYWORDS)), re.IGNORECASE
+)
+
 # Function to determine if a feature request could be fulfilled by plugins
-def should_search_plugins(feature_description):
+def should_search_plugins(feature_description: str) -> bool:
     """
     Analyze a feature description to determine if it might be addressed by a Filament plugin
     
@@ -1239,24 +1561,21 @@ def should_search_plugins(feature_description):
     Returns:
         bool: True if the feature might be addressed by a plugin, False otherwise
     """
-    # Keywords that suggest plugin applicability
-    plugin_relevant_keywords = [
-        "upload", "media", "file", "image", "editor", "wysiwyg", "rich text",
-        "chart", "graph", "dashboard", "widget", "stat", "metric", 
-        "permission", "role", "auth", "login", "2fa", "two factor",
-        "import", "export", "excel", "csv", "spreadsheet",
-        "translate", "language", "localization", "multilingual",
-        "theme", "dark mode", "color", "layout", "notification",
-        "audit", "log", "history", "activity", "tracking",
-        "calendar", "schedule", "date picker", "time picker",
-        "map", "location", "address", "geocode",
-        "payment", "gateway", "stripe", "paypal",
-        "tag", "category", "filter", "search"
-    ]
-    
     # Check if any plugin-relevant keywords appear in the feature description
-    description_lower = feature_description.lower()
-    return any(keyword in description_lower for keyword in plugin_relevant_keywords)
+    return _PLUGIN_KEYWORD_RE.search(feature_description) is not None
+
+def should_search_plugins_batch(feature_descriptions: Sequence[str]) -> List[bool]:
+    """
+    Apply should_search_plugins to several feature descriptions in one pass
+    
+    Args:
+        feature_descriptions (Sequence[str]): Feature descriptions to check
+        
+    Returns:
+        List[bool]: One flag per description, in the same order
+    """
+    search = _PLUGIN_KEYWORD_RE.search
+    return [search(description) is not None for description in feature_descriptions]
 
 # Example usage in agent workflow
 """
@@ -1270,9 +1589,15 @@ When processing a user request about implementing a feature in Filament:
 """
 
 # Returns the comprehensive FilamentPHP plugins and extensions knowledge base
+@lru_cache(maxsize=1)
 def get_filament_plugins_knowledge():
-    """Returns the comprehensive FilamentPHP plugins and extensions knowledge base"""
-    return {
+    """
+    Returns the comprehensive FilamentPHP plugins and extensions knowledge base.
+    
+    The mapping is built on first use and the same read-only view is returned
+    on every subsequent call.
+    """
+    return MappingProxyType({
         "overview": PLUGINS_OVERVIEW,
         "first_party_plugins": OFFICIAL_PLUGINS,
         "community_plugins": COMMUNITY_PLUGINS,
@@ -1280,4 +1605,4 @@ def get_filament_plugins_knowledge():
         "plugin_integration": PLUGIN_INTEGRATION,
         "plugin_discovery": PLUGIN_DISCOVERY,
         "plugin_discovery_workflow": PLUGIN_DISCOVERY_WORKFLOW
-    } 
\ No newline at end of file
+    })
@@ -5,7 +5,15 @@ This module contains comprehensive knowledge about FilamentPHP table builder com
 including column types, filters, actions, and advanced usage patterns.
 """
 
-from typing import Dict, List, Any
+import sys
+import textwrap
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from functools import lru_cache
+from typing import Any, Tuple
+
+from src.knowledge_base.filament.lazy_sections import LazyKnowledge, LazySections
 
 # Table Builder Overview
 TABLE_BUILDER_OVERVIEW = """
@@ -28,379 +36,393 @@ Key features of the Table Builder:
 - Export capabilities (CSV, Excel, etc.)
 """
 
+# Scaffold shared by the examples that show a complete table() method
+_TABLE_METHOD_HEADER = """public static function table(Table $table): Table
+{
+    return $table
+        ->columns([
+            // ... columns
+        ])
+"""
+_TABLE_METHOD_FOOTER = "\n}"
+
+
+def _table_method_example(chain):
+    """Wrap a chain of Table method calls in the shared table() method scaffold"""
+    chain = textwrap.indent(textwrap.dedent(chain).strip("\n"), "        ")
+    return _TABLE_METHOD_HEADER + chain + _TABLE_METHOD_FOOTER
+
 # Table Columns
-TABLE_COLUMNS = {
-    "Text Columns": {
-        "TextColumn": {
-            "description": "Standard column for displaying text or numeric data",
-            "common_options": [
-                "sortable()", "searchable()", "toggleable()", "copyable()",
-                "wrap()", "limit()", "badge()", "color()", "formatStateUsing()"
-            ],
-            "example": """
-            TextColumn::make('title')
-                ->sortable()
-                ->searchable()
-                ->limit(50)
-                ->tooltip(fn ($record) => $record->title)
-                ->description(fn ($record) => $record->subtitle)
-            """
+def _build_table_columns():
+    """Build the TABLE_COLUMNS section"""
+    return {
+        "Text Columns": {
+            "TextColumn": {
+                "description": "Standard column for displaying text or numeric data",
+                "common_options": [
+                    "sortable()", "searchable()", "toggleable()", "copyable()",
+                    "wrap()", "limit()", "badge()", "color()", "formatStateUsing()"
+                ],
+                "example": """
+                TextColumn::make('title')
+                    ->sortable()
+                    ->searchable()
+                    ->limit(50)
+                    ->tooltip(fn ($record) => $record->title)
+                    ->description(fn ($record) => $record->subtitle)
+                """
+            },
+            "TextInputColumn": {
+                "description": "Editable text column with inline editing capabilities",
+                "common_options": [
+                    "sortable()", "searchable()", "rules()", "type()",
+                    "disabled()", "visible()", "afterStateUpdated()"
+                ],
+                "example": """
+                TextInputColumn::make('name')
+                    ->sortable()
+                    ->searchable()
+                    ->rules(['required', 'max:255'])
+                    ->label('Full Name')
+                """
+            }
         },
-        "TextInputColumn": {
-            "description": "Editable text column with inline editing capabilities",
-            "common_options": [
-                "sortable()", "searchable()", "rules()", "type()",
-                "disabled()", "visible()", "afterStateUpdated()"
-            ],
-            "example": """
-            TextInputColumn::make('name')
-                ->sortable()
-                ->searchable()
-                ->rules(['required', 'max:255'])
-                ->label('Full Name')
-            """
-        }
-    },
-    "Date and Time Columns": {
-        "DateColumn": {
-            "description": "Display dates in various formats",
-            "common_options": [
-                "sortable()", "searchable()", "toggleable()", "date()",
-                "since()", "timezone()", "default()"
-            ],
-            "example": """
-            DateColumn::make('published_at')
-                ->label('Published')
-                ->sortable()
-                ->date('F j, Y')
-                ->default(now())
-            """
+        "Date and Time Columns": {
+            "DateColumn": {
+                "description": "Display dates in various formats",
+                "common_options": [
+                    "sortable()", "searchable()", "toggleable()", "date()",
+                    "since()", "timezone()", "default()"
+                ],
+                "example": """
+                DateColumn::make('published_at')
+                    ->label('Published')
+                    ->sortable()
+                    ->date('F j, Y')
+                    ->default(now())
+                """
+            },
+            "DateTimeColumn": {
+                "description": "Display dates with time information",
+                "common_options": [
+                    "sortable()", "searchable()", "toggleable()", "dateTime()",
+                    "since()", "timezone()", "default()", "withoutTime()"
+                ],
+                "example": """
+                DateTimeColumn::make('created_at')
+                    ->label('Created')
+                    ->sortable()
+                    ->dateTime('F j, Y H:i:s')
+                    ->timezone('UTC')
+                    ->since() // displays as "2 hours ago"
+                """
+            },
+            "TimeColumn": {
+                "description": "Display only time information",
+                "common_options": [
+                    "sortable()", "searchable()", "toggleable()", "time()",
+                    "timezone()"
+                ],
+                "example": """
+                TimeColumn::make('opening_time')
+                    ->sortable()
+                    ->time('H:i A')
+                    ->timezone('America/New_York')
+                """
+            }
         },
-        "DateTimeColumn": {
-            "description": "Display dates with time information",
-            "common_options": [
-                "sortable()", "searchable()", "toggleable()", "dateTime()",
-                "since()", "timezone()", "default()", "withoutTime()"
-            ],
-            "example": """
-            DateTimeColumn::make('created_at')
-                ->label('Created')
-                ->sortable()
-                ->dateTime('F j, Y H:i:s')
-                ->timezone('UTC')
-                ->since() // displays as "2 hours ago"
-            """
+        "Special Format Columns": {
+            "IconColumn": {
+                "description": "Display icon based on the state of a record",
+                "common_options": [
+                    "sortable()", "toggleable()", "boolean()", "options()",
+                    "size()", "color()"
+                ],
+                "example": """
+                IconColumn::make('is_featured')
+                    ->label('Featured')
+                    ->boolean()
+                    ->trueIcon('heroicon-o-star')
+                    ->falseIcon('heroicon-o-x-mark')
+                    ->trueColor('warning')
+                    ->falseColor('danger')
+                """
+            },
+            "ImageColumn": {
+                "description": "Display images in the table",
+                "common_options": [
+                    "toggleable()", "circular()", "height()", "width()",
+                    "disk()", "visibility()", "defaultImageUrl()"
+                ],
+                "example": """
+                ImageColumn::make('avatar')
+                    ->label('Profile Picture')
+                    ->disk('public')
+                    ->circular()
+                    ->height(40)
+                    ->defaultImageUrl(asset('images/default-avatar.jpg'))
+                """
+            },
+            "ColorColumn": {
+                "description": "Display color swatches based on hex values",
+                "common_options": [
+                    "sortable()", "searchable()", "toggleable()",
+                    "copyable()", "tooltip()"
+                ],
+                "example": """
+                ColorColumn::make('brand_color')
+                    ->sortable()
+                    ->copyable()
+                    ->tooltip(fn ($record) => "RGB: " . implode(', ', sscanf($record->brand_color, "#%02x%02x%02x")))
+                """
+            },
+            "BadgeColumn": {
+                "description": "Display values as colored badges",
+                "common_options": [
+                    "sortable()", "searchable()", "toggleable()", "enum()",
+                    "colors()", "icons()", "extraAttributes()"
+                ],
+                "example": """
+                BadgeColumn::make('status')
+                    ->sortable()
+                    ->searchable()
+                    ->colors([
+                        'primary' => 'pending',
+                        'success' => 'approved',
+                        'danger' => 'rejected',
+                    ])
+                    ->icons([
+                        'heroicon-o-clock' => 'pending',
+                        'heroicon-o-check' => 'approved',
+                        'heroicon-o-x-mark' => 'rejected',
+                    ])
+                """
+            }
         },
-        "TimeColumn": {
-            "description": "Display only time information",
-            "common_options": [
-                "sortable()", "searchable()", "toggleable()", "time()",
-                "timezone()"
-            ],
-            "example": """
-            TimeColumn::make('opening_time')
-                ->sortable()
-                ->time('H:i A')
-                ->timezone('America/New_York')
-            """
-        }
-    },
-    "Special Format Columns": {
-        "IconColumn": {
-            "description": "Display icon based on the state of a record",
-            "common_options": [
-                "sortable()", "toggleable()", "boolean()", "options()",
-                "size()", "color()"
-            ],
-            "example": """
-            IconColumn::make('is_featured')
-                ->label('Featured')
-                ->boolean()
-                ->trueIcon('heroicon-o-star')
-                ->falseIcon('heroicon-o-x-mark')
-                ->trueColor('warning')
-                ->falseColor('danger')
-            """
+        "Numeric and Currency Columns": {
+            "TextColumn with formatters": {
+                "description": "TextColumn with numeric formatting options",
+                "common_options": [
+                    "sortable()", "searchable()", "toggleable()", "numeric()",
+                    "money()", "percentage()", "prefix()", "suffix()"
+                ],
+                "example": """
+                // Numeric formatting
+                TextColumn::make('views')
+                    ->sortable()
+                    ->numeric(
+                        decimalPlaces: 0,
+                        decimalSeparator: '.',
+                        thousandsSeparator: ',',
+                    )
+                    ->suffix(' views')
+
+                // Currency formatting
+                TextColumn::make('price')
+                    ->sortable()
+                    ->money('usd')
+
+                // Percentage formatting
+                TextColumn::make('completion_rate')
+                    ->sortable()
+                    ->percentage(
+                        decimalPlaces: 1,
+                    )
+                """
+            }
         },
-        "ImageColumn": {
-            "description": "Display images in the table",
-            "common_options": [
-                "toggleable()", "circular()", "height()", "width()",
-                "disk()", "visibility()", "defaultImageUrl()"
-            ],
-            "example": """
-            ImageColumn::make('avatar')
-                ->label('Profile Picture')
-                ->disk('public')
-                ->circular()
-                ->height(40)
-                ->defaultImageUrl(asset('images/default-avatar.jpg'))
-            """
+        "Relationship Columns": {
+            "Relationship Display": {
+                "description": "Display data from related models",
+                "common_options": [
+                    "sortable()", "searchable()", "toggleable()", "listWithLineBreaks()",
+                    "bulleted()", "limitList()"
+                ],
+                "example": """
+                // Display a single related model's attribute
+                TextColumn::make('author.name')
+                    ->sortable()
+                    ->searchable()
+
+                // Display multiple related models with list formatting
+                TextColumn::make('categories.name')
+                    ->label('Categories')
+                    ->listWithLineBreaks()
+                    ->bulleted()
+                    ->limitList(3)
+                    ->expandableLimitedList()
+                """
+            }
         },
-        "ColorColumn": {
-            "description": "Display color swatches based on hex values",
-            "common_options": [
-                "sortable()", "searchable()", "toggleable()",
-                "copyable()", "tooltip()"
-            ],
-            "example": """
-            ColorColumn::make('brand_color')
-                ->sortable()
-                ->copyable()
-                ->tooltip(fn ($record) => "RGB: " . implode(', ', sscanf($record->brand_color, "#%02x%02x%02x")))
-            """
+        "Toggle Columns": {
+            "ToggleColumn": {
+                "description": "Toggle switch for boolean values that can be changed directly in the table",
+                "common_options": [
+                    "sortable()", "disabled()", "onColor()", "offColor()",
+                    "afterStateUpdated()"
+                ],
+                "example": """
+                ToggleColumn::make('is_active')
+                    ->label('Active')
+                    ->sortable()
+                    ->disabled(fn ($record) => $record->is_locked)
+                    ->onColor('success')
+                    ->offColor('danger')
+                    ->afterStateUpdated(function ($record, $state) {
+                        // Perform action after toggle is updated
+                        if ($state) {
+                            ActivityLog::create([
+                                'description' => "Activated user {$record->name}",
+                                'user_id' => auth()->id(),
+                            ]);
+                        }
+                    })
+                """
+            }
         },
-        "BadgeColumn": {
-            "description": "Display values as colored badges",
-            "common_options": [
-                "sortable()", "searchable()", "toggleable()", "enum()",
-                "colors()", "icons()", "extraAttributes()"
-            ],
-            "example": """
-            BadgeColumn::make('status')
-                ->sortable()
-                ->searchable()
-                ->colors([
-                    'primary' => 'pending',
-                    'success' => 'approved',
-                    'danger' => 'rejected',
-                ])
-                ->icons([
-                    'heroicon-o-clock' => 'pending',
-                    'heroicon-o-check' => 'approved',
-                    'heroicon-o-x-mark' => 'rejected',
-                ])
-            """
-        }
-    },
-    "Numeric and Currency Columns": {
-        "TextColumn with formatters": {
-            "description": "TextColumn with numeric formatting options",
-            "common_options": [
-                "sortable()", "searchable()", "toggleable()", "numeric()",
-                "money()", "percentage()", "prefix()", "suffix()"
-            ],
-            "example": """
-            // Numeric formatting
-            TextColumn::make('views')
-                ->sortable()
-                ->numeric(
-                    decimalPlaces: 0,
-                    decimalSeparator: '.',
-                    thousandsSeparator: ',',
-                )
-                ->suffix(' views')
-                
-            // Currency formatting
-            TextColumn::make('price')
-                ->sortable()
-                ->money('usd')
-                
-            // Percentage formatting
-            TextColumn::make('completion_rate')
-                ->sortable()
-                ->percentage(
-                    decimalPlaces: 1,
-                )
-            """
-        }
-    },
-    "Relationship Columns": {
-        "Relationship Display": {
-            "description": "Display data from related models",
-            "common_options": [
-                "sortable()", "searchable()", "toggleable()", "listWithLineBreaks()",
-                "bulleted()", "limitList()"
-            ],
-            "example": """
-            // Display a single related model's attribute
-            TextColumn::make('author.name')
-                ->sortable()
-                ->searchable()
-                
-            // Display multiple related models with list formatting
-            TextColumn::make('categories.name')
-                ->label('Categories')
-                ->listWithLineBreaks()
-                ->bulleted()
-                ->limitList(3)
-                ->expandableLimitedList()
-            """
-        }
-    },
-    "Toggle Columns": {
-        "ToggleColumn": {
-            "description": "Toggle switch for boolean values that can be changed directly in the table",
-            "common_options": [
-                "sortable()", "disabled()", "onColor()", "offColor()",
-                "afterStateUpdated()"
-            ],
-            "example": """
-            ToggleColumn::make('is_active')
-                ->label('Active')
-                ->sortable()
-                ->disabled(fn ($record) => $record->is_locked)
-                ->onColor('success')
-                ->offColor('danger')
-                ->afterStateUpdated(function ($record, $state) {
-                    // Perform action after toggle is updated
-                    if ($state) {
+        "Select Columns": {
+            "SelectColumn": {
+                "description": "Dropdown select input directly in the table",
+                "common_options": [
+                    "sortable()", "options()", "disabled()", "placeholder()",
+                    "afterStateUpdated()", "selectablePlaceholder()"
+                ],
+                "example": """
+                SelectColumn::make('status')
+                    ->label('Status')
+                    ->options([
+                        'pending' => 'Pending',
+                        'processing' => 'Processing',
+                        'completed' => 'Completed',
+                        'canceled' => 'Canceled',
+                    ])
+                    ->sortable()
+                    ->placeholder('Select status')
+                    ->disabled(fn ($record) => $record->is_locked)
+                    ->afterStateUpdated(function ($record, $state) {
+                        // Perform action after status is updated
                         ActivityLog::create([
-                            'description' => "Activated user {$record->name}",
+                            'description' => "Updated order {$record->id} status to {$state}",
                             'user_id' => auth()->id(),
                         ]);
-                    }
-                })
-            """
-        }
-    },
-    "Select Columns": {
-        "SelectColumn": {
-            "description": "Dropdown select input directly in the table",
-            "common_options": [
-                "sortable()", "options()", "disabled()", "placeholder()",
-                "afterStateUpdated()", "selectablePlaceholder()"
-            ],
-            "example": """
-            SelectColumn::make('status')
-                ->label('Status')
-                ->options([
-                    'pending' => 'Pending',
-                    'processing' => 'Processing',
-                    'completed' => 'Completed',
-                    'canceled' => 'Canceled',
-                ])
-                ->sortable()
-                ->placeholder('Select status')
-                ->disabled(fn ($record) => $record->is_locked)
-                ->afterStateUpdated(function ($record, $state) {
-                    // Perform action after status is updated
-                    ActivityLog::create([
-                        'description' => "Updated order {$record->id} status to {$state}",
-                        'user_id' => auth()->id(),
-                    ]);
-                })
-            """
+                    })
+                """
+            }
         }
     }
-}
 
 # Table Filters
-TABLE_FILTERS = {
-    "Basic Filters": {
-        "SelectFilter": {
-            "description": "Filter records based on a dropdown selection",
-            "options": [
-                "options()", "multiple()", "default()", "placeholder()",
-                "query()", "indicateUsing()"
-            ],
-            "example": """
-            SelectFilter::make('status')
-                ->options([
-                    'pending' => 'Pending',
-                    'processing' => 'Processing',
-                    'completed' => 'Completed',
-                    'canceled' => 'Canceled',
-                ])
-                ->multiple()
-                ->label('Order Status')
-                ->placeholder('All Statuses')
-                ->default('pending')
-                ->indicateUsing(function (array $state): array {
-                    if (blank($state['value'] ?? null)) {
-                        return [];
-                    }
-                    
-                    return [
-                        'Status: ' . collect($this->getOptions())
-                            ->get($state['value']),
-                    ];
-                })
-            """
-        },
-        "TernaryFilter": {
-            "description": "Three-state filter for boolean values (yes/no/all)",
-            "options": [
-                "placeholder()", "trueLabel()", "falseLabel()",
-                "queries()", "default()"
-            ],
-            "example": """
-            TernaryFilter::make('is_featured')
-                ->label('Featured')
-                ->placeholder('All Products')
-                ->trueLabel('Featured Products')
-                ->falseLabel('Non-Featured Products')
-                ->queries(
-                    true: fn (Builder $query) => $query->where('is_featured', true),
-                    false: fn (Builder $query) => $query->where('is_featured', false),
-                    blank: fn (Builder $query) => $query,
-                )
-            """
-        },
-        "Filter (Custom)": {
-            "description": "Create a custom filter with form components",
-            "options": [
-                "form()", "query()", "indicateUsing()"
-            ],
-            "example": """
-            Filter::make('created_at')
-                ->form([
-                    DatePicker::make('created_from'),
-                    DatePicker::make('created_until'),
-                ])
-                ->query(function (Builder $query, array $data): Builder {
-                    return $query
-                        ->when(
-                            $data['created_from'],
-                            fn (Builder $query, $date): Builder => $query->whereDate('created_at', '>=', $date),
-                        )
-                        ->when(
-                            $data['created_until'],
-                            fn (Builder $query, $date): Builder => $query->whereDate('created_at', '<=', $date),
-                        );
-                })
-                ->indicateUsing(function (array $data): array {
-                    $indicators = [];
-                    
-                    if ($data['created_from'] ?? null) {
-                        $indicators[] = 'Created from ' . Carbon::parse($data['created_from'])->toFormattedDate();
-                    }
-                    
-                    if ($data['created_until'] ?? null) {
-                        $indicators[] = 'Created until ' . Carbon::parse($data['created_until'])->toFormattedDate();
-                    }
-                    
-                    return $indicators;
-                })
-            """
-        },
-        "Relationship Filters": {
-            "description": "Filter records based on related models",
-            "options": [
-                "relationship()", "multiple()", "preload()",
-                "searchable()"
-            ],
-            "example": """
-            SelectFilter::make('author')
-                ->relationship('author', 'name')
-                ->searchable()
-                ->preload()
-                ->label('Filter by Author')
-                ->placeholder('All Authors')
-                ->multiple()
-            """
-        }
-    },
-    "Advanced Filters": {
-        "Tables Filters": {
-            "description": "Apply multiple filters together",
-            "example": """
-            public static function table(Table $table): Table
-            {
-                return $table
-                    ->columns([
-                        // ...
+def _build_table_filters():
+    """Build the TABLE_FILTERS section"""
+    return {
+        "Basic Filters": {
+            "SelectFilter": {
+                "description": "Filter records based on a dropdown selection",
+                "options": [
+                    "options()", "multiple()", "default()", "placeholder()",
+                    "query()", "indicateUsing()"
+                ],
+                "example": """
+                SelectFilter::make('status')
+                    ->options([
+                        'pending' => 'Pending',
+                        'processing' => 'Processing',
+                        'completed' => 'Completed',
+                        'canceled' => 'Canceled',
                     ])
+                    ->multiple()
+                    ->label('Order Status')
+                    ->placeholder('All Statuses')
+                    ->default('pending')
+                    ->indicateUsing(function (array $state): array {
+                        if (blank($state['value'] ?? null)) {
+                            return [];
+                        }
+
+                        return [
+                            'Status: ' . collect($this->getOptions())
+                                ->get($state['value']),
+                        ];
+                    })
+                """
+            },
+            "TernaryFilter": {
+                "description": "Three-state filter for boolean values (yes/no/all)",
+                "options": [
+                    "placeholder()", "trueLabel()", "falseLabel()",
+                    "queries()", "default()"
+                ],
+                "example": """
+                TernaryFilter::make('is_featured')
+                    ->label('Featured')
+                    ->placeholder('All Products')
+                    ->trueLabel('Featured Products')
+                    ->falseLabel('Non-Featured Products')
+                    ->queries(
+                        true: fn (Builder $query) => $query->where('is_featured', true),
+                        false: fn (Builder $query) => $query->where('is_featured', false),
+                        blank: fn (Builder $query) => $query,
+                    )
+                """
+            },
+            "Filter (Custom)": {
+                "description": "Create a custom filter with form components",
+                "options": [
+                    "form()", "query()", "indicateUsing()"
+                ],
+                "example": """
+                Filter::make('created_at')
+                    ->form([
+                        DatePicker::make('created_from'),
+                        DatePicker::make('created_until'),
+                    ])
+                    ->query(function (Builder $query, array $data): Builder {
+                        return $query
+                            ->when(
+                                $data['created_from'],
+                                fn (Builder $query, $date): Builder => $query->whereDate('created_at', '>=', $date),
+                            )
+                            ->when(
+                                $data['created_until'],
+                                fn (Builder $query, $date): Builder => $query->whereDate('created_at', '<=', $date),
+                            );
+                    })
+                    ->indicateUsing(function (array $data): array {
+                        $indicators = [];
+
+                        if ($data['created_from'] ?? null) {
+                            $indicators[] = 'Created from ' . Carbon::parse($data['created_from'])->toFormattedDate();
+                        }
+
+                        if ($data['created_until'] ?? null) {
+                            $indicators[] = 'Created until ' . Carbon::parse($data['created_until'])->toFormattedDate();
+                        }
+
+                        return $indicators;
+                    })
+                """
+            },
+            "Relationship Filters": {
+                "description": "Filter records based on related models",
+                "options": [
+                    "relationship()", "multiple()", "preload()",
+                    "searchable()"
+                ],
+                "example": """
+                SelectFilter::make('author')
+                    ->relationship('author', 'name')
+                    ->searchable()
+                    ->preload()
+                    ->label('Filter by Author')
+                    ->placeholder('All Authors')
+                    ->multiple()
+                """
+            }
+        },
+        "Advanced Filters": {
+            "Tables Filters": {
+                "description": "Apply multiple filters together",
+                "example": _table_method_example("""
                     ->filters([
                         Tables\\Filters\\SelectFilter::make('status')
                             ->options([
@@ -431,18 +453,11 @@ TABLE_FILTERS = {
                     ->filtersFormWidth('sm') // Adjusts filter form width
                     ->filtersLayout(FiltersLayout::AboveContent) // Position filters above content
                     ->persistFiltersInSession(); // Remember filters between requests
-            }
-            """
-        },
-        "Filter Presets": {
-            "description": "Create predefined filter combinations",
-            "example": """
-            public static function table(Table $table): Table
-            {
-                return $table
-                    ->columns([
-                        // ...
-                    ])
+                    """)
+            },
+            "Filter Presets": {
+                "description": "Create predefined filter combinations",
+                "example": _table_method_example("""
                     ->filters([
                         // ...
                     ])
@@ -462,279 +477,276 @@ TABLE_FILTERS = {
                             'status' => ['refunded', 'canceled'],
                         ],
                     ]);
+                    """)
             }
-            """
         }
     }
-}
 
 # Table Actions
-TABLE_ACTIONS = {
-    "Row Actions": {
-        "EditAction": {
-            "description": "Opens a form to edit the record",
-            "options": [
-                "url()", "form()", "mutateFormDataUsing()",
-                "fillForm()", "successRedirectUrl()"
-            ],
-            "example": """
-            EditAction::make()
-                ->url(fn ($record): string => route('posts.edit', $record))
-                ->form([
-                    TextInput::make('title')->required(),
-                    MarkdownEditor::make('content'),
-                ])
-                ->fillForm(fn ($record) => [
-                    'title' => $record->title,
-                    'content' => $record->content,
-                ])
-                ->mutateFormDataUsing(function (array $data): array {
-                    $data['user_id'] = auth()->id();
-                    
-                    return $data;
-                })
-                ->successRedirectUrl(route('posts.index'))
-                ->successNotificationTitle('Post updated')
-            """
-        },
-        "ViewAction": {
-            "description": "Opens a modal or redirects to view record details",
-            "options": [
-                "url()", "modalContent()", "modalSubmitAction()",
-                "modalFooterActions()", "modalWidth()"
-            ],
-            "example": """
-            ViewAction::make()
-                ->label('View Details')
-                ->icon('heroicon-s-eye')
-                ->modalContent(function ($record) {
-                    return new HtmlString('
-                        <div class="space-y-4">
-                            <h2 class="text-xl font-bold">' . e($record->title) . '</h2>
-                            <div class="prose">' . Str::markdown($record->content) . '</div>
-                            <div class="text-sm">
-                                Published: ' . $record->published_at->format('F j, Y') . '
+def _build_table_actions():
+    """Build the TABLE_ACTIONS section"""
+    return {
+        "Row Actions": {
+            "EditAction": {
+                "description": "Opens a form to edit the record",
+                "options": [
+                    "url()", "form()", "mutateFormDataUsing()",
+                    "fillForm()", "successRedirectUrl()"
+                ],
+                "example": """
+                EditAction::make()
+                    ->url(fn ($record): string => route('posts.edit', $record))
+                    ->form([
+                        TextInput::make('title')->required(),
+                        MarkdownEditor::make('content'),
+                    ])
+                    ->fillForm(fn ($record) => [
+                        'title' => $record->title,
+                        'content' => $record->content,
+                    ])
+                    ->mutateFormDataUsing(function (array $data): array {
+                        $data['user_id'] = auth()->id();
+
+                        return $data;
+                    })
+                    ->successRedirectUrl(route('posts.index'))
+                    ->successNotificationTitle('Post updated')
+                """
+            },
+            "ViewAction": {
+                "description": "Opens a modal or redirects to view record details",
+                "options": [
+                    "url()", "modalContent()", "modalSubmitAction()",
+                    "modalFooterActions()", "modalWidth()"
+                ],
+                "example": """
+                ViewAction::make()
+                    ->label('View Details')
+                    ->icon('heroicon-s-eye')
+                    ->modalContent(function ($record) {
+                        return new HtmlString('
+                            <div class="space-y-4">
+                                <h2 class="text-xl font-bold">' . e($record->title) . '</h2>
+                                <div class="prose">' . Str::markdown($record->content) . '</div>
+                                <div class="text-sm">
+                                    Published: ' . $record->published_at->format('F j, Y') . '
+                                </div>
                             </div>
-                        </div>
-                    ');
-                })
-                ->modalWidth('3xl')
-                ->modalSubmitAction(false) // Hides the submit button
-                ->modalFooterActions(function ($record) {
-                    return [
-                        Action::make('edit')
-                            ->label('Edit Post')
-                            ->url(route('posts.edit', $record))
-                            ->color('primary'),
-                    ];
-                })
-            """
-        },
-        "DeleteAction": {
-            "description": "Delete a record with confirmation",
-            "options": [
-                "requiresConfirmation()", "modalDescription()",
-                "modalHeading()", "successRedirectUrl()"
-            ],
-            "example": """
-            DeleteAction::make()
-                ->requiresConfirmation()
-                ->modalHeading('Delete Post')
-                ->modalDescription('Are you sure you want to delete this post? This action cannot be undone.')
-                ->modalSubmitActionLabel('Yes, delete it')
-                ->successNotificationTitle('Post deleted')
-                ->successRedirectUrl(route('posts.index'))
-                ->after(function ($record) {
-                    // Additional actions after deletion
-                    Activity::create([
-                        'description' => "Deleted post {$record->title}",
-                        'user_id' => auth()->id(),
-                    ]);
-                })
-            """
-        },
-        "Custom Action": {
-            "description": "Create a custom action with specific behavior",
-            "options": [
-                "action()", "form()", "fillForm()", "visible()",
-                "hidden()", "link()", "button()"
-            ],
-            "example": """
-            Action::make('approve')
-                ->label('Approve')
-                ->icon('heroicon-o-check')
-                ->color('success')
-                ->visible(fn ($record) => $record->status === 'pending')
-                ->form([
-                    Textarea::make('comment')
-                        ->placeholder('Add an optional comment')
-                        ->columnSpanFull(),
-                ])
-                ->action(function (array $data, $record): void {
-                    $record->update([
-                        'status' => 'approved',
-                        'approved_at' => now(),
-                        'approved_by' => auth()->id(),
-                        'approval_comment' => $data['comment'],
-                    ]);
-                    
-                    Notification::make()
-                        ->title('Approved successfully')
-                        ->success()
-                        ->send();
-                })
-                ->requiresConfirmation()
-                ->modalHeading('Approve Post')
-                ->modalDescription('Are you sure you want to approve this post? It will be visible to all users.')
-                ->modalSubmitActionLabel('Yes, approve')
-            """
-        }
-    },
-    "Bulk Actions": {
-        "DeleteBulkAction": {
-            "description": "Delete multiple records at once",
-            "options": [
-                "requiresConfirmation()", "modalDescription()",
-                "modalHeading()", "deselectRecordsAfterCompletion()"
-            ],
-            "example": """
-            DeleteBulkAction::make()
-                ->requiresConfirmation()
-                ->modalHeading('Delete Selected Posts')
-                ->modalDescription('Are you sure you want to delete these posts? This action cannot be undone.')
-                ->modalSubmitActionLabel('Yes, delete them')
-                ->successNotificationTitle(fn (int $count) => "Deleted {$count} posts")
-                ->deselectRecordsAfterCompletion()
-                ->after(function ($records) {
-                    // Additional actions after bulk deletion
-                    Activity::create([
-                        'description' => "Bulk deleted {$records->count()} posts",
-                        'user_id' => auth()->id(),
-                    ]);
-                })
-            """
-        },
-        "Custom Bulk Action": {
-            "description": "Create a custom action for multiple records",
-            "options": [
-                "action()", "form()", "deselectRecordsAfterCompletion()",
-                "modalContent()", "visible()", "hidden()"
-            ],
-            "example": """
-            BulkAction::make('publish')
-                ->label('Publish Selected')
-                ->icon('heroicon-o-globe-alt')
-                ->color('success')
-                ->form([
-                    DateTimePicker::make('published_at')
-                        ->label('Publication Date')
-                        ->default(now())
-                        ->required(),
-                    Toggle::make('notify_subscribers')
-                        ->label('Notify Subscribers')
-                        ->default(true),
-                ])
-                ->action(function (Collection $records, array $data): void {
-                    $records->each(function ($record) use ($data): void {
+                        ');
+                    })
+                    ->modalWidth('3xl')
+                    ->modalSubmitAction(false) // Hides the submit button
+                    ->modalFooterActions(function ($record) {
+                        return [
+                            Action::make('edit')
+                                ->label('Edit Post')
+                                ->url(route('posts.edit', $record))
+                                ->color('primary'),
+                        ];
+                    })
+                """
+            },
+            "DeleteAction": {
+                "description": "Delete a record with confirmation",
+                "options": [
+                    "requiresConfirmation()", "modalDescription()",
+                    "modalHeading()", "successRedirectUrl()"
+                ],
+                "example": """
+                DeleteAction::make()
+                    ->requiresConfirmation()
+                    ->modalHeading('Delete Post')
+                    ->modalDescription('Are you sure you want to delete this post? This action cannot be undone.')
+                    ->modalSubmitActionLabel('Yes, delete it')
+                    ->successNotificationTitle('Post deleted')
+                    ->successRedirectUrl(route('posts.index'))
+                    ->after(function ($record) {
+                        // Additional actions after deletion
+                        Activity::create([
+                            'description' => "Deleted post {$record->title}",
+                            'user_id' => auth()->id(),
+                        ]);
+                    })
+                """
+            },
+            "Custom Action": {
+                "description": "Create a custom action with specific behavior",
+                "options": [
+                    "action()", "form()", "fillForm()", "visible()",
+                    "hidden()", "link()", "button()"
+                ],
+                "example": """
+                Action::make('approve')
+                    ->label('Approve')
+                    ->icon('heroicon-o-check')
+                    ->color('success')
+                    ->visible(fn ($record) => $record->status === 'pending')
+                    ->form([
+                        Textarea::make('comment')
+                            ->placeholder('Add an optional comment')
+                            ->columnSpanFull(),
+                    ])
+                    ->action(function (array $data, $record): void {
                         $record->update([
-                            'status' => 'published',
-                            'published_at' => $data['published_at'],
+                            'status' => 'approved',
+                            'approved_at' => now(),
+                            'approved_by' => auth()->id(),
+                            'approval_comment' => $data['comment'],
                         ]);
-                        
-                        if ($data['notify_subscribers']) {
-                            // Send notification logic here
-                        }
-                    });
-                    
-                    Notification::make()
-                        ->title(fn () => "Published {$records->count()} posts")
-                        ->success()
-                        ->send();
-                })
-                ->requiresConfirmation()
-                ->modalHeading('Publish Selected Posts')
-                ->modalDescription('Are you sure you want to publish these posts? They will be visible to all users.')
-                ->modalSubmitActionLabel('Yes, publish them')
-                ->deselectRecordsAfterCompletion()
-            """
-        }
-    },
-    "Header Actions": {
-        "CreateAction": {
-            "description": "Create a new record",
-            "options": [
-                "url()", "form()", "mutateFormDataUsing()",
-                "successRedirectUrl()"
-            ],
-            "example": """
-            CreateAction::make()
-                ->label('New Post')
-                ->icon('heroicon-o-plus')
-                ->form([
-                    TextInput::make('title')->required(),
-                    MarkdownEditor::make('content')->required(),
-                    Select::make('category_id')
-                        ->relationship('category', 'name')
-                        ->required(),
-                ])
-                ->mutateFormDataUsing(function (array $data): array {
-                    $data['user_id'] = auth()->id();
-                    
-                    return $data;
-                })
-                ->successRedirectUrl(fn ($record) => route('posts.edit', $record))
-                ->successNotificationTitle('Post created')
-            """
+
+                        Notification::make()
+                            ->title('Approved successfully')
+                            ->success()
+                            ->send();
+                    })
+                    ->requiresConfirmation()
+                    ->modalHeading('Approve Post')
+                    ->modalDescription('Are you sure you want to approve this post? It will be visible to all users.')
+                    ->modalSubmitActionLabel('Yes, approve')
+                """
+            }
         },
-        "Custom Header Action": {
-            "description": "Create a custom action in the table header",
-            "options": [
-                "url()", "action()", "visible()", "hidden()",
-                "modalContent()", "form()"
-            ],
-            "example": """
-            // Export action
-            Action::make('export')
-                ->label('Export')
-                ->icon('heroicon-o-document-arrow-down')
-                ->color('gray')
-                ->action(function (array $data): void {
-                    // Export logic
-                    Excel::download(new PostsExport($data['format']), "posts.{$data['format']}");
-                    
-                    Notification::make()
-                        ->title('Export started')
-                        ->body('Your export will be available in a few moments.')
-                        ->success()
-                        ->send();
-                })
-                ->form([
-                    Select::make('format')
-                        ->label('Export Format')
-                        ->options([
-                            'csv' => 'CSV',
-                            'xlsx' => 'Excel (XLSX)',
-                            'pdf' => 'PDF',
-                        ])
-                        ->default('csv')
-                        ->required(),
-                ])
-            """
+        "Bulk Actions": {
+            "DeleteBulkAction": {
+                "description": "Delete multiple records at once",
+                "options": [
+                    "requiresConfirmation()", "modalDescription()",
+                    "modalHeading()", "deselectRecordsAfterCompletion()"
+                ],
+                "example": """
+                DeleteBulkAction::make()
+                    ->requiresConfirmation()
+                    ->modalHeading('Delete Selected Posts')
+                    ->modalDescription('Are you sure you want to delete these posts? This action cannot be undone.')
+                    ->modalSubmitActionLabel('Yes, delete them')
+                    ->successNotificationTitle(fn (int $count) => "Deleted {$count} posts")
+                    ->deselectRecordsAfterCompletion()
+                    ->after(function ($records) {
+                        // Additional actions after bulk deletion
+                        Activity::create([
+                            'description' => "Bulk deleted {$records->count()} posts",
+                            'user_id' => auth()->id(),
+                        ]);
+                    })
+                """
+            },
+            "Custom Bulk Action": {
+                "description": "Create a custom action for multiple records",
+                "options": [
+                    "action()", "form()", "deselectRecordsAfterCompletion()",
+                    "modalContent()", "visible()", "hidden()"
+                ],
+                "example": """
+                BulkAction::make('publish')
+                    ->label('Publish Selected')
+                    ->icon('heroicon-o-globe-alt')
+                    ->color('success')
+                    ->form([
+                        DateTimePicker::make('published_at')
+                            ->label('Publication Date')
+                            ->default(now())
+                            ->required(),
+                        Toggle::make('notify_subscribers')
+                            ->label('Notify Subscribers')
+                            ->default(true),
+                    ])
+                    ->action(function (Collection $records, array $data): void {
+                        $records->each(function ($record) use ($data): void {
+                            $record->update([
+                                'status' => 'published',
+                                'published_at' => $data['published_at'],
+                            ]);
+
+                            if ($data['notify_subscribers']) {
+                                // Send notification logic here
+                            }
+                        });
+
+                        Notification::make()
+                            ->title(fn () => "Published {$records->count()} posts")
+                            ->success()
+                            ->send();
+                    })
+                    ->requiresConfirmation()
+                    ->modalHeading('Publish Selected Posts')
+                    ->modalDescription('Are you sure you want to publish these posts? They will be visible to all users.')
+                    ->modalSubmitActionLabel('Yes, publish them')
+                    ->deselectRecordsAfterCompletion()
+                """
+            }
+        },
+        "Header Actions": {
+            "CreateAction": {
+                "description": "Create a new record",
+                "options": [
+                    "url()", "form()", "mutateFormDataUsing()",
+                    "successRedirectUrl()"
+                ],
+                "example": """
+                CreateAction::make()
+                    ->label('New Post')
+                    ->icon('heroicon-o-plus')
+                    ->form([
+                        TextInput::make('title')->required(),
+                        MarkdownEditor::make('content')->required(),
+                        Select::make('category_id')
+                            ->relationship('category', 'name')
+                            ->required(),
+                    ])
+                    ->mutateFormDataUsing(function (array $data): array {
+                        $data['user_id'] = auth()->id();
+
+                        return $data;
+                    })
+                    ->successRedirectUrl(fn ($record) => route('posts.edit', $record))
+                    ->successNotificationTitle('Post created')
+                """
+            },
+            "Custom Header Action": {
+                "description": "Create a custom action in the table header",
+                "options": [
+                    "url()", "action()", "visible()", "hidden()",
+                    "modalContent()", "form()"
+                ],
+                "example": """
+                // Export action
+                Action::make('export')
+                    ->label('Export')
+                    ->icon('heroicon-o-document-arrow-down')
+                    ->color('gray')
+                    ->action(function (array $data): void {
+                        // Export logic
+                        Excel::download(new PostsExport($data['format']), "posts.{$data['format']}");
+
+                        Notification::make()
+                            ->title('Export started')
+                            ->body('Your export will be available in a few moments.')
+                            ->success()
+                            ->send();
+                    })
+                    ->form([
+                        Select::make('format')
+                            ->label('Export Format')
+                            ->options([
+                                'csv' => 'CSV',
+                                'xlsx' => 'Excel (XLSX)',
+                                'pdf' => 'PDF',
+                            ])
+                            ->default('csv')
+                            ->required(),
+                    ])
+                """
+            }
         }
     }
-}
 
 # Advanced Table Features
-ADVANCED_TABLE_FEATURES = {
-    "Table Configuration": {
-        "description": "Configure advanced table behavior",
-        "example": """
-        public static function table(Table $table): Table
-        {
-            return $table
-                ->columns([
-                    // ... columns
-                ])
+def _build_advanced_table_features():
+    """Build the ADVANCED_TABLE_FEATURES section"""
+    return {
+        "Table Configuration": {
+            "description": "Configure advanced table behavior",
+            "example": _table_method_example("""
                 ->filters([
                     // ... filters
                 ])
@@ -780,18 +792,11 @@ ADVANCED_TABLE_FEATURES = {
                         ->icon('heroicon-o-plus')
                         ->button(),
                 ]);
-        }
-        """
-    },
-    "Record URLs": {
-        "description": "Configure clickable records in the table",
-        "example": """
-        public static function table(Table $table): Table
-        {
-            return $table
-                ->columns([
-                    // ... columns
-                ])
+                """)
+        },
+        "Record URLs": {
+            "description": "Configure clickable records in the table",
+            "example": _table_method_example("""
                 ->recordUrl(
                     fn ($record) => route('posts.edit', $record)
                 )
@@ -804,18 +809,11 @@ ADVANCED_TABLE_FEATURES = {
                             ->record($record);
                     }
                 );
-        }
-        """
-    },
-    "Custom Views": {
-        "description": "Customize how records are displayed (list, grid, etc.)",
-        "example": """
-        public static function table(Table $table): Table
-        {
-            return $table
-                ->columns([
-                    // ... columns
-                ])
+                """)
+        },
+        "Custom Views": {
+            "description": "Customize how records are displayed (list, grid, etc.)",
+            "example": _table_method_example("""
                 ->defaultView('grid') // Default to grid view
                 ->views([
                     Tables\Views\ListView::make()
@@ -839,20 +837,236 @@ ADVANCED_TABLE_FEATURES = {
                             // Kanban-specific columns
                         ]),
                 ]);
+                """)
         }
-        """
     }
+
+# Sections are built on first access instead of at import, so callers only
+# pay for the sections they actually use
+_SECTION_BUILDERS = {
+    "TABLE_COLUMNS": _build_table_columns,
+    "TABLE_FILTERS": _build_table_filters,
+    "TABLE_ACTIONS": _build_table_actions,
+    "ADVANCED_TABLE_FEATURES": _build_advanced_table_features
 }
 
+__all__ = [
+    "TABLE_BUILDER_OVERVIEW",
+    "TABLE_COLUMNS",
+    "TABLE_FILTERS",
+    "TABLE_ACTIONS",
+    "ADVANCED_TABLE_FEATURES",
+    "TABLE_COLUMN_CATEGORIES",
+    "TABLE_FILTER_CATEGORIES",
+    "TABLE_ACTION_CATEGORIES",
+    "ADVANCED_TABLE_FEATURE_NAMES",
+    "ADVANCED_TABLE_FEATURE_ITEMS",
+    "TableEntry",
+    "get_table_builder_knowledge",
+    "get_column",
+    "get_filter",
+    "get_action",
+    "get_feature"
+]
+
+
+@dataclass(frozen=True, slots=True)
+class TableEntry:
+    """A single component or feature of the table builder knowledge base"""
+    
+    description: str
+    example: str
+    # Commonly chained methods; empty for entries that only show an example
+    options: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, entry):
+        """Build an entry from a section literal's leaf dict"""
+        options = entry.get("common_options", entry.get("options", ()))
+        return cls(entry["description"], entry["example"], options)
+
+
+# Option lists repeat the same method names ("sortable()", "searchable()")
+# across many entries, so they are stored as tuples of interned strings and
+# identical tuples are shared between entries and sections
+_OPTION_KEYS = ("common_options", "options")
+_SHARED_OPTIONS = {}
+# Flyweight table for text values: identical descriptions and examples
+# resolve to one string object, whichever section they come from
+_SHARED_TEXT = {}
+
+
+def _finalize_section(section):
+    """
+    Normalize a freshly built table builder section into its read-only form.
+    
+    PHP examples are dedented and routed through _SHARED_TEXT, since many
+    columns, filters and actions repeat the same snippet. common_options /
+    options lists become shared tuples of interned method names, any dict
+    with an "example" becomes a TableEntry, and the category dicts around
+    them become MappingProxyType views.
+    """
+    finalized = {}
+    for key, value in section.items():
+        if isinstance(value, str):
+            value = textwrap.dedent(value).strip("\n")
+            value = _SHARED_TEXT.setdefault(value, value)
+        elif isinstance(value, dict):
+            value = _finalize_section(value)
+            if "example" in value:
+                value = TableEntry.from_dict(value)
+        elif key in _OPTION_KEYS:
+            options = tuple(sys.intern(option) for option in value)
+            value = _SHARED_OPTIONS.setdefault(options, options)
+        finalized[sys.intern(key)] = value
+    return MappingProxyType(finalized)
+
+
+# Category / feature names of each section, precomputed so listing them
+# does not allocate a fresh list on every call
+_SECTION_KEYS = {
+    "TABLE_COLUMN_CATEGORIES": "TABLE_COLUMNS",
+    "TABLE_FILTER_CATEGORIES": "TABLE_FILTERS",
+    "TABLE_ACTION_CATEGORIES": "TABLE_ACTIONS",
+    "ADVANCED_TABLE_FEATURE_NAMES": "ADVANCED_TABLE_FEATURES"
+}
+
+
+# Ordered (name, entry) pairs of the flat advanced features section, for
+# rendering every feature in order without going through the mapping
+_SECTION_ITEMS = {
+    "ADVANCED_TABLE_FEATURE_ITEMS": "ADVANCED_TABLE_FEATURES"
+}
+
+
+def _build(name):
+    """Build a table builder section, or a name / item tuple derived from one"""
+    builder = _SECTION_BUILDERS.get(name)
+    if builder is not None:
+        return _finalize_section(builder())
+    if name in _SECTION_KEYS:
+        return tuple(_section(_SECTION_KEYS[name]))
+    return tuple(_section(_SECTION_ITEMS[name]).items())
+
+
+_SECTIONS = LazySections(globals(), _build, (*_SECTION_BUILDERS, *_SECTION_KEYS, *_SECTION_ITEMS))
+__getattr__ = _SECTIONS.module_getattr
+_section = _SECTIONS.get
+
+
+def _component_index(section_name):
+    """Flatten a category -> component section into {component: (category, entry)}"""
+    return {
+        component: (category, entry)
+        for category, components in _section(section_name).items()
+        for component, entry in components.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _column_index():
+    return _component_index("TABLE_COLUMNS")
+
+
+@lru_cache(maxsize=None)
+def _filter_index():
+    return _component_index("TABLE_FILTERS")
+
+
+@lru_cache(maxsize=None)
+def _action_index():
+    return _component_index("TABLE_ACTIONS")
+
+
+def get_column(name):
+    """
+    Look up a table column by component name, e.g. "TextColumn"
+    
+    Returns:
+        tuple: (category, TableEntry), or None if the column is unknown
+    """
+    return _column_index().get(name)
+
+
+def get_filter(name):
+    """
+    Look up a table filter by component name, e.g. "SelectFilter"
+    
+    Returns:
+        tuple: (category, TableEntry), or None if the filter is unknown
+    """
+    return _filter_index().get(name)
+
+
+def get_action(name):
+    """
+    Look up a table action by component name, e.g. "EditAction"
+    
+    Returns:
+        tuple: (category, TableEntry), or None if the action is unknown
+    """
+    return _action_index().get(name)
+
+
+# get_table_builder_knowledge() keys and the section each one reads
+_KNOWLEDGE_SECTIONS = {
+    "overview": "TABLE_BUILDER_OVERVIEW",
+    "columns": "TABLE_COLUMNS",
+    "filters": "TABLE_FILTERS",
+    "actions": "TABLE_ACTIONS",
+    "advanced_features": "ADVANCED_TABLE_FEATURES"
+}
+
+_KNOWLEDGE = LazyKnowledge(_SECTIONS, _KNOWLEDGE_SECTIONS)
+
+
+# Flat (section, name) -> value index over the knowledge base, so a lookup
+# is one hash probe instead of two nested mapping lookups. Sections are
+# indexed the first time they are queried, keeping unused sections unbuilt.
+_FEATURE_INDEX = {}
+_INDEXED_SECTIONS = set()
+
+
+def _index_section(section):
+    """Add every top-level entry of a knowledge base section to _FEATURE_INDEX"""
+    entries = _KNOWLEDGE[section]
+    if isinstance(entries, Mapping):
+        for name, entry in entries.items():
+            _FEATURE_INDEX[(section, name)] = entry
+    _INDEXED_SECTIONS.add(section)
+
+
+@lru_cache(maxsize=64)
+def get_feature(section, name):
+    """
+    Look up an entry of the table builder knowledge base in one step
+    
+    Equivalent to get_table_builder_knowledge()[section][name]. Recently
+    requested entries are served from an LRU cache; values are read-only,
+    so sharing the cached references is safe.
+    
+    Args:
+        section (str): Knowledge base key, e.g. "columns" or "advanced_features"
+        name (str): Category or feature name within the section, e.g. "Record URLs"
+        
+    Returns:
+        The category mapping or TableEntry stored under that name
+        
+    Raises:
+        KeyError: If the section or name is unknown
+    """
+    key = (section, name)
+    if key not in _FEATURE_INDEX and section not in _INDEXED_SECTIONS:
+        _index_section(section)
+    return _FEATURE_INDEX[key]
+
+
 # Function to get the table builder knowledge
-def get_table_builder_knowledge() -> Dict[str, Any]:
+def get_table_builder_knowledge() -> Mapping[str, Any]:
     """
     Returns the comprehensive FilamentPHP table builder knowledge base
+    
+    The same read-only mapping is returned on every call; each section is
+    only built when it is first looked up.
     """
-    return {
-        "overview": TABLE_BUILDER_OVERVIEW,
-        "columns": TABLE_COLUMNS,
-        "filters": TABLE_FILTERS,
-        "actions": TABLE_ACTIONS,
-        "advanced_features": ADVANCED_TABLE_FEATURES
-    } 
\ No newline at end of file
+    return _KNOWLEDGE
@@ -5,25 +5,22 @@ This module provides a knowledge base of common Larecipe documentation patterns
 and structures for Laravel applications.
 """
 
-from typing import Dict, List, Any
-
-
-class LarecipeDocumentationPatterns:
-    """Knowledge base for Larecipe documentation patterns."""
-    
-    @staticmethod
-    def get_patterns() -> Dict[str, Any]:
-        """
-        Get all Larecipe documentation patterns.
-        
-        Returns:
-            Dictionary of documentation patterns categorized by type
-        """
-        return {
-            "page_structure": {
-                "basic_page": {
-                    "description": "Basic documentation page structure",
-                    "pattern": """# {page_title}
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple
+
+
+# Documentation patterns, built once at import and shared by every lookup
+_PATTERNS = {
+    "page_structure": {
+        "basic_page": {
+            "description": "Basic documentation page structure",
+            "pattern": """# {page_title}
 
 {page_description}
 
@@ -38,11 +35,11 @@ class LarecipeDocumentationPatterns:
 ## {section_title_2}
 
 {section_content_2}""",
-                    "when_to_use": "For standard documentation pages with multiple sections"
-                },
-                "api_page": {
-                    "description": "API documentation page structure",
-                    "pattern": """# API Reference
+            "when_to_use": "For standard documentation pages with multiple sections"
+        },
+        "api_page": {
+            "description": "API documentation page structure",
+            "pattern": """# API Reference
 
 {api_description}
 
@@ -88,11 +85,11 @@ class LarecipeDocumentationPatterns:
 ```
 
 {example_usage}""",
-                    "when_to_use": "For documenting API endpoints with request/response examples"
-                },
-                "guide_page": {
-                    "description": "Step-by-step guide page structure",
-                    "pattern": """# {guide_title}
+            "when_to_use": "For documenting API endpoints with request/response examples"
+        },
+        "guide_page": {
+            "description": "Step-by-step guide page structure",
+            "pattern": """# {guide_title}
 
 {guide_description}
 
@@ -117,13 +114,13 @@ class LarecipeDocumentationPatterns:
 ## Conclusion
 
 {conclusion}""",
-                    "when_to_use": "For creating tutorials and how-to guides"
-                }
-            },
-            "components": {
-                "badges": {
-                    "description": "Colored badges for visual highlighting",
-                    "pattern": """<larecipe-badge type="primary">Primary</larecipe-badge>
+            "when_to_use": "For creating tutorials and how-to guides"
+        }
+    },
+    "components": {
+        "badges": {
+            "description": "Colored badges for visual highlighting",
+            "pattern": """<larecipe-badge type="primary">Primary</larecipe-badge>
 <larecipe-badge type="secondary">Secondary</larecipe-badge>
 <larecipe-badge type="success">Success</larecipe-badge>
 <larecipe-badge type="danger">Danger</larecipe-badge>
@@ -131,11 +128,11 @@ class LarecipeDocumentationPatterns:
 <larecipe-badge type="info">Info</larecipe-badge>
 <larecipe-badge type="light">Light</larecipe-badge>
 <larecipe-badge type="dark">Dark</larecipe-badge>""",
-                    "when_to_use": "For highlighting important information or statuses"
-                },
-                "cards": {
-                    "description": "Card components for grouping related content",
-                    "pattern": """<larecipe-card>
+            "when_to_use": "For highlighting important information or statuses"
+        },
+        "cards": {
+            "description": "Card components for grouping related content",
+            "pattern": """<larecipe-card>
     <larecipe-badge type="success" circle class="mr-3" icon="fa fa-book"></larecipe-badge>
     <div>
         <h3 class="text-primary">{card_title}</h3>
@@ -145,11 +142,11 @@ class LarecipeDocumentationPatterns:
         <a href="{link}" class="text-primary font-bold">Read More &rarr;</a>
     </template>
 </larecipe-card>""",
-                    "when_to_use": "For creating visually appealing content cards with call-to-actions"
-                },
-                "tabs": {
-                    "description": "Tab components for organizing related content",
-                    "pattern": """<larecipe-tabs>
+            "when_to_use": "For creating visually appealing content cards with call-to-actions"
+        },
+        "tabs": {
+            "description": "Tab components for organizing related content",
+            "pattern": """<larecipe-tabs>
     <larecipe-tab name="{tab_1_name}">
         {tab_1_content}
     </larecipe-tab>
@@ -162,11 +159,11 @@ class LarecipeDocumentationPatterns:
         {tab_3_content}
     </larecipe-tab>
 </larecipe-tabs>""",
-                    "when_to_use": "For displaying alternative approaches or examples"
-                },
-                "accordions": {
-                    "description": "Accordion components for collapsible content",
-                    "pattern": """<larecipe-accordions>
+            "when_to_use": "For displaying alternative approaches or examples"
+        },
+        "accordions": {
+            "description": "Accordion components for collapsible content",
+            "pattern": """<larecipe-accordions>
     <larecipe-accordion name="{accordion_1_title}">
         {accordion_1_content}
     </larecipe-accordion>
@@ -175,11 +172,11 @@ class LarecipeDocumentationPatterns:
         {accordion_2_content}
     </larecipe-accordion>
 </larecipe-accordions>""",
-                    "when_to_use": "For FAQ sections or content that can be collapsed"
-                },
-                "alerts": {
-                    "description": "Alert components for important notifications",
-                    "pattern": """<larecipe-alert type="primary">
+            "when_to_use": "For FAQ sections or content that can be collapsed"
+        },
+        "alerts": {
+            "description": "Alert components for important notifications",
+            "pattern": """<larecipe-alert type="primary">
     {alert_content}
 </larecipe-alert>
 
@@ -210,13 +207,13 @@ class LarecipeDocumentationPatterns:
 <larecipe-alert type="dark">
     {alert_content}
 </larecipe-alert>""",
-                    "when_to_use": "For highlighting important information, warnings, or notices"
-                }
-            },
-            "elements": {
-                "code_blocks": {
-                    "description": "Code block examples",
-                    "pattern": """```php
+            "when_to_use": "For highlighting important information, warnings, or notices"
+        }
+    },
+    "elements": {
+        "code_blocks": {
+            "description": "Code block examples",
+            "pattern": """```php
 // PHP code example
 public function example()
 {
@@ -235,20 +232,20 @@ function example() {
 # Shell command example
 php artisan make:model Post --migration
 ```""",
-                    "when_to_use": "For showing code examples in different languages"
-                },
-                "tables": {
-                    "description": "Markdown tables for structured data",
-                    "pattern": """| Column 1 | Column 2 | Column 3 |
+            "when_to_use": "For showing code examples in different languages"
+        },
+        "tables": {
+            "description": "Markdown tables for structured data",
+            "pattern": """| Column 1 | Column 2 | Column 3 |
 |----------|----------|----------|
 | Row 1    | Value    | Value    |
 | Row 2    | Value    | Value    |
 | Row 3    | Value    | Value    |""",
-                    "when_to_use": "For displaying structured data in a tabular format"
-                },
-                "lists": {
-                    "description": "Ordered and unordered lists",
-                    "pattern": """- Unordered list item 1
+            "when_to_use": "For displaying structured data in a tabular format"
+        },
+        "lists": {
+            "description": "Ordered and unordered lists",
+            "pattern": """- Unordered list item 1
 - Unordered list item 2
   - Nested item 2.1
   - Nested item 2.2
@@ -259,29 +256,29 @@ php artisan make:model Post --migration
    1. Nested item 2.1
    2. Nested item 2.2
 3. Ordered list item 3""",
-                    "when_to_use": "For sequential steps or itemized information"
-                },
-                "links": {
-                    "description": "Internal and external links",
-                    "pattern": """[Link to internal page](/docs/{version}/page)
+            "when_to_use": "For sequential steps or itemized information"
+        },
+        "links": {
+            "description": "Internal and external links",
+            "pattern": """[Link to internal page](/docs/{version}/page)
 
 [Link to section](#section-name)
 
 [Link to external site](https://example.com)""",
-                    "when_to_use": "For navigational elements and references"
-                },
-                "images": {
-                    "description": "Image inclusion examples",
-                    "pattern": """![Alt text](/storage/docs/{image})
+            "when_to_use": "For navigational elements and references"
+        },
+        "images": {
+            "description": "Image inclusion examples",
+            "pattern": """![Alt text](/storage/docs/{image})
 
 <img src="/storage/docs/{image}" alt="Alt text" class="w-full">""",
-                    "when_to_use": "For including screenshots, diagrams, or illustrations"
-                }
-            },
-            "api_documentation": {
-                "endpoint_doc": {
-                    "description": "API endpoint documentation",
-                    "pattern": """<a name="endpoint-{endpoint_anchor}"></a>
+            "when_to_use": "For including screenshots, diagrams, or illustrations"
+        }
+    },
+    "api_documentation": {
+        "endpoint_doc": {
+            "description": "API endpoint documentation",
+            "pattern": """<a name="endpoint-{endpoint_anchor}"></a>
 ### {endpoint_name}
 
 {endpoint_description}
@@ -329,11 +326,11 @@ php artisan make:model Post --migration
 ```php
 {example_code}
 ```""",
-                    "when_to_use": "For documenting individual API endpoints"
-                },
-                "response_codes": {
-                    "description": "API response codes documentation",
-                    "pattern": """## Response Codes
+            "when_to_use": "For documenting individual API endpoints"
+        },
+        "response_codes": {
+            "description": "API response codes documentation",
+            "pattern": """## Response Codes
 
 | Code | Description |
 |------|-------------|
@@ -347,11 +344,11 @@ php artisan make:model Post --migration
 | 422  | Unprocessable Entity - Validation failed |
 | 429  | Too Many Requests - Rate limit exceeded |
 | 500  | Internal Server Error - Server encountered an error |""",
-                    "when_to_use": "For explaining API response status codes"
-                },
-                "authentication_doc": {
-                    "description": "API authentication documentation",
-                    "pattern": """## Authentication
+            "when_to_use": "For explaining API response status codes"
+        },
+        "authentication_doc": {
+            "description": "API authentication documentation",
+            "pattern": """## Authentication
 
 {auth_description}
 
@@ -376,13 +373,13 @@ Authorization: Bearer {your_token}
 ### Revoking Tokens
 
 {revoke_instructions}""",
-                    "when_to_use": "For documenting API authentication methods"
-                }
-            },
-            "configuration": {
-                "env_variables": {
-                    "description": "Environment variables documentation",
-                    "pattern": """## Environment Variables
+            "when_to_use": "For documenting API authentication methods"
+        }
+    },
+    "configuration": {
+        "env_variables": {
+            "description": "Environment variables documentation",
+            "pattern": """## Environment Variables
 
 The following environment variables can be configured in your `.env` file:
 
@@ -395,11 +392,11 @@ The following environment variables can be configured in your `.env` file:
 ```
 {example_env}
 ```""",
-                    "when_to_use": "For documenting available environment variables"
-                },
-                "config_files": {
-                    "description": "Configuration files documentation",
-                    "pattern": """## Configuration Files
+            "when_to_use": "For documenting available environment variables"
+        },
+        "config_files": {
+            "description": "Configuration files documentation",
+            "pattern": """## Configuration Files
 
 ### {config_name}
 
@@ -412,13 +409,13 @@ The `config/{config_file}.php` file contains the following options:
 ### Custom Configuration
 
 {custom_config_instructions}""",
-                    "when_to_use": "For documenting application configuration files"
-                }
-            },
-            "navigation": {
-                "sidebar": {
-                    "description": "Documentation sidebar navigation",
-                    "pattern": """- ## Getting Started
+            "when_to_use": "For documenting application configuration files"
+        }
+    },
+    "navigation": {
+        "sidebar": {
+            "description": "Documentation sidebar navigation",
+            "pattern": """- ## Getting Started
   - [Introduction](/docs/{version}/introduction)
   - [Installation](/docs/{version}/installation)
   - [Configuration](/docs/{version}/configuration)
@@ -445,11 +442,11 @@ The `config/{config_file}.php` file contains the following options:
   - [Authentication](/docs/{version}/api-auth)
   - [Resources](/docs/{version}/api-resources)
   - [Endpoints](/docs/{version}/api-endpoints)""",
-                    "when_to_use": "For creating the main documentation navigation sidebar"
-                },
-                "versioning": {
-                    "description": "Documentation version configuration",
-                    "pattern": """<?php
+            "when_to_use": "For creating the main documentation navigation sidebar"
+        },
+        "versioning": {
+            "description": "Documentation version configuration",
+            "pattern": """<?php
 
 return [
     /*
@@ -469,13 +466,148 @@ return [
 
     'default' => '2.0',
 ];""",
-                    "when_to_use": "For configuring multiple documentation versions"
-                }
-            }
+            "when_to_use": "For configuring multiple documentation versions"
         }
+    }
+}
+
+
+# Keys ("description", "pattern", "when_to_use") and short labels repeat
+# across entries; interning them shares one object per distinct string
+_INTERN_MAX_LENGTH = 64
+
+
+def _intern(value):
+    """
+    Recursively intern the keys and short string values of a pattern tree.
+    
+    Dicts are frozen behind a MappingProxyType and lists become tuples, so
+    the shared tree can be handed to every caller without copying.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(key): _intern(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_intern(item) for item in value)
+    if isinstance(value, str) and len(value) < _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+_PATTERNS = _intern(_PATTERNS)
+
+
+def _index_patterns(patterns):
+    """
+    Flatten the pattern tree into search rows.
+    
+    Each entry that has a description or pattern becomes a
+    (path, description, pattern, entry) row with both texts lowercased, so
+    search_patterns can scan a flat list instead of walking the tree. The
+    tree is walked depth-first with an explicit stack; children are pushed
+    in reverse so rows come out in source order.
+    """
+    rows = []
+    stack = [((key,), value) for key, value in reversed(patterns.items()) if isinstance(value, Mapping)]
+    while stack:
+        path, value = stack.pop()
+        if "description" in value or "pattern" in value:
+            rows.append((
+                path,
+                value.get("description", "").lower(),
+                value.get("pattern", "").lower(),
+                value
+            ))
+        stack.extend(
+            (path + (key,), child)
+            for key, child in reversed(value.items())
+            if isinstance(child, Mapping)
+        )
+    return rows
+
+
+# The lowercased search texts of all rows are packed into one bytes blob,
+# each row as description NUL pattern and rows separated by NUL, so a search
+# is a C-level bytes scan instead of a Python loop over strings. Row i
+# starts at _SEARCH_STARTS[i] and maps back to _SEARCH_ENTRIES[i].
+def _build_search_blob(rows):
+    """Pack index rows into (entries, row start offsets, bytes blob)"""
+    entries = []
+    starts = array("I")
+    texts = []
+    offset = 0
+    for path, description, pattern, entry in rows:
+        text = f"{description}\0{pattern}".encode()
+        entries.append((path, entry))
+        starts.append(offset)
+        texts.append(text)
+        offset += len(text) + 1
+    return entries, starts, b"\0".join(texts)
+
+
+_SEARCH_ENTRIES, _SEARCH_STARTS, _SEARCH_BLOB = _build_search_blob(_index_patterns(_PATTERNS))
+
+
+def _matching_entries(find):
+    """
+    Collect the entries whose search text contains a match.
+    
+    find(start) must return the blob offset of the next match at or after
+    start, or -1. After a hit, scanning resumes at the next row, so each
+    entry is reported once and in source order.
+    """
+    results = []
+    position = find(0)
+    while position != -1:
+        row = bisect_right(_SEARCH_STARTS, position) - 1
+        path, entry = _SEARCH_ENTRIES[row]
+        results.append({"path": list(path), "pattern": entry})
+        if row + 1 == len(_SEARCH_STARTS):
+            break
+        position = find(_SEARCH_STARTS[row + 1])
+    return results
+
+
+@lru_cache(maxsize=128)
+def _compile_queries(queries: Tuple[str, ...]) -> "re.Pattern[bytes]":
+    """Compile search terms into one alternation of literals over the search blob"""
+    return re.compile(b"|".join(re.escape(query.lower().encode()) for query in queries))
+
+
+# Top-level categories, precomputed so listing them allocates nothing per call
+_CATEGORIES = tuple(_PATTERNS)
+
+
+# Shared read-only result for paths that do not exist, instead of a fresh {}
+_EMPTY = MappingProxyType({})
+
+
+@lru_cache(maxsize=256)
+def _resolve(path: Tuple[str, ...]) -> Any:
+    """Follow a path of keys through _PATTERNS, returning _EMPTY if it is missing"""
+    current = _PATTERNS
+    for key in path:
+        if not isinstance(current, Mapping) or key not in current:
+            return _EMPTY
+        current = current[key]
+    return current
+
+
+class LarecipeDocumentationPatterns:
+    """Knowledge base for Larecipe documentation patterns."""
+    
+    @staticmethod
+    def get_patterns() -> Mapping[str, Any]:
+        """
+        Get all Larecipe documentation patterns.
+        
+        Returns:
+            Read-only mapping of documentation patterns categorized by type.
+            The same instance is returned on every call.
+        """
+        return _PATTERNS
     
     @staticmethod
-    def get_pattern_by_path(path: List[str]) -> Dict[str, Any]:
+    def get_pattern_by_path(path: List[str]) -> Mapping[str, Any]:
         """
         Get a specific pattern using a path of keys.
         
@@ -483,28 +615,20 @@ return [
             path: List of keys to traverse the patterns dictionary
             
         Returns:
-            The pattern at the specified path or empty dict if not found
+            The pattern at the specified path or an empty read-only mapping if
+            not found. Lookups are memoized per path.
         """
-        patterns = LarecipeDocumentationPatterns.get_patterns()
-        current = patterns
-        
-        for key in path:
-            if key in current:
-                current = current[key]
-            else:
-                return {}
-                
-        return current
+        return _resolve(tuple(path))
     
     @staticmethod
-    def get_pattern_categories() -> List[str]:
+    def get_pattern_categories() -> Tuple[str, ...]:
         """
         Get all top-level pattern categories.
         
         Returns:
-            List of pattern categories
+            Tuple of pattern categories, shared between calls
         """
-        return list(LarecipeDocumentationPatterns.get_patterns().keys())
+        return _CATEGORIES
     
     @staticmethod
     def search_patterns(query: str) -> List[Dict[str, Any]]:
@@ -515,31 +639,28 @@ return [
             query: Search term
             
         Returns:
-            List of matching patterns with their paths
+            List of matching patterns (read-only mappings) with their paths
+        """
+        query = query.lower().encode()
+        return _matching_entries(lambda start: _SEARCH_BLOB.find(query, start))
+    
+    @staticmethod
+    def search_patterns_multi(queries: List[str]) -> List[Dict[str, Any]]:
+        """
+        Search patterns for any of several terms in a single pass.
+        
+        Args:
+            queries: Search terms; an entry matches if it contains any of them
+            
+        Returns:
+            List of matching patterns with their paths, as search_patterns
         """
-        results = []
-        patterns = LarecipeDocumentationPatterns.get_patterns()
+        if not queries:
+            return []
+        matcher = _compile_queries(tuple(queries))
         
-        def search_recursive(current: Dict[str, Any], path: List[str] = None):
-            if path is None:
-                path = []
-                
-            for key, value in current.items():
-                current_path = path + [key]
-                
-                if isinstance(value, dict):
-                    if "description" in value and query.lower() in value["description"].lower():
-                        results.append({
-                            "path": current_path,
-                            "pattern": value
-                        })
-                    elif "pattern" in value and query.lower() in value["pattern"].lower():
-                        results.append({
-                            "path": current_path,
-                            "pattern": value
-                        })
-                    else:
-                        search_recursive(value, current_path)
+        def find(start):
+            match = matcher.search(_SEARCH_BLOB, start)
+            return match.start() if match else -1
         
-        search_recursive(patterns)
-        return results 
\ No newline at end of file
+        return _matching_entries(find)
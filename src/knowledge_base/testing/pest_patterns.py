@@ -5,33 +5,41 @@ This module provides a knowledge base of common Laravel Pest testing patterns
 for different types of tests.
 """
 
-from typing import Dict, List, Any
+import re
+import sys
+from bisect import bisect_right
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple
 
 
-class LaravelPestPatterns:
-    """Knowledge base for Laravel Pest testing patterns."""
-    
-    @staticmethod
-    def get_patterns() -> Dict[str, Any]:
-        """
-        Get all Pest testing patterns.
-        
-        Returns:
-            Dictionary of testing patterns categorized by test type
-        """
-        return {
-            "feature_tests": {
-                "http_tests": {
-                    "basic_controller_test": {
-                        "description": "Test a basic controller endpoint",
-                        "pattern": """<?php
+# Test file prologues shared by several patterns
+_REFRESH_DATABASE_HEADER = """<?php
+
+use Illuminate\\Foundation\\Testing\\RefreshDatabase;
+
+uses(RefreshDatabase::class);
+
+"""
+_USER_REFRESH_DATABASE_HEADER = """<?php
 
 use App\\Models\\User;
 use Illuminate\\Foundation\\Testing\\RefreshDatabase;
 
 uses(RefreshDatabase::class);
 
-test('can view page', function () {
+"""
+
+# Each top-level category is built by its own loader on first use (see
+# _category), so callers that only need one category never build the others
+def _load_feature_tests() -> Dict[str, Any]:
+    """Build the feature_tests pattern category"""
+    return {
+        "http_tests": {
+            "basic_controller_test": {
+                "description": "Test a basic controller endpoint",
+                "pattern": _USER_REFRESH_DATABASE_HEADER + """test('can view page', function () {
     // Arrange
     $user = User::factory()->create();
     
@@ -42,18 +50,11 @@ test('can view page', function () {
     $response->assertStatus(200);
     $response->assertViewIs('{view}');
 });""",
-                        "when_to_use": "When testing basic controller endpoints that return views"
-                    },
-                    "api_endpoint_test": {
-                        "description": "Test a JSON API endpoint",
-                        "pattern": """<?php
-
-use App\\Models\\User;
-use Illuminate\\Foundation\\Testing\\RefreshDatabase;
-
-uses(RefreshDatabase::class);
-
-test('can fetch data from API', function () {
+                "when_to_use": "When testing basic controller endpoints that return views"
+            },
+            "api_endpoint_test": {
+                "description": "Test a JSON API endpoint",
+                "pattern": _USER_REFRESH_DATABASE_HEADER + """test('can fetch data from API', function () {
     // Arrange
     $user = User::factory()->create();
     
@@ -76,18 +77,11 @@ test('can fetch data from API', function () {
                  ]
              ]);
 });""",
-                        "when_to_use": "When testing API endpoints that return JSON responses"
-                    },
-                    "form_submission_test": {
-                        "description": "Test a form submission",
-                        "pattern": """<?php
-
-use App\\Models\\User;
-use Illuminate\\Foundation\\Testing\\RefreshDatabase;
-
-uses(RefreshDatabase::class);
-
-test('can submit form', function () {
+                "when_to_use": "When testing API endpoints that return JSON responses"
+            },
+            "form_submission_test": {
+                "description": "Test a form submission",
+                "pattern": _USER_REFRESH_DATABASE_HEADER + """test('can submit form', function () {
     // Arrange
     $user = User::factory()->create();
     
@@ -105,17 +99,11 @@ test('can submit form', function () {
         'field2' => 'value2',
     ]);
 });""",
-                        "when_to_use": "When testing form submissions that store data in the database"
-                    },
-                    "authentication_test": {
-                        "description": "Test authentication requirements",
-                        "pattern": """<?php
-
-use Illuminate\\Foundation\\Testing\\RefreshDatabase;
-
-uses(RefreshDatabase::class);
-
-test('guests cannot access protected page', function () {
+                "when_to_use": "When testing form submissions that store data in the database"
+            },
+            "authentication_test": {
+                "description": "Test authentication requirements",
+                "pattern": _REFRESH_DATABASE_HEADER + """test('guests cannot access protected page', function () {
     // Act
     $response = $this->get('{route}');
     
@@ -134,11 +122,11 @@ test('authenticated users can access protected page', function () {
     // Assert
     $response->assertStatus(200);
 });""",
-                        "when_to_use": "When testing routes that require authentication"
-                    },
-                    "authorization_test": {
-                        "description": "Test authorization policies",
-                        "pattern": """<?php
+                "when_to_use": "When testing routes that require authentication"
+            },
+            "authorization_test": {
+                "description": "Test authorization policies",
+                "pattern": """<?php
 
 use App\\Models\\User;
 use App\\Models\\{Model};
@@ -169,18 +157,11 @@ test('users can only access their own resources', function () {
     // Assert
     $response2->assertStatus(403);
 });""",
-                        "when_to_use": "When testing routes that implement authorization policies"
-                    },
-                    "validation_test": {
-                        "description": "Test request validation",
-                        "pattern": """<?php
-
-use App\\Models\\User;
-use Illuminate\\Foundation\\Testing\\RefreshDatabase;
-
-uses(RefreshDatabase::class);
-
-test('validation errors are returned', function () {
+                "when_to_use": "When testing routes that implement authorization policies"
+            },
+            "validation_test": {
+                "description": "Test request validation",
+                "pattern": _USER_REFRESH_DATABASE_HEADER + """test('validation errors are returned', function () {
     // Arrange
     $user = User::factory()->create();
     
@@ -210,15 +191,19 @@ test('validation passes with correct data', function () {
     $response->assertSessionHasNoErrors();
     $response->assertRedirect();
 });""",
-                        "when_to_use": "When testing request validation rules"
-                    }
-                }
-            },
-            "unit_tests": {
-                "service_tests": {
-                    "basic_service_test": {
-                        "description": "Test a service class method",
-                        "pattern": """<?php
+                "when_to_use": "When testing request validation rules"
+            }
+        }
+    }
+
+
+def _load_unit_tests() -> Dict[str, Any]:
+    """Build the unit_tests pattern category"""
+    return {
+        "service_tests": {
+            "basic_service_test": {
+                "description": "Test a service class method",
+                "pattern": """<?php
 
 use App\\Services\\{Service};
 
@@ -232,11 +217,11 @@ test('{service} can perform action', function () {
     // Assert
     expect($result)->toBe({expected});
 });""",
-                        "when_to_use": "When testing simple service methods without dependencies"
-                    },
-                    "service_with_dependencies_test": {
-                        "description": "Test a service with dependencies",
-                        "pattern": """<?php
+                "when_to_use": "When testing simple service methods without dependencies"
+            },
+            "service_with_dependencies_test": {
+                "description": "Test a service with dependencies",
+                "pattern": """<?php
 
 use App\\Services\\{Service};
 use App\\Contracts\\{DependencyInterface};
@@ -258,13 +243,13 @@ test('{service} uses dependencies correctly', function () {
     // Assert
     expect($result)->toBe({expected});
 });""",
-                        "when_to_use": "When testing services that have dependencies which should be mocked"
-                    }
-                },
-                "model_tests": {
-                    "model_attributes_test": {
-                        "description": "Test model attributes and casting",
-                        "pattern": """<?php
+                "when_to_use": "When testing services that have dependencies which should be mocked"
+            }
+        },
+        "model_tests": {
+            "model_attributes_test": {
+                "description": "Test model attributes and casting",
+                "pattern": """<?php
 
 use App\\Models\\{Model};
 
@@ -289,11 +274,11 @@ test('{model} casts attributes correctly', function () {
     expect(${model}->{date_attribute})->toBeInstanceOf(\\Carbon\\Carbon::class);
     expect(${model}->{boolean_attribute})->toBeTrue();
 });""",
-                        "when_to_use": "When testing model attribute casting and accessors"
-                    },
-                    "model_relationships_test": {
-                        "description": "Test model relationships",
-                        "pattern": """<?php
+                "when_to_use": "When testing model attribute casting and accessors"
+            },
+            "model_relationships_test": {
+                "description": "Test model relationships",
+                "pattern": """<?php
 
 use App\\Models\\{Model};
 use App\\Models\\{RelatedModel};
@@ -322,11 +307,11 @@ test('{model} has many {related_models}', function () {
     // Assert
     expect(${model}->{relationship})->toHaveCount(3);
 });""",
-                        "when_to_use": "When testing model relationships like hasMany, belongsTo, etc."
-                    },
-                    "model_scopes_test": {
-                        "description": "Test model query scopes",
-                        "pattern": """<?php
+                "when_to_use": "When testing model relationships like hasMany, belongsTo, etc."
+            },
+            "model_scopes_test": {
+                "description": "Test model query scopes",
+                "pattern": """<?php
 
 use App\\Models\\{Model};
 use Illuminate\\Foundation\\Testing\\RefreshDatabase;
@@ -351,13 +336,13 @@ test('{model} scope filters correctly', function () {
     expect($filtered->pluck('{field}')->all())
         ->each(fn ($item) => $item->toBe('{value_1}'));
 });""",
-                        "when_to_use": "When testing model query scopes that filter results"
-                    }
-                },
-                "helper_tests": {
-                    "helper_function_test": {
-                        "description": "Test a helper function",
-                        "pattern": """<?php
+                "when_to_use": "When testing model query scopes that filter results"
+            }
+        },
+        "helper_tests": {
+            "helper_function_test": {
+                "description": "Test a helper function",
+                "pattern": """<?php
 
 test('helper functions correctly', function () {
     // Arrange
@@ -369,15 +354,19 @@ test('helper functions correctly', function () {
     // Assert
     expect($result)->toBe({expected});
 });""",
-                        "when_to_use": "When testing global helper functions"
-                    }
-                }
-            },
-            "integration_tests": {
-                "queue_tests": {
-                    "job_dispatched_test": {
-                        "description": "Test a job is dispatched",
-                        "pattern": """<?php
+                "when_to_use": "When testing global helper functions"
+            }
+        }
+    }
+
+
+def _load_integration_tests() -> Dict[str, Any]:
+    """Build the integration_tests pattern category"""
+    return {
+        "queue_tests": {
+            "job_dispatched_test": {
+                "description": "Test a job is dispatched",
+                "pattern": """<?php
 
 use App\\Jobs\\{Job};
 use Illuminate\\Support\\Facades\\Queue;
@@ -394,13 +383,13 @@ test('job is dispatched', function () {
         return $job->{property} === {expected_value};
     });
 });""",
-                        "when_to_use": "When testing that a job is dispatched with the correct properties"
-                    }
-                },
-                "event_tests": {
-                    "event_dispatched_test": {
-                        "description": "Test an event is dispatched",
-                        "pattern": """<?php
+                "when_to_use": "When testing that a job is dispatched with the correct properties"
+            }
+        },
+        "event_tests": {
+            "event_dispatched_test": {
+                "description": "Test an event is dispatched",
+                "pattern": """<?php
 
 use App\\Events\\{Event};
 use Illuminate\\Support\\Facades\\Event;
@@ -417,13 +406,13 @@ test('event is dispatched', function () {
         return $event->{property} === {expected_value};
     });
 });""",
-                        "when_to_use": "When testing that an event is dispatched with the correct properties"
-                    }
-                },
-                "notification_tests": {
-                    "notification_sent_test": {
-                        "description": "Test a notification is sent",
-                        "pattern": """<?php
+                "when_to_use": "When testing that an event is dispatched with the correct properties"
+            }
+        },
+        "notification_tests": {
+            "notification_sent_test": {
+                "description": "Test a notification is sent",
+                "pattern": """<?php
 
 use App\\Models\\User;
 use App\\Notifications\\{Notification};
@@ -446,13 +435,13 @@ test('notification is sent', function () {
         }
     );
 });""",
-                        "when_to_use": "When testing that a notification is sent to the correct users"
-                    }
-                },
-                "mail_tests": {
-                    "mail_sent_test": {
-                        "description": "Test an email is sent",
-                        "pattern": """<?php
+                "when_to_use": "When testing that a notification is sent to the correct users"
+            }
+        },
+        "mail_tests": {
+            "mail_sent_test": {
+                "description": "Test an email is sent",
+                "pattern": """<?php
 
 use App\\Models\\User;
 use App\\Mail\\{Mailable};
@@ -472,27 +461,25 @@ test('email is sent', function () {
                $mail->{property} === {expected_value};
     });
 });""",
-                        "when_to_use": "When testing that an email is sent with the correct content"
-                    }
-                }
-            },
-            "test_setup": {
-                "test_case_setup": {
-                    "refresh_database": {
-                        "description": "Set up tests with RefreshDatabase",
-                        "pattern": """<?php
-
-use Illuminate\\Foundation\\Testing\\RefreshDatabase;
+                "when_to_use": "When testing that an email is sent with the correct content"
+            }
+        }
+    }
 
-uses(RefreshDatabase::class);
 
-// Your tests here
+def _load_test_setup() -> Dict[str, Any]:
+    """Build the test_setup pattern category"""
+    return {
+        "test_case_setup": {
+            "refresh_database": {
+                "description": "Set up tests with RefreshDatabase",
+                "pattern": _REFRESH_DATABASE_HEADER + """// Your tests here
 """,
-                        "when_to_use": "When tests need a fresh database for each test"
-                    },
-                    "database_transactions": {
-                        "description": "Set up tests with DatabaseTransactions",
-                        "pattern": """<?php
+                "when_to_use": "When tests need a fresh database for each test"
+            },
+            "database_transactions": {
+                "description": "Set up tests with DatabaseTransactions",
+                "pattern": """<?php
 
 use Illuminate\\Foundation\\Testing\\DatabaseTransactions;
 
@@ -500,11 +487,11 @@ uses(DatabaseTransactions::class);
 
 // Your tests here
 """,
-                        "when_to_use": "When tests need database transactions that are rolled back after each test"
-                    },
-                    "with_faker": {
-                        "description": "Set up tests with Faker data generator",
-                        "pattern": """<?php
+                "when_to_use": "When tests need database transactions that are rolled back after each test"
+            },
+            "with_faker": {
+                "description": "Set up tests with Faker data generator",
+                "pattern": """<?php
 
 use Illuminate\\Foundation\\Testing\\WithFaker;
 
@@ -517,11 +504,11 @@ test('can use faker', function () {
     // Test with generated data
 });
 """,
-                        "when_to_use": "When tests need randomly generated data"
-                    },
-                    "custom_test_case": {
-                        "description": "Create a custom test case with shared setup",
-                        "pattern": """<?php
+                "when_to_use": "When tests need randomly generated data"
+            },
+            "custom_test_case": {
+                "description": "Create a custom test case with shared setup",
+                "pattern": """<?php
 
 use Tests\\TestCase;
 use Illuminate\\Foundation\\Testing\\RefreshDatabase;
@@ -536,13 +523,13 @@ uses(TestCase::class, RefreshDatabase::class)->beforeEach(function () {
 
 // Your tests here
 """,
-                        "when_to_use": "When several tests need the same setup and teardown logic"
-                    }
-                },
-                "data_setup": {
-                    "model_factories": {
-                        "description": "Set up test data with model factories",
-                        "pattern": """<?php
+                "when_to_use": "When several tests need the same setup and teardown logic"
+            }
+        },
+        "data_setup": {
+            "model_factories": {
+                "description": "Set up test data with model factories",
+                "pattern": """<?php
 
 use App\\Models\\User;
 use App\\Models\\Post;
@@ -556,11 +543,11 @@ test('example with factories', function () {
     expect($user->posts)->toHaveCount(3);
 });
 """,
-                        "when_to_use": "When tests need complex model relationships"
-                    },
-                    "database_seeding": {
-                        "description": "Seed the database for tests",
-                        "pattern": """<?php
+                "when_to_use": "When tests need complex model relationships"
+            },
+            "database_seeding": {
+                "description": "Seed the database for tests",
+                "pattern": """<?php
 
 use Illuminate\\Foundation\\Testing\\RefreshDatabase;
 use Database\\Seeders\\TestDatabaseSeeder;
@@ -578,32 +565,36 @@ test('database has seeded data', function () {
     ]);
 });
 """,
-                        "when_to_use": "When tests need consistent seed data"
-                    }
-                }
-            },
-            "assertions": {
-                "http_assertions": {
-                    "status_assertions": {
-                        "description": "Assert HTTP response status",
-                        "pattern": """$response->assertStatus(200);
+                "when_to_use": "When tests need consistent seed data"
+            }
+        }
+    }
+
+
+def _load_assertions() -> Dict[str, Any]:
+    """Build the assertions pattern category"""
+    return {
+        "http_assertions": {
+            "status_assertions": {
+                "description": "Assert HTTP response status",
+                "pattern": """$response->assertStatus(200);
 $response->assertOk();
 $response->assertCreated();
 $response->assertNoContent();
 $response->assertForbidden();
 $response->assertNotFound();
 $response->assertUnauthorized();""",
-                        "when_to_use": "When testing HTTP response status codes"
-                    },
-                    "redirect_assertions": {
-                        "description": "Assert HTTP redirects",
-                        "pattern": """$response->assertRedirect('/dashboard');
+                "when_to_use": "When testing HTTP response status codes"
+            },
+            "redirect_assertions": {
+                "description": "Assert HTTP redirects",
+                "pattern": """$response->assertRedirect('/dashboard');
 $response->assertRedirect(route('dashboard'));""",
-                        "when_to_use": "When testing redirects after form submissions"
-                    },
-                    "view_assertions": {
-                        "description": "Assert views and view data",
-                        "pattern": """$response->assertViewIs('user.profile');
+                "when_to_use": "When testing redirects after form submissions"
+            },
+            "view_assertions": {
+                "description": "Assert views and view data",
+                "pattern": """$response->assertViewIs('user.profile');
 $response->assertViewHas('user');
 $response->assertViewHas('user', $user);
 $response->assertViewHasAll([
@@ -611,11 +602,11 @@ $response->assertViewHasAll([
     'posts' => $posts
 ]);
 $response->assertViewMissing('admin');""",
-                        "when_to_use": "When testing that the correct view is rendered with the right data"
-                    },
-                    "json_assertions": {
-                        "description": "Assert JSON responses",
-                        "pattern": """$response->assertJson([
+                "when_to_use": "When testing that the correct view is rendered with the right data"
+            },
+            "json_assertions": {
+                "description": "Assert JSON responses",
+                "pattern": """$response->assertJson([
     'name' => 'John Doe',
     'email' => 'john@example.com',
 ]);
@@ -635,13 +626,13 @@ $response->assertJsonStructure([
 ]);
 
 $response->assertJsonCount(3, 'data');""",
-                        "when_to_use": "When testing API responses that return JSON"
-                    }
-                },
-                "database_assertions": {
-                    "database_has": {
-                        "description": "Assert database records exist",
-                        "pattern": """$this->assertDatabaseHas('users', [
+                "when_to_use": "When testing API responses that return JSON"
+            }
+        },
+        "database_assertions": {
+            "database_has": {
+                "description": "Assert database records exist",
+                "pattern": """$this->assertDatabaseHas('users', [
     'email' => 'john@example.com',
 ]);
 
@@ -656,13 +647,13 @@ $this->assertModelExists($user);
 $this->assertSoftDeleted('posts', [
     'id' => 1,
 ]);""",
-                        "when_to_use": "When testing that database operations succeeded"
-                    }
-                },
-                "pest_expectations": {
-                    "basic_expectations": {
-                        "description": "Basic Pest expectations",
-                        "pattern": """expect($value)->toBe(5);
+                "when_to_use": "When testing that database operations succeeded"
+            }
+        },
+        "pest_expectations": {
+            "basic_expectations": {
+                "description": "Basic Pest expectations",
+                "pattern": """expect($value)->toBe(5);
 expect($value)->toEqual($other);
 expect($value)->toBeTrue();
 expect($value)->toBeFalse();
@@ -671,95 +662,271 @@ expect($value)->not->toBeNull();
 expect($array)->toHaveCount(3);
 expect($array)->toContain('value');
 expect($array)->toContain(fn ($value) => $value > 3);""",
-                        "when_to_use": "For basic value assertions"
-                    },
-                    "object_expectations": {
-                        "description": "Object and collection expectations",
-                        "pattern": """expect($object)->toBeInstanceOf(User::class);
+                "when_to_use": "For basic value assertions"
+            },
+            "object_expectations": {
+                "description": "Object and collection expectations",
+                "pattern": """expect($object)->toBeInstanceOf(User::class);
 expect($object)->toHaveProperty('name');
 expect($object->name)->toBe('John');
 
 expect($collection)->toHaveCount(3);
 expect($collection->pluck('id'))->toContain(5);
 expect($collection)->each(fn ($item) => $item->toBeInstanceOf(User::class));""",
-                        "when_to_use": "When testing objects and collections"
-                    },
-                    "exception_expectations": {
-                        "description": "Exception expectations",
-                        "pattern": """expect(fn () => $service->process())->toThrow(\\Exception::class);
+                "when_to_use": "When testing objects and collections"
+            },
+            "exception_expectations": {
+                "description": "Exception expectations",
+                "pattern": """expect(fn () => $service->process())->toThrow(\\Exception::class);
 expect(fn () => $service->process())->toThrow(\\Exception::class, 'Error message');""",
-                        "when_to_use": "When testing code that should throw exceptions"
-                    }
-                }
+                "when_to_use": "When testing code that should throw exceptions"
             }
         }
-    
-    @staticmethod
-    def get_pattern_by_path(path: List[str]) -> Dict[str, Any]:
-        """
-        Get a specific pattern using a path of keys.
-        
-        Args:
-            path: List of keys to traverse the patterns dictionary
-            
-        Returns:
-            The pattern at the specified path or empty dict if not found
-        """
-        patterns = LaravelPestPatterns.get_patterns()
-        current = patterns
+    }
+
+
+_LOADERS = {
+    "feature_tests": _load_feature_tests,
+    "unit_tests": _load_unit_tests,
+    "integration_tests": _load_integration_tests,
+    "test_setup": _load_test_setup,
+    "assertions": _load_assertions
+}
+
+
+# Values of these keys are short labels, often repeated between entries
+_INTERNED_VALUE_KEYS = frozenset({"description", "when_to_use"})
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert a freshly loaded category into its read-only form.
+    
+    Dicts are frozen behind a MappingProxyType with interned keys, and
+    description / when_to_use values are interned, so the shared tree can
+    be handed to every caller without copying.
+    """
+    if not isinstance(value, dict):
+        return value
+    frozen = {}
+    for key, item in value.items():
+        if key in _INTERNED_VALUE_KEYS and isinstance(item, str):
+            item = sys.intern(item)
+        frozen[sys.intern(key)] = _freeze(item)
+    return MappingProxyType(frozen)
+
+
+@lru_cache(maxsize=None)
+def _category(name: str) -> Mapping[str, Any]:
+    """Load and freeze one pattern category, once"""
+    return _freeze(_LOADERS[name]())
+
+
+@lru_cache(maxsize=1)
+def _all_patterns() -> Mapping[str, Any]:
+    """Build the full pattern tree from every category"""
+    return MappingProxyType({name: _category(name) for name in _LOADERS})
+
+
+@lru_cache(maxsize=None)
+def _path_index(category: str) -> Dict[Tuple[str, ...], Any]:
+    """
+    Map every path within a category to the value it leads to.
+    
+    Paths are relative to the category, so () is the category itself.
+    Built once per category, on its first path lookup.
+    """
+    index = {}
+    stack = [((), _category(category))]
+    while stack:
+        path, value = stack.pop()
+        index[path] = value
+        if isinstance(value, Mapping):
+            stack.extend((path + (key,), child) for key, child in value.items())
+    return index
+
+
+class _PatternColumns:
+    """
+    Column-oriented view of every pattern entry in the tree.
+    
+    Each entry that has a description or pattern gets an id, and every
+    column is indexed by that id. For searching, the lowercased description
+    and pattern of all entries are joined into one corpus string, so a
+    query is a handful of C-level str.find calls instead of a Python-level
+    test per entry. Entries are collected depth-first in source order.
+    """
+    
+    __slots__ = ("paths", "entries", "corpus", "starts")
+    
+    # Separates an entry's description from its pattern, and entries from
+    # each other, so no match can straddle two fields
+    _FIELD_SEPARATOR = "\x1e"
+    _ENTRY_SEPARATOR = "\x1f"
+    
+    def __init__(self, patterns):
+        paths = []
+        entries = []
+        stack = [((key,), value) for key, value in reversed(patterns.items())]
+        while stack:
+            path, value = stack.pop()
+            if "description" in value or "pattern" in value:
+                paths.append(path)
+                entries.append(value)
+            # Children are pushed in reverse so they are visited in order
+            stack.extend(
+                (path + (key,), child)
+                for key, child in reversed(value.items())
+                if isinstance(child, Mapping)
+            )
+        self.paths = tuple(paths)
+        self.entries = tuple(entries)
         
-        for key in path:
-            if key in current:
-                current = current[key]
-            else:
-                return {}
-                
-        return current
-    
-    @staticmethod
-    def get_pattern_categories() -> List[str]:
-        """
-        Get all top-level pattern categories.
+        texts = []
+        starts = []
+        offset = 0
+        for entry in entries:
+            text = entry.get("description", "").lower() + self._FIELD_SEPARATOR + entry.get("pattern", "").lower()
+            texts.append(text)
+            starts.append(offset)
+            offset += len(text) + len(self._ENTRY_SEPARATOR)
+        self.corpus = self._ENTRY_SEPARATOR.join(texts)
+        self.starts = tuple(starts)
+    
+    def result(self, pattern_id):
+        """Build the search result dict for one entry"""
+        return {"path": list(self.paths[pattern_id]), "pattern": self.entries[pattern_id]}
+    
+    def search(self, query):
+        """Return the result dicts of every entry whose text contains a lowercased query"""
+        results = []
+        if not self.starts:
+            return results
+        position = self.corpus.find(query)
+        while position != -1:
+            pattern_id = bisect_right(self.starts, position) - 1
+            results.append(self.result(pattern_id))
+            # Resume at the next entry so each entry is reported once
+            if pattern_id + 1 == len(self.starts):
+                break
+            position = self.corpus.find(query, self.starts[pattern_id + 1])
+        return results
+
+
+@lru_cache(maxsize=1)
+def _pattern_columns() -> _PatternColumns:
+    """Build the pattern columns on first search"""
+    return _PatternColumns(_all_patterns())
+
+
+def get_patterns() -> Mapping[str, Any]:
+    """
+    Get all Pest testing patterns.
+    
+    Returns:
+        Read-only mapping of testing patterns categorized by test type. The
+        same instance is returned on every call.
+    """
+    return _all_patterns()
+
+
+def get_pattern_by_path(path: List[str]) -> Mapping[str, Any]:
+    """
+    Get a specific pattern using a path of keys.
+    
+    Args:
+        path: List of keys to traverse the patterns dictionary
         
-        Returns:
-            List of pattern categories
-        """
-        return list(LaravelPestPatterns.get_patterns().keys())
-    
-    @staticmethod
-    def search_patterns(query: str) -> List[Dict[str, Any]]:
-        """
-        Search patterns for a specific query.
+    Returns:
+        The pattern at the specified path (a read-only mapping, or a string
+        for a leaf field) or an empty dict if not found
+    """
+    if not path:
+        return _all_patterns()
+    
+    # Only the category the path starts in needs to be built
+    if path[0] not in _LOADERS:
+        return {}
+    return _path_index(path[0]).get(tuple(path[1:]), {})
+
+
+def get_pattern_categories() -> List[str]:
+    """
+    Get all top-level pattern categories.
+    
+    Returns:
+        List of pattern categories
+    """
+    return list(_LOADERS)
+
+
+def search_patterns(query: str) -> List[Dict[str, Any]]:
+    """
+    Search patterns for a specific query.
+    
+    Args:
+        query: Search term
         
-        Args:
-            query: Search term
-            
-        Returns:
-            List of matching patterns with their paths
-        """
-        results = []
-        patterns = LaravelPestPatterns.get_patterns()
+    Returns:
+        List of matching patterns (read-only mappings) with their paths
+    """
+    return _pattern_columns().search(query.lower())
+
+
+# Substitution placeholders such as {route} or {Model}. PHP braces in the
+# patterns ("function () {") are not placeholders, so str.format cannot be
+# used on them.
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+@lru_cache(maxsize=None)
+def _parsed_pattern(path: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Split the pattern at a path into alternating literal text and
+    placeholder names, once per path.
+    
+    Raises:
+        KeyError: If the path does not lead to an entry with a pattern
+    """
+    entry = get_pattern_by_path(list(path))
+    if not isinstance(entry, Mapping) or "pattern" not in entry:
+        raise KeyError(path)
+    return tuple(_PLACEHOLDER_RE.split(entry["pattern"]))
+
+
+def render_pattern(path: List[str], **substitutions: str) -> str:
+    """
+    Fill in the placeholders of a pattern.
+    
+    Args:
+        path: Path of the pattern entry, as for get_pattern_by_path
+        **substitutions: Values for placeholders, e.g. route="/dashboard"
         
-        def search_recursive(current: Dict[str, Any], path: List[str] = None):
-            if path is None:
-                path = []
-                
-            for key, value in current.items():
-                current_path = path + [key]
-                
-                if isinstance(value, dict):
-                    if "description" in value and query.lower() in value["description"].lower():
-                        results.append({
-                            "path": current_path,
-                            "pattern": value
-                        })
-                    elif "pattern" in value and query.lower() in value["pattern"].lower():
-                        results.append({
-                            "path": current_path,
-                            "pattern": value
-                        })
-                    else:
-                        search_recursive(value, current_path)
+    Returns:
+        The pattern with each {name} placeholder that has a substitution
+        replaced; placeholders without one are left as written
         
-        search_recursive(patterns)
-        return results 
\ No newline at end of file
+    Raises:
+        KeyError: If the path does not lead to an entry with a pattern
+    """
+    parts = _parsed_pattern(tuple(path))
+    rendered = list(parts)
+    # Odd positions hold the placeholder names captured by the split
+    for index in range(1, len(parts), 2):
+        name = parts[index]
+        rendered[index] = substitutions[name] if name in substitutions else "{" + name + "}"
+    return "".join(rendered)
+
+
+class LaravelPestPatterns:
+    """
+    Knowledge base for Laravel Pest testing patterns.
+    
+    The lookups are plain module functions; this class exposes the same
+    functions as static methods for existing callers.
+    """
+    
+    get_patterns = staticmethod(get_patterns)
+    get_pattern_by_path = staticmethod(get_pattern_by_path)
+    get_pattern_categories = staticmethod(get_pattern_categories)
+    search_patterns = staticmethod(search_patterns)
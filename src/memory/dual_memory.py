@@ -5,8 +5,17 @@ This module provides a dual memory system that integrates both temporary and per
 with visual feedback through the UI component.
 """
 
+import heapq
 import json
 import os
+import queue
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from itertools import islice
+from operator import itemgetter
 from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 
@@ -14,6 +23,45 @@ from src.cli.memory_ui import MemoryUI, memory_ui
 from src.memory.temporary_memory import TemporaryMemory
 from src.memory.permanent_memory import PermanentMemory
 
+# Prefer orjson for memory checkpoints when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, indented when pretty is set."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Queued to the background UI renderer to make it exit
+_UI_STOP = object()
+
+
+# Shortest trimmed query search_memory will run against the memory stores
+_MIN_QUERY_LENGTH = 2
+
+
+# Keyword patterns for categorizing extracted knowledge, checked in priority order
+# against lowercased content. Plain substrings, so "how" also matches "show".
+_CATEGORY_PATTERNS = (
+    ("code", re.compile("code|function|class|programming")),
+    ("question", re.compile("question|how|what|why")),
+    ("fact", re.compile("fact|remember|important")),
+)
+
 
 class DualMemorySystem:
     """
@@ -31,7 +79,8 @@ class DualMemorySystem:
         self, 
         temporary_memory: Optional[TemporaryMemory] = None,
         permanent_memory: Optional[PermanentMemory] = None,
-        ui: Optional[MemoryUI] = None
+        ui: Optional[MemoryUI] = None,
+        background_ui: bool = False
     ):
         """
         Initialize the dual memory system.
@@ -40,6 +89,9 @@ class DualMemorySystem:
             temporary_memory: Optional TemporaryMemory instance
             permanent_memory: Optional PermanentMemory instance
             ui: Optional MemoryUI instance for visual feedback
+            background_ui: Render UI feedback on a background thread so memory
+                operations return without waiting for the console; close()
+                stops the thread
         """
         # Initialize memories
         self.temporary_memory = temporary_memory or TemporaryMemory()
@@ -48,6 +100,11 @@ class DualMemorySystem:
         # UI component for visual feedback
         self.ui = ui or memory_ui
         
+        # Guards the session analytics counters and the search cache, which
+        # concurrent callers (e.g. a UI thread searching while another adds
+        # messages) would otherwise update in interleaved steps
+        self._lock = threading.Lock()
+        
         # Session analytics
         self.session_start = datetime.now().isoformat()
         self.messages_count = 0
@@ -55,28 +112,112 @@ class DualMemorySystem:
         self.memory_transitions = 0
         self.searches_performed = 0
         
+        # Recent search results keyed by normalized query. Each entry records the
+        # _memory_token() it was computed under and is only reused while that holds,
+        # so backends changed directly (not through this class) never serve stale hits
+        self._search_cache: OrderedDict[str, Tuple[Tuple, List[Dict[str, Any]]]] = OrderedDict()
+        self._search_cache_max = 128
+        
+        # Directory most recently created or confirmed by save_memory
+        self._last_ensured_dir: Optional[str] = None
+        
+        # State redraws are rate limited; a skipped redraw leaves the display dirty
+        self._display_dirty = False
+        self._last_render_ns = 0
+        self._min_render_interval_ns = 50_000_000
+        
+        # Optional background renderer; UI calls are queued as (method, args) pairs
+        self._ui_queue: Optional[queue.Queue] = None
+        self._ui_thread: Optional[threading.Thread] = None
+        if background_ui:
+            self._ui_queue = queue.Queue()
+            # The worker only holds a weak reference, so an unclosed system can
+            # still be collected; the finalizer then stops the worker
+            self._ui_thread = threading.Thread(
+                target=self._ui_worker, args=(weakref.ref(self), self._ui_queue), daemon=True
+            )
+            self._ui_thread.start()
+            self._stop_ui_worker = weakref.finalize(self, self._ui_queue.put, _UI_STOP)
+        
         # Initial UI update
         self._update_memory_state_display()
     
+    @property
+    def permanent_memory(self) -> PermanentMemory:
+        """The permanent memory backend."""
+        return self._permanent_memory
+    
+    @permanent_memory.setter
+    def permanent_memory(self, permanent_memory: PermanentMemory) -> None:
+        # Resolve the optional methods once instead of probing on every call,
+        # since permanent memory implementations expose different interfaces
+        self._permanent_memory = permanent_memory
+        self._pm_search = getattr(permanent_memory, 'search', None)
+        self._pm_get_entries = (
+            getattr(permanent_memory, 'get_entries', None)
+            or getattr(permanent_memory, 'get_all_knowledge', None)
+        )
+        self._pm_add_entry = getattr(permanent_memory, 'add_entry', None)
+        self._pm_add_knowledge = getattr(permanent_memory, 'add_knowledge', None)
+        self._pm_clear = getattr(permanent_memory, 'clear', None)
+        self._pm_len = getattr(permanent_memory, '__len__', None)
+    
     def add_message(self, message: Dict[str, Any]) -> None:
         """
         Add a message to temporary memory with visual feedback.
         
+        State redraws are rate limited, so a message added shortly after the
+        previous redraw is not shown yet; callers must call flush_ui() once they
+        are done adding messages to bring the display up to date.
+        
         Args:
             message: The message to add (must contain 'role' and 'content' keys)
         """
         # Show user interface notification
-        self.ui.show_memory_usage("Adding message", "temporary")
+        self._notify("show_memory_usage", "Adding message", "temporary")
         
         # Add to temporary memory
         self.temporary_memory.add_message(message)
+        self._clear_search_cache()
         
         # Update analytics
-        self.messages_count += 1
+        with self._lock:
+            self.messages_count += 1
         
         # Update UI
         self._update_memory_state_display()
     
+    def add_messages(self, messages: List[Dict[str, Any]]) -> None:
+        """
+        Add several messages to temporary memory with a single UI update.
+        
+        Args:
+            messages: The messages to add (each must contain 'role' and 'content' keys)
+        """
+        self._notify("show_memory_usage", f"Adding {len(messages)} messages", "temporary")
+        
+        self._extend_temporary_memory(messages)
+        self._clear_search_cache()
+        
+        with self._lock:
+            self.messages_count += len(messages)
+        
+        self._update_memory_state_display(force=True)
+    
+    def _extend_temporary_memory(self, messages: List[Dict[str, Any]]) -> None:
+        """
+        Append messages to temporary memory, in one batch when supported.
+        
+        Args:
+            messages: The messages to append
+        """
+        add_messages = getattr(self.temporary_memory, 'add_messages', None)
+        if add_messages:
+            add_messages(messages)
+        else:
+            for message in messages:
+                self.temporary_memory.add_message(message)
+    
     def analyze_temporary_memory(self) -> List[Dict[str, Any]]:
         """
         Analyze temporary memory to extract knowledge, with visual progress indication.
@@ -84,6 +225,9 @@ class DualMemorySystem:
         Returns:
             List of extracted knowledge entries
         """
+        # The progress indicator is driven synchronously, so let queued output finish first
+        self.flush_ui()
+        
         # Start analysis with progress indicator
         progress = self.ui.analyzing_temporary_memory(with_progress=True)
         task_id = None
@@ -131,21 +275,22 @@ class DualMemorySystem:
         
         knowledge_entries = []
         
+        # Messages without a timestamp share the time of this extraction
+        extracted_at = datetime.now().isoformat()
+        
         # For this example, we'll consider user messages with at least 20 chars as knowledge
         for message in messages:
-            if message.get("role") == "user" and len(message.get("content", "")) >= 20:
-                # Extract content and create timestamp
-                content = message.get("content", "")
-                timestamp = message.get("timestamp", datetime.now().isoformat())
+            content = message.get("content", "")
+            if message.get("role") == "user" and len(content) >= 20:
+                timestamp = message.get("timestamp", extracted_at)
                 
                 # Simple category determination based on content keywords
                 category = "general"
-                if any(term in content.lower() for term in ["code", "function", "class", "programming"]):
-                    category = "code"
-                elif any(term in content.lower() for term in ["question", "how", "what", "why"]):
-                    category = "question"
-                elif any(term in content.lower() for term in ["fact", "remember", "important"]):
-                    category = "fact"
+                content_lower = content.lower()
+                for name, pattern in _CATEGORY_PATTERNS:
+                    if pattern.search(content_lower):
+                        category = name
+                        break
                 
                 # Create knowledge entry
                 entry = {
@@ -167,124 +312,215 @@ class DualMemorySystem:
             entries: List of knowledge entries to store
         """
         # Show transition from temporary to permanent memory
-        self.ui.show_memory_transition(
+        self._notify(
+            "show_memory_transition",
             "Temporary Memory", 
             "Permanent Memory",
             "Storing important knowledge for long-term recall"
         )
         
-        # Add each entry to permanent memory
-        for entry in entries:
-            self.permanent_memory.add_entry(entry)
+        # Add entries in one batch when the implementation supports it
+        if self._pm_add_knowledge:
+            self._pm_add_knowledge(entries)
+        else:
+            for entry in entries:
+                self._pm_add_entry(entry)
+        self._clear_search_cache()
         
         # Update analytics
-        self.knowledge_entries_count += len(entries)
-        self.memory_transitions += 1
+        with self._lock:
+            self.knowledge_entries_count += len(entries)
+            self.memory_transitions += 1
         
         # Show what was stored
-        self.ui.show_storing_knowledge(len(entries), entries)
+        self._notify("show_storing_knowledge", len(entries), list(entries))
         
-        # Update UI state
-        self._update_memory_state_display()
+        # Update UI state; storing ends an analysis pass, so always show the result
+        self._update_memory_state_display(force=True)
     
-    def search_memory(self, query: str) -> List[Dict[str, Any]]:
+    def search_memory(self, query: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Search across both temporary and permanent memory.
         
         Args:
             query: The search query string
+            max_results: Optional maximum number of results to return
             
         Returns:
-            List of search results from both memory types
+            List of search results from both memory types (empty for queries
+            shorter than two characters after trimming whitespace)
         """
+        self._repaint_if_due()
+        
+        # Near-empty queries match almost everything; skip scanning both stores
+        query = query.strip()
+        if len(query) < _MIN_QUERY_LENGTH:
+            self._notify("memory_thinking", "Query too short")
+            return []
+        
         # Show thinking indication
-        self.ui.memory_thinking(f"Searching memory for: '{query}'")
+        self._notify("memory_thinking", f"Searching memory for: '{query}'")
+        
+        # Both backends match case-insensitively, so case variants share an entry
+        key = query.lower()
+        token = self._memory_token()
+        with self._lock:
+            entry = self._search_cache.get(key)
+            if entry is not None and entry[0] == token:
+                self._search_cache.move_to_end(key)
+                cached = entry[1]
+            else:
+                cached = None
+        
+        # The backends are searched outside the lock; the result is filed under
+        # the token taken beforehand, so a concurrent change makes it a miss
+        if cached is None:
+            cached = self._run_search(query)
+            with self._lock:
+                self._search_cache[key] = (token, cached)
+                self._search_cache.move_to_end(key)
+                if len(self._search_cache) > self._search_cache_max:
+                    self._search_cache.popitem(last=False)
+        
+        # Hand out copies so callers cannot alter the cached results
+        all_results = [result.copy() for result in islice(cached, max_results)]
+        
+        # Update analytics
+        with self._lock:
+            self.searches_performed += 1
+        
+        # Show results
+        self._notify("show_search_results", all_results, query)
+        
+        return all_results
+    
+    def _clear_search_cache(self) -> None:
+        """Drop every cached search result."""
+        with self._lock:
+            self._search_cache.clear()
+    
+    def _memory_token(self) -> Tuple:
+        """
+        Snapshot the size and change counter of both memory backends.
+        
+        Returns:
+            Tuple that differs whenever either backend has been modified
+        """
+        temp = self.temporary_memory
+        return (
+            len(temp),
+            getattr(temp, 'version', None),
+            self._pm_len() if self._pm_len else None,
+            getattr(self._permanent_memory, 'version', None)
+        )
+    
+    def _run_search(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Run the query against both memory backends, bypassing the search cache.
         
+        Args:
+            query: The search query string
+            
+        Returns:
+            Combined results sorted by relevance
+        """
         # Search in both memory types
         temp_results = self.temporary_memory.search(query)
         
-        # Handle different permanent memory implementations
-        if hasattr(self.permanent_memory, 'search'):
-            perm_results = self.permanent_memory.search(query)
-        else:
-            # Default to empty list if search method doesn't exist
-            perm_results = []
+        # Default to empty list if the permanent memory cannot search
+        perm_results = self._pm_search(query) if self._pm_search else []
         
-        # Mark results with their source
+        # Mark results with their source, defaulting relevance so it can be read directly
         for result in temp_results:
             result["source"] = "temporary_memory"
+            result.setdefault("relevance", 0)
         
         for result in perm_results:
             result["source"] = "permanent_memory"
+            result.setdefault("relevance", 0)
         
-        # Combine and sort by relevance
-        all_results = temp_results + perm_results
-        all_results.sort(key=lambda x: x.get("relevance", 0), reverse=True)
-        
-        # Update analytics
-        self.searches_performed += 1
-        
-        # Show results
-        self.ui.show_search_results(all_results, query)
-        
-        return all_results
+        # Temporary results arrive sorted by relevance; permanent ones are ranked by
+        # search_relevance, so order those (only top_k of them) before merging
+        relevance = itemgetter("relevance")
+        perm_results.sort(key=relevance, reverse=True)
+        return list(heapq.merge(temp_results, perm_results, key=relevance, reverse=True))
     
-    def save_memory(self, file_path: str) -> bool:
+    def save_memory(self, file_path: str, pretty: bool = False, durable: bool = True) -> bool:
         """
         Save the current memory state to a file.
         
+        The state is written to a temporary file that then replaces the target,
+        so a crash mid-save never leaves a truncated memory file behind.
+        
         Args:
             file_path: Path to save the memory state
+            pretty: Indent the JSON output for human readers
+            durable: Flush the file to disk before replacing the target
             
         Returns:
             True if save was successful, False otherwise
         """
+        self._repaint_if_due()
+        
         # Check for empty or None path
         if not file_path:
-            self.ui.error("Failed to save memory: Empty file path")
+            self._notify("error", "Failed to save memory: Empty file path")
             return False
             
         # Get temporary memory messages
         temp_messages = self.temporary_memory.get_messages()
         
         # Different permanent memory implementations may have different methods
-        if hasattr(self.permanent_memory, 'get_entries'):
-            perm_entries = self.permanent_memory.get_entries()
-        elif hasattr(self.permanent_memory, 'get_all_knowledge'):
-            perm_entries = self.permanent_memory.get_all_knowledge()
-        else:
-            perm_entries = []
+        perm_entries = self._pm_get_entries() if self._pm_get_entries else []
         
         # Prepare memory state
         memory_state = {
             "temporary_memory": temp_messages,
             "permanent_memory": perm_entries,
-            "analytics": {
-                "session_start": self.session_start,
-                "messages_count": self.messages_count,
-                "knowledge_entries_count": self.knowledge_entries_count,
-                "memory_transitions": self.memory_transitions,
-                "searches_performed": self.searches_performed
-            }
+            "analytics": self._analytics_snapshot()
         }
         
         try:
-            # Create directory if it doesn't exist
-            directory = os.path.dirname(os.path.abspath(file_path))
-            # Create directory structure even if empty directory name
-            os.makedirs(directory, exist_ok=True)
+            # Create directory if it doesn't exist, skipping the one ensured last time
+            # (an empty name means the current directory, which always exists)
+            directory = os.path.dirname(file_path)
+            if directory and directory != self._last_ensured_dir:
+                os.makedirs(directory, exist_ok=True)
+                self._last_ensured_dir = directory
             
-            # Write to file
-            with open(file_path, 'w') as f:
-                json.dump(memory_state, f, indent=2)
+            # Encode up front so the file is written with a single call
+            blob = _dumps(memory_state, pretty)
+            tmp_path = file_path + '.tmp'
+            try:
+                tmp_file = open(tmp_path, 'wb')
+            except FileNotFoundError:
+                # The directory ensured by an earlier save has since been removed
+                if not directory:
+                    raise
+                os.makedirs(directory, exist_ok=True)
+                tmp_file = open(tmp_path, 'wb')
+            try:
+                with tmp_file as f:
+                    f.write(blob)
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
             
             # Show success notification
-            self.ui.memory_saved(file_path)
+            self._notify("memory_saved", file_path)
             return True
             
         except Exception as e:
+            # Check the directory again on the next save rather than trusting it
+            self._last_ensured_dir = None
+            
             # Show error
-            self.ui.error(f"Failed to save memory: {str(e)}")
+            self._notify("error", f"Failed to save memory: {str(e)}")
             return False
     
     def load_memory(self, file_path: str) -> bool:
@@ -299,55 +535,177 @@ class DualMemorySystem:
         """
         try:
             # Read from file
-            with open(file_path, 'r') as f:
-                memory_state = json.load(f)
+            with open(file_path, 'rb') as f:
+                memory_state = _loads(f.read())
             
             # Restore temporary memory
             temp_messages = memory_state.get("temporary_memory", [])
+            self._clear_search_cache()
             self.temporary_memory.clear()
-            for message in temp_messages:
-                self.temporary_memory.add_message(message)
+            
+            # Only the newest messages survive the temporary memory cap, so skip
+            # replaying (and copying) the ones it would evict straight away
+            max_messages = getattr(self.temporary_memory, 'max_messages', None)
+            restored = temp_messages[-max_messages:] if max_messages else temp_messages
+            self._extend_temporary_memory(restored)
             
             # Restore permanent memory - handle different implementations
             perm_entries = memory_state.get("permanent_memory", [])
             
             # Different permanent memory implementations use different methods
-            if hasattr(self.permanent_memory, 'clear'):
-                self.permanent_memory.clear()
+            if self._pm_clear:
+                self._pm_clear()
             
             # Add entries using the appropriate method
-            if hasattr(self.permanent_memory, 'add_entry'):
+            if self._pm_add_entry:
                 for entry in perm_entries:
-                    self.permanent_memory.add_entry(entry)
-            elif hasattr(self.permanent_memory, 'add_knowledge'):
-                self.permanent_memory.add_knowledge(perm_entries)
+                    self._pm_add_entry(entry)
+            elif self._pm_add_knowledge:
+                self._pm_add_knowledge(perm_entries)
             
             # Restore analytics
             analytics = memory_state.get("analytics", {})
-            self.session_start = analytics.get("session_start", self.session_start)
-            self.messages_count = analytics.get("messages_count", 0)
-            self.knowledge_entries_count = analytics.get("knowledge_entries_count", 0)
-            self.memory_transitions = analytics.get("memory_transitions", 0)
-            self.searches_performed = analytics.get("searches_performed", 0)
+            with self._lock:
+                self.session_start = analytics.get("session_start", self.session_start)
+                self.messages_count = analytics.get("messages_count", 0)
+                self.knowledge_entries_count = analytics.get("knowledge_entries_count", 0)
+                self.memory_transitions = analytics.get("memory_transitions", 0)
+                self.searches_performed = analytics.get("searches_performed", 0)
             
             # Show success notification
-            self.ui.memory_loaded(
+            self._notify(
+                "memory_loaded",
                 file_path, 
                 len(temp_messages), 
                 len(perm_entries)
             )
             
             # Update UI
-            self._update_memory_state_display()
+            self._update_memory_state_display(force=True)
             return True
             
         except Exception as e:
             # Show error
-            self.ui.error(f"Failed to load memory: {str(e)}")
+            self._notify("error", f"Failed to load memory: {str(e)}")
             return False
     
-    def _update_memory_state_display(self) -> None:
-        """Update the memory state display in the UI."""
+    def _notify(self, method: str, *args: Any) -> None:
+        """
+        Call a UI method, or queue it for the background renderer when enabled.
+        
+        Args:
+            method: Name of the MemoryUI method to call
+            *args: Positional arguments for the method
+        """
+        if self._ui_queue is not None:
+            self._ui_queue.put((method, args))
+        else:
+            getattr(self.ui, method)(*args)
+    
+    @staticmethod
+    def _ui_worker(owner_ref: "weakref.ref[DualMemorySystem]", ui_queue: queue.Queue) -> None:
+        """
+        Render queued UI calls, coalescing repeated memory state redraws.
+        
+        Args:
+            owner_ref: Weak reference to the memory system the calls belong to
+            ui_queue: Queue of (method, args) pairs, ended by _UI_STOP
+        """
+        while True:
+            batch = [ui_queue.get()]
+            while True:
+                try:
+                    batch.append(ui_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Only hold the owner while rendering, never while waiting for work
+            owner = owner_ref()
+            stopped = owner is None
+            
+            # A state redraw reflects the live memory, so only the last one counts
+            last_redraw = max(
+                (i for i, item in enumerate(batch) if item is not _UI_STOP and item[0] is None),
+                default=-1
+            )
+            for i, item in enumerate(batch):
+                try:
+                    if item is _UI_STOP:
+                        stopped = True
+                    elif stopped:
+                        # Nothing is rendered after a stop or once the owner is gone
+                        pass
+                    elif item[0] is None:
+                        if i == last_redraw:
+                            owner._render_memory_state()
+                    else:
+                        getattr(owner.ui, item[0])(*item[1])
+                except Exception as e:
+                    print(f"Error updating memory display: {str(e)}")
+                finally:
+                    ui_queue.task_done()
+            
+            del owner
+            if stopped:
+                return
+    
+    def close(self) -> None:
+        """
+        Render pending UI feedback and stop the background renderer.
+        
+        Later feedback is rendered synchronously. Does nothing without a
+        background renderer or when already closed.
+        """
+        if self._ui_queue is None:
+            return
+        self._stop_ui_worker()
+        self._ui_thread.join()
+        self._ui_queue = None
+        self._ui_thread = None
+    
+    def flush_ui(self) -> None:
+        """Block until all pending UI feedback, including a skipped redraw, is rendered."""
+        if self._ui_queue is not None:
+            self._ui_queue.join()
+        elif self._display_dirty:
+            self._display_dirty = False
+            self._last_render_ns = time.monotonic_ns()
+            self._render_memory_state()
+    
+    def _repaint_if_due(self) -> None:
+        """
+        Render a redraw skipped by the rate limit once its interval has passed.
+        
+        Called by public methods that do not redraw themselves, so the display
+        catches up on the next interaction instead of waiting for flush_ui().
+        """
+        if self._display_dirty and self._ui_queue is None:
+            self._update_memory_state_display()
+    
+    def _update_memory_state_display(self, force: bool = False) -> None:
+        """
+        Update the memory state display in the UI.
+        
+        Args:
+            force: Redraw even if the previous redraw was too recent, used at the
+                end of batch operations so their final state is always shown
+        """
+        if self._ui_queue is not None:
+            # None marks a state redraw for the background renderer
+            self._ui_queue.put((None, ()))
+            return
+        
+        # Coalesce bursts of updates into at most one redraw per interval
+        now = time.monotonic_ns()
+        if not force and now - self._last_render_ns < self._min_render_interval_ns:
+            self._display_dirty = True
+            return
+        self._display_dirty = False
+        self._last_render_ns = now
+        self._render_memory_state()
+    
+    def _render_memory_state(self) -> None:
+        """Render the current memory state in the UI."""
         try:
             # Only call show_memory_state on self as we now can traverse the memory reference
             if hasattr(self.ui, 'show_memory_state'):
@@ -356,6 +714,22 @@ class DualMemorySystem:
             # Fail gracefully for UI issues
             print(f"Error updating memory display: {str(e)}")
     
+    def _analytics_snapshot(self) -> Dict[str, Any]:
+        """
+        Read the session analytics counters as one consistent snapshot.
+        
+        Returns:
+            Dictionary with the session start and analytics counters
+        """
+        with self._lock:
+            return {
+                "session_start": self.session_start,
+                "messages_count": self.messages_count,
+                "knowledge_entries_count": self.knowledge_entries_count,
+                "memory_transitions": self.memory_transitions,
+                "searches_performed": self.searches_performed
+            }
+    
     def get_conversation_summary(self) -> Dict[str, Any]:
         """
         Get a summary of conversation and memory statistics.
@@ -363,29 +737,29 @@ class DualMemorySystem:
         Returns:
             Dictionary with summary statistics
         """
+        self._repaint_if_due()
+        
         summary = {
-            "session_start": self.session_start,
-            "messages_count": self.messages_count,
-            "knowledge_entries_count": self.knowledge_entries_count,
-            "memory_transitions": self.memory_transitions,
-            "searches_performed": self.searches_performed,
-            "temporary_memory_count": len(self.temporary_memory.get_messages()),
-            "permanent_memory_count": len(self.permanent_memory.get_entries())
+            **self._analytics_snapshot(),
+            "temporary_memory_count": len(self.temporary_memory),
+            "permanent_memory_count": len(self.permanent_memory)
         }
         
         # Display summary in UI
-        self.ui.conversation_summary(summary)
+        self._notify("conversation_summary", summary)
         
         return summary
     
     def clear_temporary_memory(self) -> None:
         """Clear temporary memory and update UI."""
         self.temporary_memory.clear()
-        self.ui.memory_thinking("Temporary memory cleared")
-        self._update_memory_state_display()
+        self._clear_search_cache()
+        self._notify("memory_thinking", "Temporary memory cleared")
+        self._update_memory_state_display(force=True)
     
     def clear_permanent_memory(self) -> None:
         """Clear permanent memory and update UI."""
         self.permanent_memory.clear()
-        self.ui.memory_thinking("Permanent memory cleared")
-        self._update_memory_state_display() 
\ No newline at end of file
+        self._clear_search_cache()
+        self._notify("memory_thinking", "Permanent memory cleared")
+        self._update_memory_state_display(force=True) 
\ No newline at end of file
@@ -112,8 +112,10 @@ class OptimizedMemorySystem:
                     {"content_length": len(message['content']), "role": message.get('role', 'unknown')}
                 )
         
-        # Add message to dual memory
+        # Add message to dual memory, showing its final state even if the
+        # redraw rate limit skipped it
         self.dual_memory.add_message(message)
+        self.dual_memory.flush_ui()
         
         # Apply compression if configured and message is large
         if self.auto_compress and 'content' in message:
@@ -32,6 +32,7 @@ class PermanentMemory:
         """
         self.storage_path = storage_path
         self._knowledge_entries = []
+        self._version = 0
         
         # Create storage directory if it doesn't exist
         os.makedirs(self.storage_path, exist_ok=True)
@@ -84,6 +85,17 @@ class PermanentMemory:
                 
             # Add to knowledge entries
             self._knowledge_entries.append(entry_copy)
+            self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """
+        Counter that increases whenever knowledge entries are added, removed or replaced.
+        
+        Returns:
+            Current change counter
+        """
+        return self._version
     
     def get_all_knowledge(self) -> List[Dict[str, Any]]:
         """
@@ -212,6 +224,7 @@ class PermanentMemory:
                 
             if 'knowledge_entries' in data:
                 self._knowledge_entries = data['knowledge_entries']
+                self._version += 1
                 return True
                 
         except (json.JSONDecodeError, IOError):
@@ -222,6 +235,7 @@ class PermanentMemory:
     def clear(self) -> None:
         """Clear all knowledge entries."""
         self._knowledge_entries = []
+        self._version += 1
         
     def delete_entry(self, entry_id: str) -> bool:
         """
@@ -236,6 +250,7 @@ class PermanentMemory:
         for i, entry in enumerate(self._knowledge_entries):
             if entry.get('id') == entry_id:
                 del self._knowledge_entries[i]
+                self._version += 1
                 return True
                 
         return False
@@ -4,6 +4,7 @@ Temporary Memory System
 This module provides temporary (working) memory for storing recent conversation context.
 """
 
+import threading
 import uuid
 from typing import Dict, List, Any, Optional
 from datetime import datetime
@@ -28,14 +29,28 @@ class TemporaryMemory:
             max_messages: Maximum number of messages to store (defaults to 50)
         """
         self._messages = []
+        # Lowercased message contents, kept parallel to _messages for search
+        self._contents_lower = []
+        self._version = 0
         self.max_messages = max_messages
+        
+        # Serializes writers. Adds append to both lists in place and trimming or
+        # clearing rebinds both, always under this lock, so the lists stay
+        # index-aligned. search only takes references to the pair under the lock
+        # and iterates them unlocked: an in-place add can still grow them
+        # mid-search, which is harmless because appends keep positions aligned
+        # and zip stops at whichever list is shorter at that moment
+        self._lock = threading.Lock()
     
-    def add_message(self, message: Dict[str, Any]) -> None:
+    def _prepare_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Add a message to memory.
+        Validate a message and copy it with a timestamp and ID filled in.
         
         Args:
             message: Message dictionary containing at least 'role' and 'content'
+            
+        Returns:
+            The copy to store
         """
         # Validate message has required fields
         if not isinstance(message, dict) or not all(key in message for key in ['role', 'content']):
@@ -51,12 +66,57 @@ class TemporaryMemory:
         if 'id' not in message_copy:
             message_copy['id'] = str(uuid.uuid4())
         
-        # Add to messages list, maintaining max size
-        self._messages.append(message_copy)
+        return message_copy
+    
+    def add_message(self, message: Dict[str, Any]) -> None:
+        """
+        Add a message to memory.
+        
+        Args:
+            message: Message dictionary containing at least 'role' and 'content'
+        """
+        message_copy = self._prepare_message(message)
+        content_lower = message_copy['content'].lower()
         
-        # Remove oldest messages if we exceed max_messages
-        if len(self._messages) > self.max_messages:
-            self._messages = self._messages[-self.max_messages:]
+        with self._lock:
+            # Add to messages list, maintaining max size
+            self._messages.append(message_copy)
+            self._contents_lower.append(content_lower)
+            
+            # Remove oldest messages if we exceed max_messages
+            if len(self._messages) > self.max_messages:
+                self._messages = self._messages[-self.max_messages:]
+                self._contents_lower = self._contents_lower[-self.max_messages:]
+            self._version += 1
+    
+    def add_messages(self, messages: List[Dict[str, Any]]) -> None:
+        """
+        Add several messages to memory, trimming to max_messages once.
+        
+        Args:
+            messages: Message dictionaries, each containing at least 'role' and 'content'
+        """
+        # Every message is validated before any is stored
+        message_copies = [self._prepare_message(message) for message in messages]
+        contents_lower = [m['content'].lower() for m in message_copies]
+        
+        with self._lock:
+            self._messages.extend(message_copies)
+            self._contents_lower.extend(contents_lower)
+            if len(self._messages) > self.max_messages:
+                self._messages = self._messages[-self.max_messages:]
+                self._contents_lower = self._contents_lower[-self.max_messages:]
+            self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """
+        Counter that increases whenever messages are added or cleared.
+        
+        Returns:
+            Current change counter
+        """
+        return self._version
     
     def get_messages(self) -> List[Dict[str, Any]]:
         """
@@ -97,14 +157,16 @@ class TemporaryMemory:
         query = query.lower()
         results = []
         
-        for message in self._messages:
-            content = message.get('content', '').lower()
-            
+        # References only; see the note on _lock in __init__
+        with self._lock:
+            messages, contents_lower = self._messages, self._contents_lower
+        
+        for message, content in zip(messages, contents_lower):
             # Check if query is in content
-            if query in content:
+            position = content.find(query)
+            if position >= 0:
                 # Calculate basic relevance score based on match position and length
                 # Earlier matches and higher percentage matches are more relevant
-                position = content.find(query)
                 length_ratio = len(query) / max(len(content), 1)
                 
                 # Simple relevance formula: higher is better
@@ -123,7 +185,10 @@ class TemporaryMemory:
     
     def clear(self) -> None:
         """Clear all messages from memory."""
-        self._messages = []
+        with self._lock:
+            self._messages = []
+            self._contents_lower = []
+            self._version += 1
     
     def get_user_messages(self) -> List[Dict[str, Any]]:
         """
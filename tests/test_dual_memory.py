@@ -0,0 +1,321 @@
+"""
+Tests for the dual memory system
+"""
+import os
+import gc
+import shutil
+import tempfile
+import threading
+import unittest
+import weakref
+from src.memory.dual_memory import DualMemorySystem
+from src.memory.permanent_memory import PermanentMemory
+from src.memory.temporary_memory import TemporaryMemory
+
+class SilentUI:
+    """Memory UI stand-in that records the feedback it is asked to show"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+class TestDualMemorySystem(unittest.TestCase):
+    """Test cases for the DualMemorySystem class"""
+    
+    def setUp(self):
+        """Create a memory system backed by a scratch directory"""
+        self.directory = tempfile.mkdtemp()
+        self.ui = SilentUI()
+        self.memory = self.create_memory()
+    
+    def tearDown(self):
+        """Remove the scratch directory"""
+        shutil.rmtree(self.directory)
+    
+    def create_memory(self):
+        """Create a memory system holding one message and one knowledge entry"""
+        temporary_memory = TemporaryMemory()
+        temporary_memory.add_message({"role": "user", "content": "How do I build a Filament table?"})
+        permanent_memory = PermanentMemory(storage_path=os.path.join(self.directory, "permanent"))
+        permanent_memory.add_knowledge({"content": "Filament tables are built with Table::make"})
+        return DualMemorySystem(temporary_memory, permanent_memory, ui=self.ui)
+    
+    def test_search_cache_reuses_results(self):
+        """Test that repeated searches are served consistently and as copies"""
+        first = self.memory.search_memory("filament")
+        self.assertEqual(len(first), 2)
+        first[0]["content"] = "changed"
+        
+        second = self.memory.search_memory("  FILAMENT ")
+        self.assertEqual(len(second), 2)
+        self.assertNotIn("changed", [result["content"] for result in second])
+        self.assertEqual(self.memory.searches_performed, 2)
+    
+    def test_search_cache_invalidated_by_direct_changes(self):
+        """Test that changing the backends directly invalidates cached searches"""
+        self.assertEqual(len(self.memory.search_memory("filament")), 2)
+        
+        self.memory.permanent_memory.add_knowledge({"content": "Filament forms use Form::make"})
+        self.assertEqual(len(self.memory.search_memory("filament")), 3)
+        
+        self.memory.temporary_memory.add_message({"role": "assistant", "content": "Use a Filament resource"})
+        self.assertEqual(len(self.memory.search_memory("filament")), 4)
+        
+        entry_id = self.memory.permanent_memory.get_all_knowledge()[0]["id"]
+        self.memory.permanent_memory.delete_entry(entry_id)
+        self.assertEqual(len(self.memory.search_memory("filament")), 3)
+        
+        self.memory.temporary_memory.clear()
+        self.assertEqual(len(self.memory.search_memory("filament")), 1)
+    
+    def test_search_ignores_short_queries(self):
+        """Test that queries shorter than two characters return no results"""
+        self.assertEqual(self.memory.search_memory(" f "), [])
+        self.assertEqual(self.memory.searches_performed, 0)
+    
+    def test_save_and_load_round_trip(self):
+        """Test that a saved memory state loads back into a fresh system"""
+        self.memory.add_messages([
+            {"role": "assistant", "content": "Use TextColumn for text"},
+            {"role": "user", "content": "And for badges?"}
+        ])
+        self.memory.search_memory("filament")
+        file_path = os.path.join(self.directory, "saved", "memory.json")
+        self.assertTrue(self.memory.save_memory(file_path))
+        self.assertFalse(os.path.exists(file_path + ".tmp"))
+        
+        restored = self.create_memory()
+        restored.temporary_memory.add_message({"role": "user", "content": "Replaced on load"})
+        self.assertTrue(restored.load_memory(file_path))
+        
+        self.assertEqual(restored.temporary_memory.get_messages(), self.memory.temporary_memory.get_messages())
+        self.assertEqual(
+            restored.permanent_memory.get_all_knowledge(),
+            self.memory.permanent_memory.get_all_knowledge()
+        )
+        self.assertEqual(restored.messages_count, 2)
+        self.assertEqual(restored.searches_performed, 1)
+        self.assertEqual(len(restored.search_memory("filament")), 2)
+    
+    def test_load_keeps_newest_messages(self):
+        """Test that loading more messages than fit keeps the newest ones"""
+        self.memory.add_messages([{"role": "user", "content": f"Message {i}"} for i in range(5)])
+        file_path = os.path.join(self.directory, "memory.json")
+        self.assertTrue(self.memory.save_memory(file_path, pretty=True))
+        
+        restored = self.create_memory()
+        restored.temporary_memory.max_messages = 3
+        self.assertTrue(restored.load_memory(file_path))
+        contents = [message["content"] for message in restored.temporary_memory.get_messages()]
+        self.assertEqual(contents, ["Message 2", "Message 3", "Message 4"])
+    
+    def test_failed_save_leaves_no_files(self):
+        """Test that a save that fails midway keeps the previous file and no temp file"""
+        file_path = os.path.join(self.directory, "memory.json")
+        self.assertTrue(self.memory.save_memory(file_path))
+        with open(file_path, "rb") as f:
+            saved = f.read()
+        
+        self.memory.permanent_memory.add_knowledge({"content": "Not serializable", "value": object()})
+        self.assertFalse(self.memory.save_memory(file_path))
+        self.assertFalse(os.path.exists(file_path + ".tmp"))
+        with open(file_path, "rb") as f:
+            self.assertEqual(f.read(), saved)
+        self.assertEqual(self.ui.calls[-1][0], "error")
+    
+    def test_save_recreates_removed_directory(self):
+        """Test that saving again after the target directory was removed succeeds"""
+        directory = os.path.join(self.directory, "saved")
+        file_path = os.path.join(directory, "memory.json")
+        self.assertTrue(self.memory.save_memory(file_path))
+        
+        shutil.rmtree(directory)
+        self.assertTrue(self.memory.save_memory(file_path))
+        self.assertTrue(os.path.exists(file_path))
+        self.assertFalse(os.path.exists(file_path + ".tmp"))
+    
+    def test_save_rejects_empty_path(self):
+        """Test that saving to an empty path fails without writing anything"""
+        self.assertFalse(self.memory.save_memory(""))
+        self.assertEqual(os.listdir(self.directory), ["permanent"])
+    
+    def test_load_missing_file(self):
+        """Test that loading a missing file fails and keeps the current state"""
+        self.assertFalse(self.memory.load_memory(os.path.join(self.directory, "missing.json")))
+        self.assertEqual(len(self.memory.temporary_memory), 1)
+        self.assertEqual(len(self.memory.permanent_memory), 1)
+
+class TestRedrawRateLimit(unittest.TestCase):
+    """Test cases for rate limiting memory state redraws"""
+    
+    def setUp(self):
+        """Create a memory system that has just drawn its initial state"""
+        self.directory = tempfile.mkdtemp()
+        self.ui = SilentUI()
+        temporary_memory = TemporaryMemory()
+        temporary_memory.add_message({"role": "user", "content": "How do I build a Filament table?"})
+        permanent_memory = PermanentMemory(storage_path=os.path.join(self.directory, "permanent"))
+        permanent_memory.add_knowledge({"content": "Filament tables are built with Table::make"})
+        self.memory = DualMemorySystem(temporary_memory, permanent_memory, ui=self.ui)
+        # Keep every redraw within one rate limit interval, however slow the machine
+        self.memory._min_render_interval_ns = 60 * 1_000_000_000
+    
+    def tearDown(self):
+        """Remove the scratch directory"""
+        shutil.rmtree(self.directory)
+    
+    def redraws(self):
+        """Count the memory state redraws rendered so far"""
+        return [name for name, _ in self.ui.calls].count("show_memory_state")
+    
+    def test_burst_is_drawn_once_flushed(self):
+        """Test that a burst of messages skips redraws until flush_ui"""
+        self.assertEqual(self.redraws(), 1)
+        for i in range(100):
+            self.memory.add_message({"role": "user", "content": f"Message {i}"})
+        self.assertEqual(self.redraws(), 1)
+        self.assertTrue(self.memory._display_dirty)
+        
+        self.memory.flush_ui()
+        self.assertEqual(self.redraws(), 2)
+        self.assertFalse(self.memory._display_dirty)
+        
+        # Nothing is pending, so flushing again draws nothing
+        self.memory.flush_ui()
+        self.assertEqual(self.redraws(), 2)
+    
+    def test_skipped_redraw_catches_up(self):
+        """Test that the next interaction repaints a skipped redraw once it is due"""
+        self.memory.add_message({"role": "user", "content": "Skipped"})
+        self.assertEqual(self.redraws(), 1)
+        
+        # Not due yet: searching leaves the display dirty
+        self.memory.search_memory("filament")
+        self.assertEqual(self.redraws(), 1)
+        self.assertTrue(self.memory._display_dirty)
+        
+        # Once the interval has passed the next call repaints before its own feedback
+        self.memory._last_render_ns -= self.memory._min_render_interval_ns
+        self.ui.calls.clear()
+        self.memory.search_memory("filament")
+        methods = [name for name, _ in self.ui.calls]
+        self.assertEqual(methods[0], "show_memory_state")
+        self.assertFalse(self.memory._display_dirty)
+    
+    def test_batch_operations_always_redraw(self):
+        """Test that batch operations draw their final state despite the rate limit"""
+        self.memory.add_messages([{"role": "user", "content": "Batched"}])
+        self.assertEqual(self.redraws(), 2)
+        
+        self.memory.store_in_permanent_memory([{"content": "Stored", "category": "fact"}])
+        self.assertEqual(self.redraws(), 3)
+        self.assertFalse(self.memory._display_dirty)
+
+class BlockingUI(SilentUI):
+    """Memory UI stand-in whose first call waits until it is released"""
+    
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+    
+    def memory_thinking(self, *args):
+        self.calls.append(("memory_thinking", args))
+        self.started.set()
+        self.release.wait(5)
+
+class TestBackgroundUI(unittest.TestCase):
+    """Test cases for rendering UI feedback on a background thread"""
+    
+    def setUp(self):
+        """Create a memory system whose UI calls are queued to the background"""
+        self.directory = tempfile.mkdtemp()
+        self.ui = BlockingUI()
+        self.ui.release.set()
+        temporary_memory = TemporaryMemory()
+        temporary_memory.add_message({"role": "user", "content": "How do I build a Filament table?"})
+        permanent_memory = PermanentMemory(storage_path=os.path.join(self.directory, "permanent"))
+        permanent_memory.add_knowledge({"content": "Filament tables are built with Table::make"})
+        self.memory = DualMemorySystem(temporary_memory, permanent_memory, ui=self.ui, background_ui=True)
+        self.memory.flush_ui()
+        self.ui.calls.clear()
+    
+    def tearDown(self):
+        """Stop the renderer and remove the scratch directory"""
+        self.ui.release.set()
+        self.memory.close()
+        shutil.rmtree(self.directory)
+    
+    def test_calls_keep_their_order(self):
+        """Test that queued UI calls are rendered in the order they were made"""
+        self.memory.add_message({"role": "user", "content": "First"})
+        self.memory.search_memory("filament")
+        self.memory.flush_ui()
+        
+        methods = [name for name, _ in self.ui.calls]
+        self.assertEqual(
+            methods,
+            ["show_memory_usage", "show_memory_state", "memory_thinking", "show_search_results"]
+        )
+    
+    def test_repeated_redraws_are_collapsed(self):
+        """Test that redraws queued while the renderer is busy are drawn once"""
+        self.ui.release.clear()
+        self.memory.clear_temporary_memory()
+        self.assertTrue(self.ui.started.wait(5))
+        
+        # The renderer is blocked, so these all land in its next batch
+        for i in range(10):
+            self.memory.add_message({"role": "user", "content": f"Message {i}"})
+        self.ui.release.set()
+        self.memory.flush_ui()
+        
+        methods = [name for name, _ in self.ui.calls]
+        self.assertEqual(methods.count("show_memory_usage"), 10)
+        # At most the clear's own redraw plus one for the whole backlog
+        self.assertIn(methods.count("show_memory_state"), (1, 2))
+        self.assertEqual(methods[-1], "show_memory_state")
+    
+    def test_flush_waits_for_pending_calls(self):
+        """Test that flush_ui returns only after queued calls are rendered"""
+        self.ui.release.clear()
+        self.memory.search_memory("filament")
+        self.assertTrue(self.ui.started.wait(5))
+        self.assertNotIn("show_search_results", [name for name, _ in self.ui.calls])
+        
+        threading.Timer(0.05, self.ui.release.set).start()
+        self.memory.flush_ui()
+        self.assertEqual(self.ui.calls[-1][0], "show_search_results")
+    
+    def test_close_stops_the_renderer(self):
+        """Test that close renders pending calls, stops the thread and renders synchronously after"""
+        thread = self.memory._ui_thread
+        self.memory.search_memory("filament")
+        self.memory.close()
+        
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.ui.calls[-1][0], "show_search_results")
+        
+        self.memory.search_memory("table")
+        self.assertEqual(self.ui.calls[-1][0], "show_search_results")
+        self.memory.close()
+    
+    def test_unclosed_system_is_collected(self):
+        """Test that the renderer neither keeps its memory system alive nor outlives it"""
+        memory = DualMemorySystem(
+            self.memory.temporary_memory, self.memory.permanent_memory, ui=SilentUI(), background_ui=True
+        )
+        thread = memory._ui_thread
+        memory_ref = weakref.ref(memory)
+        memory.flush_ui()
+        
+        del memory
+        gc.collect()
+        self.assertIsNone(memory_ref())
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests for the Larecipe documentation pattern lookups
+"""
+import unittest
+from src.knowledge_base.testing.larecipe_patterns import LarecipeDocumentationPatterns
+
+class TestLarecipeSearch(unittest.TestCase):
+    """Test cases for LarecipeDocumentationPatterns searches"""
+    
+    def paths(self, results):
+        """Return the paths of search results"""
+        return [result["path"] for result in results]
+    
+    def test_search_paths_resolve(self):
+        """Test that every search result path resolves to the same pattern"""
+        for result in LarecipeDocumentationPatterns.search_patterns("api"):
+            with self.subTest(path=result["path"]):
+                self.assertEqual(
+                    LarecipeDocumentationPatterns.get_pattern_by_path(result["path"]),
+                    result["pattern"]
+                )
+    
+    def test_multi_matches_any_query(self):
+        """Test that a multi search returns each entry matching any query once, in source order"""
+        queries = ["api", "sidebar", "markdown", "api"]
+        matched = set()
+        for query in queries:
+            matched.update(map(tuple, self.paths(LarecipeDocumentationPatterns.search_patterns(query))))
+        every_entry = self.paths(LarecipeDocumentationPatterns.search_patterns(""))
+        expected = [path for path in every_entry if tuple(path) in matched]
+        
+        results = LarecipeDocumentationPatterns.search_patterns_multi(queries)
+        self.assertEqual(self.paths(results), expected)
+        self.assertEqual(len(expected), len(matched))
+    
+    def test_multi_single_query(self):
+        """Test that a multi search for one query equals the plain search"""
+        for query in ("SIDEBAR", "(", "no such text"):
+            with self.subTest(query=query):
+                self.assertEqual(
+                    LarecipeDocumentationPatterns.search_patterns_multi([query]),
+                    LarecipeDocumentationPatterns.search_patterns(query)
+                )
+    
+    def test_multi_treats_queries_literally(self):
+        """Test that regular expression characters in queries match literally"""
+        self.assertEqual(LarecipeDocumentationPatterns.search_patterns_multi([".*"]), [])
+        self.assertEqual(
+            LarecipeDocumentationPatterns.search_patterns_multi(["(", "no such text"]),
+            LarecipeDocumentationPatterns.search_patterns("(")
+        )
+    
+    def test_multi_without_queries(self):
+        """Test that a multi search without queries matches nothing"""
+        self.assertEqual(LarecipeDocumentationPatterns.search_patterns_multi([]), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Tests for the Pest testing pattern lookups
+"""
+import unittest
+from collections.abc import Mapping
+from src.knowledge_base.testing.pest_patterns import (
+    LaravelPestPatterns,
+    get_pattern_by_path,
+    get_patterns,
+    render_pattern,
+    search_patterns
+)
+
+def reference_search(query):
+    """Walk the full pattern tree the way search_patterns did before it was indexed"""
+    results = []
+    
+    def search_recursive(current, path):
+        for key, value in current.items():
+            current_path = path + [key]
+            if isinstance(value, Mapping):
+                if "description" in value and query.lower() in value["description"].lower():
+                    results.append((current_path, value))
+                elif "pattern" in value and query.lower() in value["pattern"].lower():
+                    results.append((current_path, value))
+                else:
+                    search_recursive(value, current_path)
+    
+    search_recursive(get_patterns(), [])
+    return results
+
+class TestPestPatterns(unittest.TestCase):
+    """Test cases for the Pest pattern search and path lookups"""
+    
+    QUERIES = ["actingAs", "factory", "DATABASE", "test", "expect(", "no such pattern"]
+    
+    def test_search_matches_tree_walk(self):
+        """Test that the indexed search finds what a full tree walk finds, in order"""
+        for query in self.QUERIES:
+            with self.subTest(query=query):
+                results = [(result["path"], result["pattern"]) for result in search_patterns(query)]
+                self.assertEqual(results, reference_search(query))
+    
+    def test_search_paths_resolve(self):
+        """Test that every search result path resolves to the same pattern"""
+        for query in self.QUERIES:
+            for result in search_patterns(query):
+                with self.subTest(query=query, path=result["path"]):
+                    self.assertEqual(get_pattern_by_path(result["path"]), result["pattern"])
+    
+    def test_get_pattern_by_path(self):
+        """Test path lookups for the root, categories and unknown paths"""
+        patterns = get_patterns()
+        self.assertEqual(get_pattern_by_path([]), patterns)
+        for category in patterns:
+            self.assertEqual(get_pattern_by_path([category]), patterns[category])
+        self.assertEqual(get_pattern_by_path(["no_such_category"]), {})
+        self.assertEqual(get_pattern_by_path(["feature_tests", "no_such_pattern"]), {})
+    
+    def test_class_aliases(self):
+        """Test that the LaravelPestPatterns methods match the module functions"""
+        self.assertEqual(LaravelPestPatterns.search_patterns("factory"), search_patterns("factory"))
+        path = search_patterns("factory")[0]["path"]
+        self.assertEqual(LaravelPestPatterns.get_pattern_by_path(path), get_pattern_by_path(path))
+
+class TestRenderPattern(unittest.TestCase):
+    """Test cases for render_pattern"""
+    
+    PATH = ["feature_tests", "http_tests", "basic_controller_test"]
+    
+    def test_substitution(self):
+        """Test that placeholders are replaced by the given values"""
+        rendered = render_pattern(self.PATH, route="/dashboard", view="dashboard")
+        self.assertIn("->get('/dashboard');", rendered)
+        self.assertIn("->assertViewIs('dashboard');", rendered)
+        self.assertNotIn("{route}", rendered)
+        self.assertNotIn("{view}", rendered)
+    
+    def test_repeated_placeholder(self):
+        """Test that every occurrence of a placeholder is replaced"""
+        path = ["feature_tests", "http_tests", "authentication_test"]
+        self.assertEqual(get_pattern_by_path(path)["pattern"].count("{route}"), 2)
+        rendered = render_pattern(path, route="/profile")
+        self.assertEqual(rendered.count("/profile"), 2)
+        self.assertNotIn("{route}", rendered)
+    
+    def test_missing_value_keeps_placeholder(self):
+        """Test that placeholders without a value are left as written"""
+        rendered = render_pattern(self.PATH, route="/dashboard")
+        self.assertIn("->assertViewIs('{view}');", rendered)
+        self.assertEqual(render_pattern(self.PATH), get_pattern_by_path(self.PATH)["pattern"])
+    
+    def test_php_braces_are_not_placeholders(self):
+        """Test that PHP closure braces are kept and cannot be substituted"""
+        pattern = get_pattern_by_path(self.PATH)["pattern"]
+        rendered = render_pattern(self.PATH, route="/dashboard", view="dashboard")
+        self.assertIn("function () {\n", rendered)
+        self.assertTrue(rendered.endswith("});"))
+        self.assertEqual(rendered.count("{"), pattern.count("{") - 2)
+        self.assertEqual(rendered.count("}"), pattern.count("}") - 2)
+    
+    def test_unknown_paths_raise(self):
+        """Test that paths without a pattern raise KeyError"""
+        for path in ([], ["feature_tests"], ["feature_tests", "http_tests"], ["no_such_category"],
+                     ["feature_tests", "http_tests", "no_such_pattern"]):
+            with self.subTest(path=path):
+                with self.assertRaises(KeyError):
+                    render_pattern(path)
+
+if __name__ == "__main__":
+    unittest.main()
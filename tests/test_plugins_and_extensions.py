@@ -0,0 +1,79 @@
+"""
+Tests for the FilamentPHP plugin search
+"""
+import json
+import unittest
+from src.knowledge_base.filament.plugins_and_extensions import search_filament_plugins
+
+class TestPluginSearch(unittest.TestCase):
+    """Test cases for search_filament_plugins"""
+    
+    def test_ranking(self):
+        """Test that recommendations are the best matches, highest score first"""
+        result = search_filament_plugins("media upload")
+        recommendations = result["recommendations"]
+        names = [plugin["name"] for plugin in recommendations]
+        scores = [plugin["score"] for plugin in recommendations]
+        
+        self.assertLessEqual(len(recommendations), 3)
+        self.assertEqual(names[0], "filament/spatie-media-library-plugin")
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(result["search_metadata"]["keywords_used"], ["media", "upload"])
+    
+    def test_ranking_prefers_feature_matches(self):
+        """Test that matching more requested features outranks popularity"""
+        result = search_filament_plugins("export data to excel csv")
+        recommendations = result["recommendations"]
+        names = [plugin["name"] for plugin in recommendations]
+        scores = [plugin["score"] for plugin in recommendations]
+        
+        # filament/widgets is the most popular plugin but only matches "data"
+        self.assertEqual(names[0], "pxlrbt/filament-excel")
+        self.assertIn("filament/widgets", names[1:])
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        
+        # Between equal matches the more popular and recent plugin wins
+        result = search_filament_plugins("data")
+        self.assertEqual(result["recommendations"][0]["name"], "filament/widgets")
+    
+    def test_composer_package_name(self):
+        """Test that the composer command and author come from the Packagist name"""
+        plugin = search_filament_plugins("media upload")["recommendations"][0]
+        self.assertEqual(
+            plugin["code_example"],
+            "composer require filament/spatie-laravel-media-library-plugin"
+        )
+        self.assertEqual(plugin["author"], "filament")
+    
+    def test_no_match_fallback(self):
+        """Test that an unmatched search returns no placeholder plugins"""
+        result = search_filament_plugins("zzqxv")
+        self.assertEqual(result["recommendations"], [])
+        self.assertIn("description", result["custom_implementation"])
+    
+    def test_result_is_plain_data(self):
+        """Test that the result is made of plain dicts and lists"""
+        result = search_filament_plugins("media upload", {"filament": "3.x"})
+        self.assertEqual(json.loads(json.dumps(result)), result)
+        self.assertIsInstance(result["recommendations"][0], dict)
+        self.assertIsInstance(result["recommendations"][0]["features"], list)
+        
+        # Callers own the payload, so changing it must not leak into later searches
+        result["recommendations"][0]["features"].append("changed")
+        again = search_filament_plugins("media upload", {"filament": "3.x"})
+        self.assertNotIn("changed", again["recommendations"][0]["features"])
+    
+    def test_version_filter(self):
+        """Test that version constraints are compared by major version"""
+        expected = search_filament_plugins("media upload", {"filament": "3.x"})["recommendations"]
+        for constraint in ("3", "^3.0", "3.1"):
+            with self.subTest(constraint=constraint):
+                result = search_filament_plugins("media upload", {"filament": constraint})
+                self.assertEqual(result["recommendations"], expected)
+        
+        result = search_filament_plugins("media upload", {"filament": "2.x"})
+        self.assertEqual(result["recommendations"], [])
+        self.assertEqual(result["search_metadata"]["filters_applied"], {"filament_version": "2.x"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Tests for the FilamentPHP table builder lookups
+"""
+import unittest
+from src.knowledge_base.filament import table_builder
+from src.knowledge_base.filament.table_builder import (
+    get_action,
+    get_column,
+    get_feature,
+    get_filter,
+    get_table_builder_knowledge
+)
+
+class TestComponentLookups(unittest.TestCase):
+    """Test cases for get_column, get_filter and get_action"""
+    
+    def test_lookups_match_sections(self):
+        """Test that every component is found under the category that lists it"""
+        lookups = [
+            (get_column, table_builder.TABLE_COLUMNS),
+            (get_filter, table_builder.TABLE_FILTERS),
+            (get_action, table_builder.TABLE_ACTIONS)
+        ]
+        for lookup, section in lookups:
+            for category, components in section.items():
+                for name, entry in components.items():
+                    with self.subTest(name=name):
+                        found_category, found_entry = lookup(name)
+                        self.assertEqual(found_category, category)
+                        self.assertIs(found_entry, entry)
+    
+    def test_known_components(self):
+        """Test lookups of well known components"""
+        self.assertEqual(get_column("TextColumn")[0], "Text Columns")
+        self.assertEqual(get_filter("SelectFilter")[0], "Basic Filters")
+        self.assertEqual(get_action("DeleteBulkAction")[0], "Bulk Actions")
+    
+    def test_unknown_components(self):
+        """Test that unknown names, categories and names from another section return None"""
+        self.assertIsNone(get_column("NoSuchColumn"))
+        self.assertIsNone(get_column("Text Columns"))
+        self.assertIsNone(get_column("SelectFilter"))
+        self.assertIsNone(get_filter("TextColumn"))
+        self.assertIsNone(get_action("textcolumn"))
+
+class TestGetFeature(unittest.TestCase):
+    """Test cases for get_feature"""
+    
+    def test_matches_knowledge_base(self):
+        """Test that get_feature agrees with nested knowledge base lookups"""
+        knowledge = get_table_builder_knowledge()
+        for section, entries in knowledge.items():
+            if isinstance(entries, str):
+                continue
+            for name, entry in entries.items():
+                with self.subTest(section=section, name=name):
+                    self.assertIs(get_feature(section, name), entry)
+                    # A repeated lookup is served from the cache
+                    self.assertIs(get_feature(section, name), entry)
+    
+    def test_known_features(self):
+        """Test lookups of a category and of an advanced feature"""
+        self.assertIs(get_feature("columns", "Text Columns"), table_builder.TABLE_COLUMNS["Text Columns"])
+        self.assertIs(
+            get_feature("advanced_features", "Record URLs"),
+            table_builder.ADVANCED_TABLE_FEATURES["Record URLs"]
+        )
+    
+    def test_unknown_features_raise(self):
+        """Test that unknown sections and names raise KeyError"""
+        cases = [
+            ("no_such_section", "Text Columns"),
+            ("columns", "No Such Category"),
+            ("columns", "TextColumn"),
+            ("overview", "Text Columns"),
+            ("filters", "Text Columns")
+        ]
+        for section, name in cases:
+            with self.subTest(section=section, name=name):
+                with self.assertRaises(KeyError):
+                    get_feature(section, name)
+        
+        # A failed lookup is not cached as missing once the section is indexed
+        self.assertIs(get_feature("filters", "Basic Filters"), table_builder.TABLE_FILTERS["Basic Filters"])
+
+if __name__ == "__main__":
+    unittest.main()
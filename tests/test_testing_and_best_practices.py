@@ -0,0 +1,84 @@
+"""
+Tests for the FilamentPHP testing and best practices search
+"""
+import re
+import unittest
+from src.knowledge_base.filament import testing_and_best_practices
+from src.knowledge_base.filament.testing_and_best_practices import search_testing_and_best_practices
+
+SECTIONS = [
+    "PESTPHP_INTEGRATION",
+    "TESTING_RESOURCES",
+    "TESTING_CUSTOM_COMPONENTS",
+    "AUTHENTICATION_TESTING",
+    "PERFORMANCE_BEST_PRACTICES",
+    "DEPLOYMENT_BEST_PRACTICES",
+    "SECURITY_BEST_PRACTICES"
+]
+
+def words(text):
+    """Return the searchable words of a text, as the search index splits them"""
+    return {word.lower() for word in re.findall(r"[A-Za-z_]{4,}", text)}
+
+def reference_scores(query):
+    """Count the query words found at each location by scanning every section"""
+    texts = {}
+    for section_name in SECTIONS:
+        for key, entry in getattr(testing_and_best_practices, section_name).items():
+            if isinstance(entry, str):
+                texts.setdefault((section_name, key, None), []).append(entry)
+                continue
+            location = (section_name, key, None)
+            texts.setdefault(location, []).append(entry.description)
+            texts[location].extend(entry.best_practices)
+            for example_index, example in enumerate(entry.examples):
+                texts[(section_name, key, example_index)] = [example]
+    
+    scores = {}
+    for location, location_texts in texts.items():
+        found = words(query) & set().union(*map(words, location_texts))
+        if found:
+            scores[location] = len(found)
+    return scores
+
+class TestSearchTestingAndBestPractices(unittest.TestCase):
+    """Test cases for search_testing_and_best_practices"""
+    
+    QUERIES = ["how do I test bulk delete", "table filter sorting", "Deploy QUEUE workers", "zzzz"]
+    
+    def test_matches_full_scan(self):
+        """Test that the index finds the same locations as scanning every entry"""
+        for query in self.QUERIES:
+            with self.subTest(query=query):
+                results = search_testing_and_best_practices(query)
+                self.assertEqual(len(results), len(set(results)))
+                self.assertEqual(set(results), set(reference_scores(query)))
+    
+    def test_best_match_first(self):
+        """Test that locations matching more query words come first"""
+        for query in self.QUERIES:
+            with self.subTest(query=query):
+                scores = reference_scores(query)
+                ranked = [scores[location] for location in search_testing_and_best_practices(query)]
+                self.assertEqual(ranked, sorted(ranked, reverse=True))
+        
+        results = search_testing_and_best_practices("how do I test bulk delete")
+        self.assertEqual(results[0], ("TESTING_RESOURCES", "delete_actions", 0))
+    
+    def test_short_words_are_ignored(self):
+        """Test that words shorter than four letters and letter case do not matter"""
+        self.assertEqual(search_testing_and_best_practices("how do I"), [])
+        self.assertEqual(
+            search_testing_and_best_practices("DEPLOY queue"),
+            search_testing_and_best_practices("deploy QUEUE")
+        )
+    
+    def test_locations_resolve(self):
+        """Test that every returned location points at an existing entry or example"""
+        for section_name, key, example_index in search_testing_and_best_practices("table filter sorting"):
+            entry = getattr(testing_and_best_practices, section_name)[key]
+            if example_index is not None:
+                self.assertLess(example_index, len(entry.examples))
+
+if __name__ == "__main__":
+    unittest.main()